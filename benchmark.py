@@ -0,0 +1,343 @@
+"""
+Benchmark: ukur waktu builder material, UV dan scene dari script slide-0X
+Setiap case dijalankan pada beberapa skala (jumlah pemanggilan / objek);
+waktu, selisih RSS dan jumlah datablock disimpan ke JSON bersama commit git,
+supaya hasil antar commit bisa dibandingkan.
+
+rss_delta_mb = RSS setelah case - RSS sebelum case (setelah setup), jadi
+memori yang ditambahkan case itu sendiri. process_peak_rss_mb adalah
+high-water mark seluruh proses (ru_maxrss) sejak Blender start: nilainya
+tidak pernah turun, sehingga case berikutnya mewarisi puncak case sebelumnya.
+
+Contoh:
+    blender -b --factory-startup --python benchmark.py -- --out bench.json
+    blender -b --factory-startup --python benchmark.py -- --scales 1,100 --cases slide05
+    python benchmark.py --compare bench_lama.json bench_baru.json
+
+Builder material dipanggil lewat __wrapped__ (tanpa material_cache),
+jadi yang diukur adalah pembuatan material, bukan cache hit.
+"""
+
+import argparse
+import contextlib
+import gc
+import importlib.util
+import json
+import os
+import platform
+import subprocess
+import sys
+import time
+
+try:
+    import bpy
+except ImportError:
+    bpy = None
+
+try:
+    import resource
+except ImportError:
+    resource = None
+
+try:
+    import psutil
+except ImportError:
+    psutil = None
+
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+if SCRIPT_DIR not in sys.path:
+    sys.path.append(SCRIPT_DIR)
+
+# Skala default: 1, 100 dan 10k pemanggilan / objek
+DEFAULT_SCALES = (1, 100, 10000)
+
+# Koleksi bpy.data yang dihitung setelah setiap case
+DATABLOCK_COLLECTIONS = ('objects', 'meshes', 'materials', 'node_groups', 'images')
+
+# Selisih waktu (relatif) yang dianggap regresi saat compare
+REGRESSION_THRESHOLD = 0.10
+
+BENCHMARK_VERSION = 2
+
+# Versi hasil yang masih bisa dibandingkan (v1: peak_rss_mb, tanpa rss_delta_mb)
+SUPPORTED_VERSIONS = (1, 2)
+
+# Bagian benchmark (berjalan di dalam Blender)
+
+_SLIDES = {}
+
+def load_slide(filename):
+    """Import script slide-0X sebagai modul (tanpa menjalankan main)"""
+
+    module = _SLIDES.get(filename)
+    if module is None:
+        name = os.path.splitext(filename)[0].replace('-', '_')
+        spec = importlib.util.spec_from_file_location(name, os.path.join(SCRIPT_DIR, filename))
+        module = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(module)
+        _SLIDES[filename] = module
+    return module
+
+def _uncached(builder):
+    """Builder asli di balik @material_cache.cached_material"""
+    return getattr(builder, '__wrapped__', builder)
+
+def _bench_textures():
+    """Tulis texture PNG kecil sekali untuk case PBR; Returns: textures_dict"""
+
+    folder = os.path.join(bpy.app.tempdir or SCRIPT_DIR, "bench_textures")
+    os.makedirs(folder, exist_ok=True)
+    textures = {}
+    for channel in ('base_color', 'roughness', 'normal'):
+        path = os.path.join(folder, f"bench_{channel}.png")
+        if not os.path.exists(path):
+            image = bpy.data.images.new(f"bench_{channel}", 64, 64)
+            image.filepath_raw = path
+            image.file_format = 'PNG'
+            image.save()
+            bpy.data.images.remove(image)
+        textures[channel] = path
+    return textures
+
+def _uv_object(slide):
+    with _quiet():
+        return slide.create_demo_object()
+
+def _case_table():
+    """
+    Daftar case: (nama, setup() -> context, run(context, i), skala maksimum)
+
+    Case berbasis bpy.ops (UV) dan reset scene dibatasi skalanya karena
+    satu pemanggilan sudah dalam orde milidetik.
+    """
+
+    slide01 = load_slide('slide-01-material-demo.py')
+    slide02 = load_slide('slide-02-texture-demo.py')
+    slide03 = load_slide('slide-03-uv-mapping-demo.py')
+    slide04 = load_slide('slide-04-shader-demo.py')
+    slide05 = load_slide('slide-05-procedural-demo.py')
+    import mesh_primitives
+
+    gold = (1.0, 0.766, 0.336, 1.0)
+    return [
+        ('slide01.create_basic_material', None,
+         lambda ctx, i: slide01.create_basic_material(), None),
+        ('slide01.create_metal_material', None,
+         lambda ctx, i: _uncached(slide01.create_metal_material)(f"Bench_Gold_{i}", gold, 0.1), None),
+        ('slide02.create_pbr_material', _bench_textures,
+         lambda ctx, i: slide02.create_pbr_material(f"Bench_PBR_{i}", ctx), None),
+        ('slide04.create_glass_material', None,
+         lambda ctx, i: _uncached(slide04.create_glass_material)(f"Bench_Glass_{i}"), None),
+        ('slide05.create_stone_material', None,
+         lambda ctx, i: _uncached(slide05.create_stone_material)(f"Bench_Stone_{i}"), None),
+        ('slide05.create_rock_material', None,
+         lambda ctx, i: _uncached(slide05.create_rock_material)(f"Bench_Rock_{i}"), None),
+        ('mesh_primitives.create_primitive', None,
+         lambda ctx, i: mesh_primitives.create_primitive('cube', f"Bench_Cube_{i}", location=(i % 100, i // 100, 0)),
+         None),
+        ('slide03.smart_uv_project', lambda: _uv_object(slide03),
+         lambda ctx, i: slide03.smart_uv_project(ctx), 100),
+        ('slide03.pack_uv_islands', lambda: _uv_object(slide03),
+         lambda ctx, i: slide03.pack_uv_islands(ctx), 100),
+        ('slide01.create_demo_objects', None,
+         lambda ctx, i: slide01.create_demo_objects(), 100),
+        ('slide05.create_demo_objects', None,
+         lambda ctx, i: slide05.create_demo_objects(), 100),
+    ]
+
+@contextlib.contextmanager
+def _quiet():
+    """Buang output print builder (10k baris emoji memperlambat dan mengotori log)"""
+
+    with open(os.devnull, 'w') as devnull, contextlib.redirect_stdout(devnull):
+        yield
+
+def current_rss_mb():
+    """RSS proses saat ini (MB): psutil, fallback /proc/self/statm; None jika tidak didukung"""
+
+    if psutil is not None:
+        return psutil.Process().memory_info().rss / (1024 * 1024)
+    try:
+        with open('/proc/self/statm', 'r') as f:
+            pages = int(f.read().split()[1])
+    except (OSError, ValueError, IndexError):
+        return None
+    return pages * os.sysconf('SC_PAGE_SIZE') / (1024 * 1024)
+
+def process_peak_rss_mb():
+    """High-water mark RSS proses sejak start (MB), None jika tidak didukung OS"""
+
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux melaporkan KB, macOS byte
+    return peak / (1024 * 1024) if sys.platform == 'darwin' else peak / 1024
+
+def datablock_counts():
+    return {name: len(getattr(bpy.data, name)) for name in DATABLOCK_COLLECTIONS}
+
+def _reset():
+    import material_cache
+    import scene_reset
+
+    with _quiet():
+        scene_reset.reset_scene()
+        bpy.data.batch_remove(ids=[mat for mat in bpy.data.materials if mat.users == 0])
+    material_cache.REGISTRY.clear()
+
+def run_case(name, setup, run, scale):
+    """Jalankan satu case sebanyak scale kali; Returns: entry hasil"""
+
+    _reset()
+    context = setup() if setup else None
+    gc.collect()
+    rss_before = current_rss_mb()
+
+    with _quiet():
+        started = time.perf_counter()
+        for i in range(scale):
+            run(context, i)
+        seconds = time.perf_counter() - started
+    gc.collect()
+    rss_after = current_rss_mb()
+
+    return {
+        'case': name,
+        'scale': scale,
+        'seconds': seconds,
+        'per_call_ms': seconds * 1000.0 / scale,
+        'rss_delta_mb': None if rss_before is None or rss_after is None else rss_after - rss_before,
+        'process_peak_rss_mb': process_peak_rss_mb(),
+        'datablocks': datablock_counts(),
+    }
+
+def git_commit():
+    """(commit, dirty) dari repo script ini, atau (None, None) di luar git"""
+
+    try:
+        commit = subprocess.run(['git', 'rev-parse', 'HEAD'], cwd=SCRIPT_DIR,
+                                capture_output=True, text=True, check=True).stdout.strip()
+        status = subprocess.run(['git', 'status', '--porcelain', '--untracked-files=no'], cwd=SCRIPT_DIR,
+                                capture_output=True, text=True, check=True).stdout
+    except (OSError, subprocess.CalledProcessError):
+        return None, None
+    return commit, bool(status.strip())
+
+def run_benchmarks(scales=DEFAULT_SCALES, case_filter=None):
+    """Jalankan semua case (opsional difilter substring nama); Returns: dict hasil"""
+
+    commit, dirty = git_commit()
+    results = []
+    for name, setup, run, max_scale in _case_table():
+        if case_filter and not any(part in name for part in case_filter):
+            continue
+        for scale in scales:
+            if max_scale is not None and scale > max_scale:
+                continue
+            entry = run_case(name, setup, run, scale)
+            memory = "" if entry['rss_delta_mb'] is None else f", RSS {entry['rss_delta_mb']:+.1f} MB"
+            print(f"⏱️ {name:36s} x{scale:<6d} {entry['seconds']:9.3f}s "
+                  f"({entry['per_call_ms']:.3f} ms/panggil{memory})")
+            results.append(entry)
+    _reset()
+
+    return {
+        'benchmark_version': BENCHMARK_VERSION,
+        'commit': commit,
+        'dirty': dirty,
+        'blender': bpy.app.version_string,
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'timestamp': time.strftime('%Y-%m-%dT%H:%M:%S'),
+        'results': results,
+    }
+
+# Bagian compare (bisa dijalankan dengan Python biasa)
+
+def load_results(filepath):
+    with open(filepath, 'r', encoding='utf-8') as f:
+        data = json.load(f)
+    if data.get('benchmark_version') not in SUPPORTED_VERSIONS:
+        raise ValueError(f"Hasil benchmark '{filepath}' versi {data.get('benchmark_version')} tidak didukung")
+    return data
+
+def compare(old, new, threshold=REGRESSION_THRESHOLD):
+    """
+    Bandingkan dua hasil benchmark per (case, skala)
+
+    Returns: list dict {case, scale, old_seconds, new_seconds, ratio, status,
+                        old_rss_delta_mb, new_rss_delta_mb}
+             status: 'regression', 'improvement' atau 'same' (berdasarkan waktu)
+    """
+
+    old_results = {(entry['case'], entry['scale']): entry for entry in old['results']}
+    rows = []
+    for entry in new['results']:
+        before = old_results.get((entry['case'], entry['scale']))
+        if before is None or not before['seconds']:
+            continue
+        ratio = entry['seconds'] / before['seconds']
+        if ratio > 1.0 + threshold:
+            status = 'regression'
+        elif ratio < 1.0 - threshold:
+            status = 'improvement'
+        else:
+            status = 'same'
+        rows.append({'case': entry['case'], 'scale': entry['scale'], 'old_seconds': before['seconds'],
+                     'new_seconds': entry['seconds'], 'ratio': ratio, 'status': status,
+                     'old_rss_delta_mb': before.get('rss_delta_mb'),
+                     'new_rss_delta_mb': entry.get('rss_delta_mb')})
+    return rows
+
+def print_comparison(rows, old, new):
+    symbols = {'regression': '🔴', 'improvement': '🟢', 'same': '⚪'}
+    print(f"📊 {(old.get('commit') or '?')[:10]} → {(new.get('commit') or '?')[:10]}")
+    for row in rows:
+        memory = ""
+        if row['old_rss_delta_mb'] is not None and row['new_rss_delta_mb'] is not None:
+            memory = f"  RSS {row['old_rss_delta_mb']:+.1f} → {row['new_rss_delta_mb']:+.1f} MB"
+        print(f"{symbols[row['status']]} {row['case']:36s} x{row['scale']:<6d} "
+              f"{row['old_seconds']:9.3f}s → {row['new_seconds']:9.3f}s ({row['ratio']:.2f}x){memory}")
+    regressions = sum(1 for row in rows if row['status'] == 'regression')
+    print(f"{'❌' if regressions else '✅'} {regressions} regresi dari {len(rows)} pengukuran")
+
+def main(argv=None):
+    if argv is None:
+        # Di dalam Blender argumen script ada setelah '--'
+        argv = sys.argv[sys.argv.index('--') + 1:] if '--' in sys.argv else sys.argv[1:]
+
+    parser = argparse.ArgumentParser(description="Benchmark builder material, UV dan scene")
+    parser.add_argument('--out', default='benchmark.json', help="File JSON hasil benchmark")
+    parser.add_argument('--scales', default=",".join(str(scale) for scale in DEFAULT_SCALES),
+                        help="Skala dipisah koma, misal '1,100'")
+    parser.add_argument('--cases', default='', help="Filter nama case (substring, dipisah koma)")
+    parser.add_argument('--compare', nargs=2, metavar=('LAMA', 'BARU'), help="Bandingkan dua file hasil")
+    parser.add_argument('--threshold', type=float, default=REGRESSION_THRESHOLD,
+                        help="Selisih relatif yang dianggap regresi (default 0.10)")
+    args = parser.parse_args(argv)
+
+    if args.compare:
+        try:
+            old, new = (load_results(filepath) for filepath in args.compare)
+        except (OSError, ValueError) as e:
+            print(f"❌ {e}", file=sys.stderr)
+            return 2
+        rows = compare(old, new, args.threshold)
+        print_comparison(rows, old, new)
+        return 1 if any(row['status'] == 'regression' for row in rows) else 0
+
+    if bpy is None:
+        parser.error("benchmark harus dijalankan di Blender: blender -b --python benchmark.py -- ...")
+
+    scales = [int(scale) for scale in args.scales.split(',') if scale]
+    case_filter = [part for part in args.cases.split(',') if part]
+    data = run_benchmarks(scales, case_filter)
+
+    with open(args.out, 'w', encoding='utf-8') as f:
+        json.dump(data, f, indent=2)
+    print(f"📄 Hasil benchmark: {args.out} (commit {(data['commit'] or '?')[:10]}"
+          f"{', dirty' if data['dirty'] else ''})")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,270 @@
+"""
+Blend Diff: fingerprint setiap datablock .blend dan bandingkan dua versi
+Dibangun di atas blend_reader (tanpa bpy)
+
+Fingerprint ID = SHA-1 dari payload ID block + semua block DATA miliknya.
+Nilai pointer berbeda setiap kali file disimpan, jadi:
+- pointer ke ID lain diganti nama ID tujuan (ganti material = berubah)
+- pointer ke data lain di-nol-kan
+- field runtime (session_uid, user count, tag, dll) di-nol-kan
+
+ID yang tidak berubah tapi memakai ID yang berubah (objek -> mesh,
+material -> node group) dilaporkan sebagai 'affected'.
+
+Contoh:
+    python blend_diff.py task3.blend task4.blend
+    python blend_diff.py task4.blend --save task4.manifest.json
+    python blend_diff.py task4.blend --against task4.manifest.json --json
+"""
+
+import argparse
+import hashlib
+import json
+import struct
+import sys
+
+import blend_reader
+
+# Field per struct yang berubah tanpa perubahan isi (di-nol-kan)
+VOLATILE_FIELDS = {
+    'ID': {'next', 'prev', 'newid', 'orig_id', 'py_instance', 'tag', 'us', 'icon_id', 'recalc',
+           'recalc_up_to_undo_push', 'recalc_after_undo_push', 'session_uid', 'runtime'},
+}
+
+# Field dengan nama ini di-nol-kan di struct manapun
+VOLATILE_ANY = {'runtime'}
+
+# Struct yang dilewati beserta block raw sesudahnya: thumbnail preview dan
+# path asset sumber (relatif terhadap lokasi file, berubah saat file dipindah)
+SKIP_STRUCTS = {'PreviewImage', 'LibraryWeakReference'}
+
+# Koleksi yang ditampilkan secara default
+REPORT_COLLECTIONS = ('materials', 'meshes', 'node_groups', 'objects', 'images')
+
+MANIFEST_VERSION = 1
+
+class _Masker:
+    """Menyiapkan (sekali per struct) offset pointer dan range volatile"""
+
+    def __init__(self, blend):
+        self.blend = blend
+        self.sdna = blend.sdna
+        self.pointer_format = blend.endian + ('Q' if blend.pointer_size == 8 else 'I')
+        self._plans = {}
+        self._addresses = None
+
+    def struct_size(self, struct_index):
+        return self.sdna.type_sizes[self.sdna.structs[struct_index][0]]
+
+    def plan(self, struct_index):
+        """(offset pointer, range (offset, size) yang di-nol-kan) untuk satu elemen struct"""
+
+        plan = self._plans.get(struct_index)
+        if plan is not None:
+            return plan
+
+        pointers, zeros = [], []
+        volatile = VOLATILE_FIELDS.get(self.sdna.struct_name(struct_index), set()) | VOLATILE_ANY
+        for field in self.sdna.layout(struct_index).values():
+            if field.name in volatile:
+                zeros.append((field.offset, field.size))
+            elif field.is_pointer:
+                pointers.extend(range(field.offset, field.offset + field.size, self.blend.pointer_size))
+            elif field.type in self.sdna.struct_index:
+                sub_index = self.sdna.struct_index[field.type]
+                sub_size = self.struct_size(sub_index)
+                sub_pointers, sub_zeros = self.plan(sub_index)
+                for base in range(field.offset, field.offset + field.size, sub_size or field.size):
+                    pointers.extend(base + p for p in sub_pointers)
+                    zeros.extend((base + o, s) for o, s in sub_zeros)
+
+        plan = (pointers, zeros)
+        self._plans[struct_index] = plan
+        return plan
+
+    def _is_pointer_array(self, payload):
+        """Heuristik block raw: semua nilai = 0 atau alamat block yang ada"""
+
+        size = self.blend.pointer_size
+        if not payload or len(payload) % size:
+            return False
+        if self._addresses is None:
+            self._addresses = {block.old_address for block in self.blend.blocks}
+        values = struct.unpack(f"{self.blend.endian}{len(payload) // size}{self.pointer_format[-1]}", payload)
+        return any(values) and all(value == 0 or value in self._addresses for value in values)
+
+    def mask(self, block, refs):
+        """Payload block dengan pointer/volatile di-nol-kan; nama ID tujuan ditambahkan ke refs"""
+
+        blend = self.blend
+        payload = bytearray(blend.data[block.offset:block.offset + block.size])
+        element = self.struct_size(block.sdna_index)
+
+        if element and element * block.count == block.size:
+            pointers, zeros = self.plan(block.sdna_index)
+            if not pointers and not zeros:
+                return payload
+            offsets = [base + p for base in range(0, block.size, element) for p in pointers]
+            for base in range(0, block.size, element):
+                for offset, size in zeros:
+                    payload[base + offset:base + offset + size] = bytes(size)
+        elif self._is_pointer_array(payload):
+            offsets = range(0, block.size, blend.pointer_size)
+        else:
+            return payload
+
+        for offset in offsets:
+            address = struct.unpack_from(self.pointer_format, payload, offset)[0]
+            if not address:
+                continue
+            target = blend.block_at(address)
+            if target is not None and blend.is_id(target):
+                refs.add(f"{target.code}:{blend.id_name(target)}")
+            struct.pack_into(self.pointer_format, payload, offset, 0)
+        return payload
+
+def fingerprint(filepath):
+    """
+    Fingerprint semua ID di file .blend
+
+    Returns: manifest dict {'file', 'version', 'ids': {'KODE:nama': {...}}}
+    """
+
+    ids = {}
+    with blend_reader.BlendFile(filepath) as blend:
+        masker = _Masker(blend)
+        for id_block, owned in blend.id_groups():
+            key = f"{id_block.code}:{blend.id_name(id_block)}"
+            digest = hashlib.sha1()
+            refs = set()
+            skipping = False
+            for block in [id_block] + owned:
+                name = blend.struct_name(block)
+                if name in SKIP_STRUCTS:
+                    skipping = True
+                    continue
+                if skipping and masker.struct_size(block.sdna_index) == 0:
+                    continue
+                skipping = False
+
+                digest.update(f"{block.code}|{name}|{block.count}|".encode('latin-1'))
+                digest.update(masker.mask(block, refs))
+
+            refs.discard(key)
+            digest.update("|".join(sorted(refs)).encode('utf-8'))
+            ids[key] = {
+                'collection': blend_reader.ID_CODES.get(id_block.code, id_block.code),
+                'hash': digest.hexdigest(),
+                'refs': sorted(refs),
+                'bytes': id_block.size + sum(block.size for block in owned),
+            }
+        version = blend.version
+
+    return {'manifest_version': MANIFEST_VERSION, 'file': filepath, 'version': version, 'ids': ids}
+
+def load_manifest(filepath):
+    with open(filepath, 'r', encoding='utf-8') as f:
+        manifest = json.load(f)
+    if manifest.get('manifest_version') != MANIFEST_VERSION:
+        raise ValueError(f"Manifest '{filepath}' versi {manifest.get('manifest_version')} tidak didukung")
+    return manifest
+
+def save_manifest(manifest, filepath):
+    with open(filepath, 'w', encoding='utf-8') as f:
+        json.dump(manifest, f, indent=1, sort_keys=True)
+
+def diff(old, new):
+    """
+    Membandingkan dua manifest
+
+    Returns: dict {'added', 'removed', 'changed', 'affected'}, masing-masing
+             list key 'KODE:nama' yang terurut
+    """
+
+    old_ids, new_ids = old['ids'], new['ids']
+    added = sorted(set(new_ids) - set(old_ids))
+    removed = sorted(set(old_ids) - set(new_ids))
+    changed = sorted(key for key in set(old_ids) & set(new_ids) if old_ids[key]['hash'] != new_ids[key]['hash'])
+
+    # Propagasi ke ID yang memakai ID yang berubah (transitif)
+    dependents = {}
+    for key, entry in new_ids.items():
+        for ref in entry['refs']:
+            dependents.setdefault(ref, set()).add(key)
+
+    dirty = set(added) | set(removed) | set(changed)
+    affected = set()
+    pending = list(dirty)
+    while pending:
+        for user in dependents.get(pending.pop(), ()):
+            if user not in dirty and user not in affected:
+                affected.add(user)
+                pending.append(user)
+
+    return {'added': added, 'removed': removed, 'changed': changed, 'affected': sorted(affected)}
+
+def filter_result(result, manifests, collections):
+    """Hanya simpan key dari koleksi tertentu"""
+
+    def collection(key):
+        for manifest in manifests:
+            if key in manifest['ids']:
+                return manifest['ids'][key]['collection']
+        return None
+
+    return {status: [key for key in keys if collection(key) in collections] for status, keys in result.items()}
+
+def print_diff(result, manifests):
+    symbols = {'added': '➕', 'removed': '➖', 'changed': '✏️', 'affected': '🔗'}
+    total = sum(len(keys) for keys in result.values())
+    if not total:
+        print("✅ Tidak ada perubahan")
+        return
+
+    for status, keys in result.items():
+        for key in keys:
+            entry = next(manifest['ids'][key] for manifest in reversed(manifests) if key in manifest['ids'])
+            print(f"{symbols[status]} {status:8s} {entry['collection']:12s} {key.split(':', 1)[1]}")
+    print(f"📊 {len(result['changed'])} berubah, {len(result['added'])} baru, "
+          f"{len(result['removed'])} dihapus, {len(result['affected'])} terdampak")
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Fingerprint dan diff datablock file .blend tanpa Blender")
+    parser.add_argument('files', nargs='+', help="file baru, atau file lama dan file baru")
+    parser.add_argument('--against', help="Bandingkan dengan manifest JSON yang disimpan sebelumnya")
+    parser.add_argument('--save', help="Simpan manifest file (terakhir) ke JSON")
+    parser.add_argument('--all', action='store_true', help="Tampilkan semua koleksi, bukan hanya asset utama")
+    parser.add_argument('--json', action='store_true', help="Output JSON")
+    args = parser.parse_args(argv)
+
+    if len(args.files) > 2:
+        parser.error("maksimal dua file")
+
+    try:
+        manifests = [fingerprint(filepath) for filepath in args.files]
+        if args.against:
+            manifests.insert(0, load_manifest(args.against))
+    except (OSError, ValueError) as e:
+        print(f"❌ {e}", file=sys.stderr)
+        return 2
+
+    if args.save:
+        save_manifest(manifests[-1], args.save)
+        print(f"💾 Manifest disimpan: {args.save} ({len(manifests[-1]['ids'])} ID)")
+
+    if len(manifests) < 2:
+        return 0
+
+    result = diff(manifests[-2], manifests[-1])
+    if not args.all:
+        result = filter_result(result, manifests[-2:], REPORT_COLLECTIONS)
+
+    if args.json:
+        json.dump(result, sys.stdout, indent=2)
+        print()
+    else:
+        print_diff(result, manifests[-2:])
+    return 1 if any(result.values()) else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,404 @@
+"""
+Blend Reader: membaca metadata file .blend tanpa Blender (Python murni)
+File di-mmap, lalu header, BHead dan SDNA di-parse langsung
+
+Yang didukung: header 12 byte 'BLENDER' (pointer 4/8 byte, little/big
+endian), file tidak terkompresi atau gzip. File zstd (opsi "Compress"
+di Blender 3.0+) harus disimpan ulang tanpa kompresi.
+
+Contoh:
+    python blend_reader.py task2.blend
+    python blend_reader.py task2.blend --list
+    python blend_reader.py *.blend --json
+
+    blend = blend_reader.BlendFile('task2.blend')
+    for block in blend.ids('ME'):
+        print(blend.id_name(block), blend.get(block, 'verts_num', 'totvert'))
+"""
+
+import argparse
+import gzip
+import json
+import mmap
+import os
+import re
+import struct
+import sys
+import time
+from collections import namedtuple
+
+# Kode ID block -> nama koleksi bpy.data
+ID_CODES = {
+    'OB': 'objects', 'ME': 'meshes', 'MA': 'materials', 'IM': 'images', 'NT': 'node_groups',
+    'TE': 'textures', 'TX': 'textures', 'SC': 'scenes', 'CA': 'cameras', 'LA': 'lights',
+    'WO': 'worlds', 'GR': 'collections', 'AC': 'actions', 'CU': 'curves', 'CV': 'hair_curves',
+    'PT': 'pointclouds', 'VO': 'volumes', 'LT': 'lattices', 'MB': 'metaballs', 'AR': 'armatures',
+    'BR': 'brushes', 'PA': 'palettes', 'LS': 'linestyles', 'WS': 'workspaces', 'SN': 'screens',
+    'SR': 'screens', 'WM': 'window_managers', 'LI': 'libraries', 'GD': 'grease_pencils',
+    'GP': 'grease_pencils', 'SO': 'sounds', 'SP': 'speakers', 'LP': 'lightprobes', 'MC': 'movieclips',
+    'MS': 'masks', 'VF': 'fonts', 'CF': 'cache_files', 'PC': 'paint_curves',
+}
+
+# Koleksi yang ditampilkan di ringkasan default
+SUMMARY_COLLECTIONS = ('objects', 'meshes', 'materials', 'images', 'node_groups')
+
+# Tipe dasar SDNA -> format struct
+PRIMITIVES = {
+    'char': 'b', 'uchar': 'B', 'short': 'h', 'ushort': 'H', 'int': 'i', 'uint': 'I',
+    'float': 'f', 'double': 'd', 'int8_t': 'b', 'uint8_t': 'B', 'int16_t': 'h', 'uint16_t': 'H',
+    'int32_t': 'i', 'uint32_t': 'I', 'int64_t': 'q', 'uint64_t': 'Q', 'long': 'q', 'ulong': 'Q',
+}
+
+BHead = namedtuple('BHead', 'code size old_address sdna_index count offset')
+Field = namedtuple('Field', 'name type offset size is_pointer dims')
+
+_ARRAY = re.compile(r'\[(\d+)\]')
+
+class BlendFileError(ValueError):
+    """File bukan .blend yang bisa dibaca"""
+
+class SDNA:
+    """Struct DNA: nama member, tipe, ukuran tipe, dan layout struct"""
+
+    def __init__(self, data, endian, pointer_size):
+        self.pointer_size = pointer_size
+        offset = 0
+
+        def expect(tag):
+            nonlocal offset
+            offset = (offset + 3) & ~3
+            if data[offset:offset + 4] != tag:
+                raise BlendFileError(f"SDNA rusak: {tag!r} tidak ditemukan")
+            offset += 4
+
+        def read_strings():
+            nonlocal offset
+            count = struct.unpack_from(endian + 'i', data, offset)[0]
+            offset += 4
+            strings = []
+            for _ in range(count):
+                end = data.index(b'\0', offset)
+                strings.append(data[offset:end].decode('latin-1'))
+                offset = end + 1
+            return strings
+
+        expect(b'SDNA')
+        expect(b'NAME')
+        self.names = read_strings()
+        expect(b'TYPE')
+        self.types = read_strings()
+        expect(b'TLEN')
+        self.type_sizes = struct.unpack_from(f"{endian}{len(self.types)}h", data, offset)
+        offset += 2 * len(self.types)
+        expect(b'STRC')
+
+        count = struct.unpack_from(endian + 'i', data, offset)[0]
+        offset += 4
+        self.structs = []
+        for _ in range(count):
+            type_index, field_count = struct.unpack_from(endian + 'hh', data, offset)
+            offset += 4
+            members = struct.unpack_from(f"{endian}{2 * field_count}h", data, offset)
+            offset += 4 * field_count
+            self.structs.append((type_index, list(zip(members[0::2], members[1::2]))))
+
+        self.struct_index = {self.types[type_index]: i for i, (type_index, _) in enumerate(self.structs)}
+        self._layouts = {}
+
+    def layout(self, struct_index):
+        """Dict {nama member: Field} dengan offset byte (di-cache)"""
+
+        layout = self._layouts.get(struct_index)
+        if layout is not None:
+            return layout
+
+        layout = {}
+        offset = 0
+        for type_index, name_index in self.structs[struct_index][1]:
+            raw = self.names[name_index]
+            dims = tuple(int(n) for n in _ARRAY.findall(raw))
+            items = 1
+            for n in dims:
+                items *= n
+            is_pointer = raw.startswith('*') or raw.startswith('(*')
+            size = (self.pointer_size if is_pointer else self.type_sizes[type_index]) * items
+            name = re.sub(r'[\*\(\)]|\[\d+\]', '', raw)
+            layout[name] = Field(name, self.types[type_index], offset, size, is_pointer, dims)
+            offset += size
+
+        self._layouts[struct_index] = layout
+        return layout
+
+    def struct_name(self, struct_index):
+        return self.types[self.structs[struct_index][0]]
+
+class BlendFile:
+    """File .blend yang di-mmap; block dibaca tanpa menyalin data"""
+
+    def __init__(self, filepath):
+        self.filepath = filepath
+        self._file = open(filepath, 'rb')
+        magic = self._file.read(2)
+        self._file.seek(0)
+        if magic == b'\x1f\x8b':
+            self.data = gzip.decompress(self._file.read())
+        elif magic == b'\x28\xb5':
+            self._file.close()
+            raise BlendFileError(f"'{filepath}' terkompresi zstd, simpan ulang tanpa Compress")
+        else:
+            self.data = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+
+        header = bytes(self.data[:12])
+        if not header.startswith(b'BLENDER') or header[7:8] not in (b'_', b'-') or header[8:9] not in (b'v', b'V'):
+            self.close()
+            raise BlendFileError(f"'{filepath}' bukan file .blend yang didukung (header {header!r})")
+
+        self.pointer_size = 8 if header[7:8] == b'-' else 4
+        self.endian = '<' if header[8:9] == b'v' else '>'
+        self.version = int(header[9:12])
+        self._bhead = struct.Struct(self.endian + ('4siQii' if self.pointer_size == 8 else '4siIii'))
+
+        self.blocks = []
+        self.sdna = None
+        offset = 12
+        while offset + self._bhead.size <= len(self.data):
+            code, size, old, sdna_index, count = self._bhead.unpack_from(self.data, offset)
+            offset += self._bhead.size
+            block = BHead(code.rstrip(b'\0').decode('latin-1'), size, old, sdna_index, count, offset)
+            offset += size
+            if block.code == 'ENDB':
+                break
+            if block.code == 'DNA1':
+                self.sdna = SDNA(bytes(self.data[block.offset:block.offset + size]), self.endian, self.pointer_size)
+            self.blocks.append(block)
+
+        if self.sdna is None:
+            self.close()
+            raise BlendFileError(f"'{filepath}' tidak punya block DNA1")
+        self._by_address = None
+
+    def close(self):
+        if isinstance(self.data, mmap.mmap):
+            self.data.close()
+        self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    @staticmethod
+    def is_id(block):
+        """ID block memakai kode 2 huruf (OB, ME, MA, ...)"""
+        return len(block.code) == 2
+
+    def ids(self, code=None):
+        """Semua ID block, atau hanya dengan kode tertentu (misal 'ME')"""
+
+        return [block for block in self.blocks if self.is_id(block) and (code is None or block.code == code)]
+
+    def id_groups(self):
+        """
+        Generator (ID block, [block data milik ID])
+
+        Block DATA yang ditulis setelah ID block dianggap milik ID tersebut.
+        """
+
+        current = None
+        owned = []
+        for block in self.blocks:
+            if self.is_id(block):
+                if current is not None:
+                    yield current, owned
+                current, owned = block, []
+            elif current is not None and block.code == 'DATA':
+                owned.append(block)
+            elif current is not None:
+                yield current, owned
+                current, owned = None, []
+        if current is not None:
+            yield current, owned
+
+    def struct_name(self, block):
+        return self.sdna.struct_name(block.sdna_index)
+
+    def field(self, block, name):
+        """
+        Field SDNA pada struct block; None jika tidak ada
+        Member struct bersarang ditulis dengan titik, misal 'id.name'.
+        Returns: (offset dari awal block, Field)
+        """
+
+        struct_index = block.sdna_index
+        offset = 0
+        parts = name.split('.')
+        for i, part in enumerate(parts):
+            field = self.sdna.layout(struct_index).get(part)
+            if field is None:
+                return None
+            offset += field.offset
+            if i < len(parts) - 1:
+                struct_index = self.sdna.struct_index.get(field.type)
+                if struct_index is None or field.is_pointer:
+                    return None
+        return offset, field
+
+    def get(self, block, *names, default=None):
+        """
+        Membaca nilai member pertama yang ada dari names
+
+        char[] dikembalikan sebagai string, pointer sebagai alamat (int),
+        tipe dasar sebagai angka/tuple.
+        """
+
+        for name in names:
+            found = self.field(block, name)
+            if found is not None:
+                break
+        else:
+            return default
+
+        offset, field = found
+        start = block.offset + offset
+        if field.is_pointer:
+            fmt = 'Q' if self.pointer_size == 8 else 'I'
+            values = struct.unpack_from(f"{self.endian}{field.size // self.pointer_size}{fmt}", self.data, start)
+            return values[0] if len(values) == 1 else values
+        if field.type == 'char' and field.dims:
+            raw = bytes(self.data[start:start + field.size])
+            return raw.split(b'\0', 1)[0].decode('utf-8', 'replace')
+        fmt = PRIMITIVES.get(field.type)
+        if fmt is None:
+            return default
+        count = field.size // struct.calcsize(fmt)
+        values = struct.unpack_from(f"{self.endian}{count}{fmt}", self.data, start)
+        return values[0] if len(values) == 1 else values
+
+    def id_name(self, block):
+        """Nama ID tanpa prefix kode ('OBCube' -> 'Cube')"""
+
+        name = self.get(block, 'id.name', default='')
+        return name[2:]
+
+    def block_at(self, address):
+        """Block dengan old address tertentu (untuk mengikuti pointer)"""
+
+        if self._by_address is None:
+            self._by_address = {block.old_address: block for block in self.blocks}
+        return self._by_address.get(address)
+
+    def _details(self, block):
+        """Info tambahan per tipe ID"""
+
+        if block.code == 'ME':
+            return {
+                'vertices': self.get(block, 'verts_num', 'totvert'),
+                'edges': self.get(block, 'edges_num', 'totedge'),
+                'faces': self.get(block, 'faces_num', 'totpoly'),
+                'loops': self.get(block, 'corners_num', 'totloop'),
+            }
+        if block.code == 'OB':
+            data = self.block_at(self.get(block, 'data', default=0))
+            return {'data': self.id_name(data) if data is not None and self.is_id(data) else None}
+        if block.code == 'MA':
+            return {'use_nodes': bool(self.get(block, 'use_nodes', default=0))}
+        if block.code == 'IM':
+            return {'filepath': self.get(block, 'filepath', 'name', default='')}
+        return {}
+
+    def inventory(self):
+        """
+        Daftar ID per koleksi bpy.data
+
+        Returns: {koleksi: [{'name', 'bytes', 'blocks', ...detail}]}
+        """
+
+        result = {}
+        for block, owned in self.id_groups():
+            entry = {
+                'name': self.id_name(block),
+                'bytes': block.size + sum(data.size for data in owned),
+                'blocks': 1 + len(owned),
+            }
+            entry.update(self._details(block))
+            result.setdefault(ID_CODES.get(block.code, block.code), []).append(entry)
+        return result
+
+    def embedded_node_trees(self):
+        """Jumlah node tree yang tertanam di material/world/scene (bukan node group)"""
+
+        index = self.sdna.struct_index.get('bNodeTree')
+        return sum(1 for block in self.blocks if block.code == 'DATA' and block.sdna_index == index)
+
+    def summary(self, collections=SUMMARY_COLLECTIONS):
+        """Ringkasan: versi, ukuran, dan count/bytes per koleksi"""
+
+        inventory = self.inventory()
+        node_index = self.sdna.struct_index.get('bNode')
+        return {
+            'file': os.path.abspath(self.filepath),
+            'version': self.version,
+            'pointer_size': self.pointer_size,
+            'endian': 'little' if self.endian == '<' else 'big',
+            'bytes': len(self.data),
+            'blocks': len(self.blocks),
+            'collections': {
+                name: {
+                    'count': len(inventory.get(name, [])),
+                    'bytes': sum(entry['bytes'] for entry in inventory.get(name, [])),
+                }
+                for name in collections
+            },
+            'embedded_node_trees': self.embedded_node_trees(),
+            'nodes': sum(block.count for block in self.blocks if block.sdna_index == node_index and block.code == 'DATA'),
+        }
+
+def _print_summary(summary, inventory=None):
+    print(f"📄 {summary['file']} (Blender {summary['version'] // 100}.{summary['version'] % 100:02d}, "
+          f"{summary['bytes'] / 1024:.0f} KB, {summary['blocks']} block)")
+    for name, info in summary['collections'].items():
+        print(f"  - {name}: {info['count']} ({info['bytes'] / 1024:.1f} KB)")
+    print(f"  - node tree tertanam: {summary['embedded_node_trees']}, total node: {summary['nodes']}")
+
+    for name, entries in (inventory or {}).items():
+        print(f"  {name}:")
+        for entry in entries:
+            extra = ", ".join(f"{k}={v}" for k, v in entry.items() if k not in ('name', 'bytes', 'blocks'))
+            print(f"    • {entry['name']} ({entry['bytes']} B){' ' + extra if extra else ''}")
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Baca metadata file .blend tanpa Blender")
+    parser.add_argument('files', nargs='+', help="File .blend")
+    parser.add_argument('--list', action='store_true', help="Tampilkan setiap ID, bukan hanya ringkasan")
+    parser.add_argument('--json', action='store_true', help="Output JSON")
+    args = parser.parse_args(argv)
+
+    results = []
+    failed = 0
+    for filepath in args.files:
+        started = time.perf_counter()
+        try:
+            with BlendFile(filepath) as blend:
+                summary = blend.summary()
+                inventory = {name: entries for name, entries in blend.inventory().items()
+                             if name in SUMMARY_COLLECTIONS} if args.list else None
+        except (OSError, BlendFileError) as e:
+            print(f"❌ {filepath}: {e}", file=sys.stderr)
+            failed += 1
+            continue
+        summary['seconds'] = time.perf_counter() - started
+        if inventory is not None:
+            summary['inventory'] = inventory
+        results.append(summary)
+        if not args.json:
+            _print_summary(summary, inventory)
+            print(f"  ⏱️ {summary['seconds'] * 1000:.1f} ms")
+
+    if args.json:
+        json.dump(results, sys.stdout, indent=2)
+        print()
+    return 1 if failed else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,133 @@
+"""
+Blender Compat: perbedaan API Blender 3.x/4.x di satu tempat
+Versi dideteksi sekali saat import; builder tidak perlu hasattr / try-except
+per pemanggilan.
+
+Nama socket ditulis dengan nama Blender 4.x ('Transmission Weight',
+'Specular IOR Level', ...). Di Blender 3.x nama itu otomatis dipetakan ke
+nama lama lewat SOCKET_ALIASES. Tabel nama -> index dibangun sekali per tipe
+node lalu di-cache; socket yang tidak ada langsung raise KeyError.
+
+Contoh:
+    bsdf = mat.node_tree.nodes["Principled BSDF"]
+    blender_compat.input_socket(bsdf, 'Specular IOR Level').default_value = 0.5
+
+    blender_compat.new_group_socket(group, 'UV', 'INPUT', 'NodeSocketVector')
+    blender_compat.set_transparent_shadow(mat)
+"""
+
+import bpy
+
+# Versi Blender yang sedang berjalan, misal (4, 1, 0)
+VERSION = tuple(bpy.app.version)
+VERSION_STRING = ".".join(str(part) for part in VERSION)
+
+# Node group memakai tree.interface (4.0+) atau tree.inputs/outputs (3.x)
+HAS_INTERFACE = 'interface' in bpy.types.NodeTree.bl_rna.properties
+
+# Material.shadow_method dihapus di 4.2 (EEVEE Next)
+HAS_SHADOW_METHOD = 'shadow_method' in bpy.types.Material.bl_rna.properties
+
+# Nama socket yang berganti antar versi; satu tuple = satu socket logis
+SOCKET_ALIASES = {
+    'ShaderNodeBsdfPrincipled': {
+        'inputs': [
+            ('Specular IOR Level', 'Specular'),
+            ('Transmission Weight', 'Transmission'),
+            ('Subsurface Weight', 'Subsurface'),
+            ('Coat Weight', 'Clearcoat'),
+            ('Coat Roughness', 'Clearcoat Roughness'),
+            ('Coat Normal', 'Clearcoat Normal'),
+            ('Sheen Weight', 'Sheen'),
+            ('Emission Color', 'Emission'),
+        ],
+    },
+}
+
+# Node yang socket-nya berbeda per node group
+GROUP_IO_TYPES = {'NodeGroupInput', 'NodeGroupOutput'}
+
+# Cache index socket: {(bl_idname, node_tree): {'inputs': {...}, 'outputs': {...}}}
+SOCKET_TABLES = {}
+
+def socket_table(node):
+    """Membangun (sekali) tabel nama/identifier/alias socket -> index untuk tipe node"""
+
+    node_tree = node.node_tree.name if getattr(node, 'node_tree', None) else None
+    if node.bl_idname in GROUP_IO_TYPES:
+        # Socket Group Input/Output mengikuti interface node group pemiliknya
+        node_tree = ('group', node.id_data.name)
+    key = (node.bl_idname, node_tree)
+    table = SOCKET_TABLES.get(key)
+    if table is None:
+        table = {}
+        aliases = SOCKET_ALIASES.get(node.bl_idname, {})
+        for direction in ('inputs', 'outputs'):
+            sockets = getattr(node, direction)
+            index = {i: i for i in range(len(sockets))}
+            for i, socket in enumerate(sockets):
+                # Nama pertama yang menang, sama seperti inputs['Nama'] di Blender
+                index.setdefault(socket.name, i)
+                index.setdefault(socket.identifier, i)
+            for names in aliases.get(direction, ()):
+                found = next((index[name] for name in names if name in index), None)
+                if found is not None:
+                    for name in names:
+                        index.setdefault(name, found)
+            table[direction] = index
+        SOCKET_TABLES[key] = table
+    return table
+
+def socket_index(node, name, direction='inputs'):
+    """Index socket untuk nama (atau alias); raise KeyError jika tidak ada"""
+
+    index = socket_table(node)[direction].get(name)
+    if index is None:
+        raise KeyError(f"Node '{node.bl_idname}' tidak punya {direction[:-1]} '{name}' "
+                       f"di Blender {VERSION_STRING}")
+    return index
+
+def input_socket(node, name):
+    return node.inputs[socket_index(node, name, 'inputs')]
+
+def output_socket(node, name):
+    return node.outputs[socket_index(node, name, 'outputs')]
+
+def new_group_socket(group, name, in_out, socket_type):
+    """
+    Menambahkan socket input/output ke node group
+
+    Parameters:
+    - in_out: 'INPUT' atau 'OUTPUT'
+    - socket_type: misal 'NodeSocketFloat', 'NodeSocketVector'
+    """
+
+    if HAS_INTERFACE:
+        return group.interface.new_socket(name, in_out=in_out, socket_type=socket_type)
+    sockets = group.inputs if in_out == 'INPUT' else group.outputs
+    return sockets.new(socket_type, name)
+
+def set_transparent_shadow(mat):
+    """Shadow transparan untuk material blend (shadow_method atau use_transparent_shadow)"""
+
+    if HAS_SHADOW_METHOD:
+        mat.shadow_method = 'HASHED'
+    else:
+        mat.use_transparent_shadow = True
+
+def forget_node_tree(name):
+    """Buang cache socket yang terkait node group (dipanggil saat interface-nya dibangun ulang)"""
+
+    for key in [key for key in SOCKET_TABLES if key[1] in (name, ('group', name))]:
+        del SOCKET_TABLES[key]
+
+def group_socket_identifier(group, name, in_out='INPUT'):
+    """Identifier socket node group (key input di modifier Geometry Nodes)"""
+
+    if HAS_INTERFACE:
+        for item in group.interface.items_tree:
+            if item.item_type == 'SOCKET' and item.in_out == in_out and item.name == name:
+                return item.identifier
+        raise KeyError(f"Node group '{group.name}' tidak punya socket '{name}'")
+    sockets = group.inputs if in_out == 'INPUT' else group.outputs
+    return sockets[name].identifier
@@ -0,0 +1,262 @@
+"""
+Image Registry: dedup dan cache image texture untuk builder material
+Key = (path absolut, mtime, colorspace): file yang sama dengan colorspace
+yang sama selalu mengembalikan satu datablock image
+
+Contoh:
+    image_registry.prefetch(textures.values())     # baca file paralel di thread
+    image = image_registry.load_image('tex/wood_normal.png', 'Non-Color')
+
+Catatan thread: bpy tidak thread-safe, jadi thread worker hanya membaca
+file (isi file ke page cache OS). Datablock image tetap dibuat di
+main thread, tapi tidak lagi menunggu disk.
+"""
+
+import os
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+
+import bpy
+
+# Custom property image: key registry (path|mtime|colorspace)
+IMAGE_KEY_PROP = "image_registry_key"
+
+# Budget memori pixel yang sudah di-decode (byte)
+DEFAULT_BUDGET = 2 * 1024 ** 3
+
+# Ukuran blok baca saat prefetch
+READ_BLOCK = 1 << 20
+
+# File yang di-load Blender sebagai float buffer (colorspace default: scene linear)
+FLOAT_EXTENSIONS = {'.exr', '.hdr'}
+
+# Nama colorspace default per role, lintas versi Blender (yang pertama tersedia dipakai)
+DEFAULT_FLOAT_SPACES = ('Linear Rec.709', 'Linear')
+DEFAULT_BYTE_SPACES = ('sRGB',)
+
+def resolve_path(filepath):
+    """Path absolut dan nyata ('//' relatif terhadap .blend ikut di-resolve)"""
+
+    return os.path.realpath(bpy.path.abspath(filepath))
+
+def _is_alive(image):
+    """Cek apakah datablock masih ada (belum dihapus dari bpy.data)"""
+
+    try:
+        image.name
+    except ReferenceError:
+        return False
+    return True
+
+def _image_bytes(image):
+    """Perkiraan memori pixel image; 0 jika belum di-decode"""
+
+    if not image.has_data:
+        return 0
+    width, height = image.size
+    return width * height * image.channels * (4 if image.is_float else 1)
+
+def _available_colorspaces():
+    prop = bpy.types.ColorManagedInputColorspaceSettings.bl_rna.properties['name']
+    return {item.identifier for item in prop.enum_items}
+
+def default_colorspace(path):
+    """Colorspace yang dipilih Blender untuk file ini jika tidak di-set (sRGB atau linear)"""
+
+    candidates = DEFAULT_FLOAT_SPACES if os.path.splitext(path)[1].lower() in FLOAT_EXTENSIONS \
+        else DEFAULT_BYTE_SPACES
+    available = _available_colorspaces()
+    return next((name for name in candidates if name in available), candidates[0])
+
+def _read_file(path):
+    """Dijalankan di thread: baca seluruh file ke page cache OS (tanpa bpy)"""
+
+    with open(path, 'rb') as f:
+        while f.read(READ_BLOCK):
+            pass
+
+class ImageRegistry:
+    """Registry image: key -> datablock, LRU dengan budget memori"""
+
+    def __init__(self, budget=DEFAULT_BUDGET, workers=None):
+        self.budget = budget
+        self.workers = workers
+        self._entries = OrderedDict()
+        self._by_path = {}
+        # Colorspace nyata image yang di-load tanpa colorspace: {path: nama}
+        self._default_spaces = {}
+        self._scanned = False
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def _key(self, path, colorspace):
+        if not colorspace:
+            # None = default Blender, sama dengan nama yang dipakai _scan_existing
+            colorspace = self._default_spaces.get(path) or default_colorspace(path)
+        return (path, os.stat(path).st_mtime_ns, colorspace)
+
+    def _register(self, key, image):
+        image[IMAGE_KEY_PROP] = "|".join(str(part) for part in key)
+        self._entries[key] = image
+        self._entries.move_to_end(key)
+        self._by_path[(key[0], key[2])] = key
+
+    def _scan_existing(self):
+        """Adopsi image yang sudah ada di bpy.data (semantik check_existing)"""
+
+        for image in bpy.data.images:
+            if image.source != 'FILE' or not image.filepath:
+                continue
+            path = resolve_path(image.filepath)
+            if not os.path.exists(path):
+                continue
+            key = self._key(path, image.colorspace_settings.name)
+            if key not in self._entries:
+                self._register(key, image)
+        self._scanned = True
+
+    def prefetch(self, filepaths):
+        """
+        Baca file texture secara paralel sebelum datablock dibuat
+
+        Returns: list path yang tidak ditemukan
+        """
+
+        paths = sorted({resolve_path(filepath) for filepath in filepaths if filepath})
+        missing = []
+        with ThreadPoolExecutor(max_workers=self.workers) as pool:
+            for path, future in [(path, pool.submit(_read_file, path)) for path in paths]:
+                try:
+                    future.result()
+                except OSError:
+                    missing.append(path)
+        return missing
+
+    def load(self, filepath, colorspace=None):
+        """
+        Mengembalikan image untuk file + colorspace, load hanya jika belum ada
+
+        Returns: image, atau None (dengan peringatan) jika file tidak ditemukan
+        """
+
+        if not self._scanned:
+            self._scan_existing()
+
+        path = resolve_path(filepath)
+        if not os.path.isfile(path):
+            print(f"⚠️ Texture tidak ditemukan: {path}")
+            return None
+        key = self._key(path, colorspace)
+        image = self._entries.get(key)
+        if image is not None and _is_alive(image):
+            self.hits += 1
+            self._entries.move_to_end(key)
+            return image
+
+        self.misses += 1
+        self._entries.pop(key, None)
+
+        # File berubah di disk: reload datablock lama alih-alih membuat yang baru
+        old_key = self._by_path.get((path, key[2]))
+        old_image = self._entries.pop(old_key, None) if old_key else None
+        if old_image is not None and _is_alive(old_image):
+            old_image.reload()
+            image = old_image
+        else:
+            image = bpy.data.images.load(path, check_existing=False)
+            if colorspace:
+                image.colorspace_settings.name = colorspace
+            elif image.colorspace_settings.name != key[2]:
+                # Tebakan default salah (misal config OCIO lain): pakai nama nyata
+                self._default_spaces[path] = image.colorspace_settings.name
+                key = self._key(path, None)
+
+        self._register(key, image)
+        self.evict()
+        return image
+
+    def memory_usage(self):
+        """Total memori pixel image di registry (byte)"""
+
+        return sum(_image_bytes(image) for image in self._entries.values() if _is_alive(image))
+
+    def evict(self, budget=None):
+        """
+        Bebaskan image paling lama tidak dipakai sampai di bawah budget
+
+        Image tanpa user dihapus; image yang masih dipakai hanya dibuang
+        buffer pixel-nya (di-decode ulang saat dibutuhkan).
+        Returns: jumlah image yang di-evict
+        """
+
+        budget = self.budget if budget is None else budget
+        usage = self.memory_usage()
+        evicted = 0
+        for key, image in list(self._entries.items()):
+            if usage <= budget:
+                break
+            if not _is_alive(image):
+                del self._entries[key]
+                continue
+            size = _image_bytes(image)
+            if size == 0:
+                continue
+            if image.users == 0:
+                del self._entries[key]
+                bpy.data.images.remove(image)
+            else:
+                image.buffers_free()
+            usage -= size
+            evicted += 1
+
+        self.evictions += evicted
+        return evicted
+
+    def clear(self):
+        """Lupakan semua entry (datablock tidak dihapus) dan reset statistik"""
+
+        self._entries.clear()
+        self._by_path.clear()
+        self._default_spaces.clear()
+        self._scanned = False
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def stats(self):
+        """Statistik registry: hits, misses, entries, evictions, memory, hit_rate"""
+
+        total = self.hits + self.misses
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'entries': len(self._entries),
+            'evictions': self.evictions,
+            'memory': self.memory_usage(),
+            'hit_rate': self.hits / total if total else 0.0,
+        }
+
+# Registry default yang dipakai bersama oleh material_graph dan script demo
+REGISTRY = ImageRegistry()
+
+def load_image(filepath, colorspace=None, registry=None):
+    """Load image lewat registry default (None jika file tidak ditemukan)"""
+
+    return (registry or REGISTRY).load(filepath, colorspace)
+
+def prefetch(filepaths, registry=None):
+    """Prefetch file texture paralel lewat registry default"""
+
+    missing = (registry or REGISTRY).prefetch(filepaths)
+    for path in missing:
+        print(f"⚠️ Texture tidak ditemukan: {path}")
+    return missing
+
+def print_registry_stats(registry=None):
+    """Cetak statistik image registry"""
+
+    stats = (registry or REGISTRY).stats()
+    print(f"🖼️ Image registry: {stats['hits']} hit, {stats['misses']} miss, "
+          f"{stats['entries']} image, {stats['memory'] / 1024 ** 2:.1f} MB "
+          f"(hit rate {stats['hit_rate']:.0%})")
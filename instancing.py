@@ -0,0 +1,165 @@
+"""
+Instancing: objek berulang tanpa mesh datablock berulang
+Tiga mode, dari yang paling fleksibel ke yang paling ringan:
+- LINKED: linked duplicate, semua objek memakai satu mesh (shared_mesh);
+  material per objek tetap bisa lewat slot objek (material_assign)
+- COLLECTION: empty dengan instance_collection, sumbernya satu collection
+- POINTS: satu objek point cloud + modifier Geometry Nodes (Instance on
+  Points), untuk puluhan ribu salinan dengan satu objek di depsgraph
+
+Contoh:
+    cube = create_instance('cube', "Demo_Cube", size=2, location=(-4, 0, 0))
+    swatches = create_swatch_sheet([gold, plastic, glass], kind='uv_sphere')
+    cloud = create_point_instances(source_obj, points)
+"""
+
+import numpy as np
+
+import bpy
+
+import blender_compat
+import material_assign
+import material_graph
+import mesh_primitives
+
+# Cache mesh bersama: {(kind, params): mesh}
+_SHARED_MESHES = {}
+
+# Node group Geometry Nodes untuk mode POINTS (dipakai bersama semua point cloud)
+POINT_INSTANCER_GROUP = "GN_Point_Instancer"
+
+POINT_INSTANCER_SPEC = {
+    'nodes': {
+        'group_input': {'type': 'NodeGroupInput', 'location': (-400, 0)},
+        'object_info': {'type': 'GeometryNodeObjectInfo', 'location': (-200, -150)},
+        'instance': {'type': 'GeometryNodeInstanceOnPoints', 'location': (0, 0)},
+        'group_output': {'type': 'NodeGroupOutput', 'location': (200, 0)},
+    },
+    'links': [
+        ('group_input', 'Geometry', 'instance', 'Points'),
+        ('group_input', 'Instance', 'object_info', 'Object'),
+        ('object_info', 'Geometry', 'instance', 'Instance'),
+        ('instance', 'Instances', 'group_output', 'Geometry'),
+    ],
+}
+
+def _is_alive(datablock):
+    try:
+        datablock.name
+    except ReferenceError:
+        return False
+    return True
+
+def shared_mesh(kind, **params):
+    """Mesh primitive yang dibuat sekali per (kind, parameter) lalu dipakai ulang"""
+
+    key = (kind, tuple(sorted(params.items())))
+    mesh = _SHARED_MESHES.get(key)
+    if mesh is None or not _is_alive(mesh):
+        mesh = mesh_primitives.new_mesh(kind, f"{kind.title()}_Shared", **params)
+        _SHARED_MESHES[key] = mesh
+    return mesh
+
+def create_instance(kind, name, location=(0, 0, 0), collection=None, **params):
+    """
+    Seperti mesh_primitives.create_primitive, tapi mesh dipakai bersama
+    (linked duplicate) oleh semua objek dengan kind dan parameter sama
+    """
+
+    return mesh_primitives.new_object(name, shared_mesh(kind, **params), location, collection)
+
+def source_collection(objects, name):
+    """
+    Collection sumber untuk mode COLLECTION (tidak di-link ke scene)
+    Objek dipindahkan dari collection scene supaya tidak ter-render dua kali.
+    """
+
+    source = bpy.data.collections.new(name)
+    for obj in objects:
+        for owner in list(obj.users_collection):
+            owner.objects.unlink(obj)
+        source.objects.link(obj)
+    return source
+
+def create_collection_instances(source, locations, name="Instance", collection=None):
+    """
+    Empty yang meng-instance collection sumber di setiap lokasi
+
+    Returns: list objek empty
+    """
+
+    if collection is None:
+        collection = bpy.context.collection or bpy.context.scene.collection
+
+    instances = []
+    for i, location in enumerate(locations):
+        empty = bpy.data.objects.new(f"{name}_{i:04d}", None)
+        empty.instance_type = 'COLLECTION'
+        empty.instance_collection = source
+        empty.location = location
+        collection.objects.link(empty)
+        instances.append(empty)
+    return instances
+
+def ensure_point_instancer():
+    """Node group Geometry Nodes: Instance on Points dengan objek dari input 'Instance'"""
+
+    group = bpy.data.node_groups.get(POINT_INSTANCER_GROUP)
+    if group is not None:
+        return group
+
+    group = bpy.data.node_groups.new(POINT_INSTANCER_GROUP, 'GeometryNodeTree')
+    blender_compat.new_group_socket(group, 'Geometry', 'INPUT', 'NodeSocketGeometry')
+    blender_compat.new_group_socket(group, 'Instance', 'INPUT', 'NodeSocketObject')
+    blender_compat.new_group_socket(group, 'Geometry', 'OUTPUT', 'NodeSocketGeometry')
+    material_graph.build_node_tree(group, POINT_INSTANCER_SPEC)
+    return group
+
+def create_point_instances(source, points, name="Point_Instances", collection=None):
+    """
+    Satu objek point cloud yang meng-instance objek sumber di setiap titik
+
+    Parameters:
+    - source: objek yang di-instance (boleh tidak di-link ke scene)
+    - points: array (N, 3) posisi instance
+    """
+
+    points = np.asarray(points, dtype=np.float32).reshape(-1, 3)
+    mesh = bpy.data.meshes.new(name)
+    mesh.vertices.add(len(points))
+    mesh.vertices.foreach_set("co", points.ravel())
+    mesh.update()
+
+    obj = mesh_primitives.new_object(name, mesh, collection=collection)
+    group = ensure_point_instancer()
+    modifier = obj.modifiers.new("Point Instancer", 'NODES')
+    modifier.node_group = group
+    modifier[blender_compat.group_socket_identifier(group, 'Instance')] = source
+    return obj
+
+def grid_locations(count, columns, spacing):
+    """Lokasi grid (baris x kolom) yang berpusat di origin"""
+
+    columns = max(1, min(columns, count))
+    rows = (count + columns - 1) // columns
+    index = np.arange(count)
+    x = (index % columns - (columns - 1) / 2) * spacing
+    y = ((rows - 1) / 2 - index // columns) * spacing
+    return np.stack([x, y, np.zeros(count)], axis=1)
+
+def create_swatch_sheet(materials, kind='uv_sphere', spacing=2.5, columns=10, collection=None,
+                        name="Swatch", **mesh_params):
+    """
+    Satu swatch per material, semua memakai satu mesh (mode LINKED)
+
+    Returns: list objek swatch
+    """
+
+    mesh = shared_mesh(kind, **mesh_params)
+    locations = grid_locations(len(materials), columns, spacing)
+    swatches = [mesh_primitives.new_object(f"{name}_{i:04d}", mesh, tuple(location), collection)
+                for i, location in enumerate(locations)]
+    material_assign.assign_materials(dict(zip(swatches, materials)))
+
+    print(f"🧩 {len(swatches)} swatch dibuat dengan 1 mesh '{mesh.name}'")
+    return swatches
@@ -0,0 +1,239 @@
+"""
+Instrumentation: timing terstruktur untuk setiap langkah builder
+Mati secara default (decorator hanya satu pengecekan flag). Aktifkan dengan
+environment variable atau enable():
+
+    BLENDER_DEMO_TRACE=trace.json blender -b --python slide-05-procedural-demo.py
+
+Setiap span mencatat wall time, CPU time, jumlah datablock yang dibuat dan
+jumlah pemanggilan bpy.ops. Hasil ditulis sebagai Chrome trace JSON
+(buka di chrome://tracing atau ui.perfetto.dev) dan profile collapsed
+(<nama>.folded, untuk flamegraph.pl / speedscope).
+
+Contoh:
+    @instrumentation.traced
+    def create_demo_objects():
+        ...
+
+    with instrumentation.step("Assign materials"):
+        ...
+"""
+
+import atexit
+import functools
+import json
+import os
+import threading
+import time
+
+import bpy
+
+# Environment variable: path output trace ('1' = trace.json di folder kerja)
+ENV_VAR = "BLENDER_DEMO_TRACE"
+DEFAULT_TRACE_PATH = "trace.json"
+
+# Koleksi bpy.data yang dihitung untuk 'datablock dibuat'
+DATABLOCK_COLLECTIONS = ('objects', 'meshes', 'materials', 'node_groups', 'images',
+                         'textures', 'lights', 'cameras', 'collections')
+
+class _State:
+    def __init__(self):
+        self.enabled = False
+        self.origin = 0.0
+        self.spans = []
+        self.stack = []
+        self.ops_calls = 0
+        self.output = None
+        self._original_op_call = None
+
+STATE = _State()
+
+def _datablock_count():
+    return sum(len(getattr(bpy.data, name)) for name in DATABLOCK_COLLECTIONS)
+
+def _install_ops_counter():
+    """Bungkus pemanggilan operator bpy.ops.* untuk dihitung (None jika API berbeda)"""
+
+    op_class = getattr(bpy.ops, '_BPyOpsSubModOp', None)
+    if op_class is None or STATE._original_op_call is not None:
+        return
+    original = op_class.__call__
+
+    def counted_call(self, *args, **kwargs):
+        STATE.ops_calls += 1
+        return original(self, *args, **kwargs)
+
+    op_class.__call__ = counted_call
+    STATE._original_op_call = original
+
+def _remove_ops_counter():
+    if STATE._original_op_call is not None:
+        bpy.ops._BPyOpsSubModOp.__call__ = STATE._original_op_call
+        STATE._original_op_call = None
+
+def enable(output=None):
+    """
+    Mulai merekam span
+
+    Parameters:
+    - output: path Chrome trace yang ditulis saat proses selesai (None = tidak ditulis otomatis)
+    """
+
+    if not STATE.enabled:
+        STATE.enabled = True
+        STATE.origin = time.perf_counter()
+        STATE.spans = []
+        STATE.stack = []
+        STATE.ops_calls = 0
+        _install_ops_counter()
+    STATE.output = output
+
+def disable():
+    STATE.enabled = False
+    _remove_ops_counter()
+
+def is_enabled():
+    return STATE.enabled
+
+class step:
+    """Context manager untuk satu span bernama (boleh bersarang)"""
+
+    def __init__(self, name):
+        self.name = name
+
+    def __enter__(self):
+        if not STATE.enabled:
+            return self
+        self.span = {
+            'name': self.name,
+            'stack': [span['name'] for span in STATE.stack] + [self.name],
+            'start': time.perf_counter(),
+            'cpu_start': time.process_time(),
+            'datablocks_start': _datablock_count(),
+            'ops_start': STATE.ops_calls,
+            'child_seconds': 0.0,
+        }
+        STATE.stack.append(self.span)
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        span = getattr(self, 'span', None)
+        if span is None or not STATE.stack or STATE.stack[-1] is not span:
+            return False
+        STATE.stack.pop()
+
+        seconds = time.perf_counter() - span['start']
+        STATE.spans.append({
+            'name': span['name'],
+            'stack': span['stack'],
+            'start': span['start'] - STATE.origin,
+            'seconds': seconds,
+            'self_seconds': seconds - span['child_seconds'],
+            'cpu_seconds': time.process_time() - span['cpu_start'],
+            'datablocks': _datablock_count() - span['datablocks_start'],
+            'ops_calls': STATE.ops_calls - span['ops_start'],
+            'error': exc_type.__name__ if exc_type else None,
+        })
+        if STATE.stack:
+            STATE.stack[-1]['child_seconds'] += seconds
+        del self.span
+        return False
+
+def traced(func=None, name=None):
+    """
+    Decorator span untuk builder
+
+    Bisa dipakai sebagai @traced atau @traced(name="...")
+    """
+
+    def decorate(func):
+        label = name or func.__qualname__
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if not STATE.enabled:
+                return func(*args, **kwargs)
+            with step(label):
+                return func(*args, **kwargs)
+        return wrapper
+
+    if func is None:
+        return decorate
+    return decorate(func)
+
+def chrome_trace():
+    """Span sebagai dict Chrome trace (event 'X' complete, waktu dalam mikrodetik)"""
+
+    pid, tid = os.getpid(), threading.get_ident()
+    events = []
+    for span in STATE.spans:
+        events.append({
+            'name': span['name'],
+            'ph': 'X',
+            'ts': span['start'] * 1e6,
+            'dur': span['seconds'] * 1e6,
+            'pid': pid,
+            'tid': tid,
+            'args': {
+                'cpu_ms': span['cpu_seconds'] * 1000.0,
+                'datablocks': span['datablocks'],
+                'ops_calls': span['ops_calls'],
+                'error': span['error'],
+            },
+        })
+    return {'traceEvents': events, 'displayTimeUnit': 'ms'}
+
+def collapsed_profile():
+    """Baris 'a;b;c <self mikrodetik>' (format collapsed flamegraph)"""
+
+    totals = {}
+    for span in STATE.spans:
+        key = ";".join(span['stack'])
+        totals[key] = totals.get(key, 0.0) + span['self_seconds']
+    return [f"{key} {round(seconds * 1e6)}" for key, seconds in sorted(totals.items())]
+
+def write_trace(path=None):
+    """Tulis Chrome trace ke path dan profile collapsed ke <path tanpa ekstensi>.folded"""
+
+    path = path or STATE.output or DEFAULT_TRACE_PATH
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(chrome_trace(), f)
+    folded = os.path.splitext(path)[0] + '.folded'
+    with open(folded, 'w', encoding='utf-8') as f:
+        f.write("\n".join(collapsed_profile()) + "\n")
+    print(f"📈 Trace: {path} ({len(STATE.spans)} span), flamegraph: {folded}")
+    return path
+
+def summary():
+    """Total per nama span: dict {nama: {calls, seconds, cpu_seconds, datablocks, ops_calls}}"""
+
+    totals = {}
+    for span in STATE.spans:
+        entry = totals.setdefault(span['name'], {'calls': 0, 'seconds': 0.0, 'cpu_seconds': 0.0,
+                                                 'datablocks': 0, 'ops_calls': 0})
+        entry['calls'] += 1
+        entry['seconds'] += span['seconds']
+        entry['cpu_seconds'] += span['cpu_seconds']
+        entry['datablocks'] += span['datablocks']
+        entry['ops_calls'] += span['ops_calls']
+    return totals
+
+def print_report():
+    """Cetak ringkasan span (tidak mencetak apa-apa jika instrumentation mati)"""
+
+    if not STATE.enabled or not STATE.spans:
+        return
+    print("\n⏱️ === Profil builder ===")
+    totals = sorted(summary().items(), key=lambda item: item[1]['seconds'], reverse=True)
+    for span_name, entry in totals:
+        print(f"  {span_name:40s} {entry['calls']:4d}x {entry['seconds'] * 1000:9.1f} ms "
+              f"(cpu {entry['cpu_seconds'] * 1000:.1f} ms, +{entry['datablocks']} datablock, "
+              f"{entry['ops_calls']} bpy.ops)")
+
+def _write_at_exit():
+    if STATE.enabled and STATE.output and STATE.spans:
+        write_trace()
+
+if os.environ.get(ENV_VAR):
+    enable(DEFAULT_TRACE_PATH if os.environ[ENV_VAR] == '1' else os.environ[ENV_VAR])
+    atexit.register(_write_at_exit)
@@ -0,0 +1,206 @@
+"""
+Material Assign: assign material ke banyak objek sekaligus
+Nama objek/material di-resolve sekali lewat dict, dan material index per
+face ditulis dari array NumPy dengan foreach_set (tanpa loop per face)
+
+Contoh:
+    assign_materials({'Demo_Cube': 'Gold', sphere: plastic})
+    assign_materials(lambda obj: gold if obj.location.z > 0 else plastic, objects)
+
+    # Slot 0 = atas, slot 2 = bawah; face lain (dot < 0.5, misal samping) ke slot 1
+    assign_materials({grid: [grass, dirt, rock]})
+    set_face_materials(grid, face_indices_by_normal(grid, [(0, 0, 1), None, (0, 0, -1)],
+                                                    threshold=0.5, default=1))
+"""
+
+import numpy as np
+
+import bpy
+
+import instrumentation
+
+def _lookup(datablocks):
+    """Dict nama -> datablock, dibangun sekali per pemanggilan"""
+    return {item.name: item for item in datablocks}
+
+def _resolve(value, table, kind):
+    if value is None or not isinstance(value, str):
+        return value
+    item = table.get(value)
+    if item is None:
+        print(f"{kind} '{value}' tidak ditemukan!")
+    return item
+
+def set_slots(obj, materials):
+    """
+    Mengatur slot material objek
+
+    - satu material: replace slot 0 (atau append jika belum ada slot)
+    - list material: slot 0..n-1 diganti, slot berlebih dibuang
+
+    Mesh yang dipakai bersama (linked duplicate) tidak diubah isinya:
+    material disimpan di slot objek (link = 'OBJECT').
+    """
+
+    if obj.data.users > 1:
+        _set_object_slots(obj, materials)
+        return
+
+    slots = obj.data.materials
+    if not isinstance(materials, (list, tuple)):
+        if slots:
+            slots[0] = materials
+        else:
+            slots.append(materials)
+        return
+
+    for i, mat in enumerate(materials):
+        if i < len(slots):
+            slots[i] = mat
+        else:
+            slots.append(mat)
+    while len(slots) > len(materials):
+        slots.pop()
+
+def _set_object_slots(obj, materials):
+    """Material per objek untuk mesh bersama; slot mesh hanya ditambah jika kurang"""
+
+    if not isinstance(materials, (list, tuple)):
+        materials = [materials]
+    mesh_slots = obj.data.materials
+    while len(mesh_slots) < len(materials):
+        mesh_slots.append(None)
+
+    for slot, mat in zip(obj.material_slots, materials):
+        slot.link = 'OBJECT'
+        slot.material = mat
+
+@instrumentation.traced
+def assign_materials(mapping, objects=None):
+    """
+    Assign material ke banyak objek
+
+    Parameters:
+    - mapping: dict {objek atau nama: material, nama, atau list material},
+               atau callable(obj) -> material/list (None = dilewati)
+    - objects: objek untuk mapping callable (default: semua objek mesh)
+
+    Returns: jumlah objek yang di-assign
+    """
+
+    object_table = _lookup(bpy.data.objects)
+    material_table = _lookup(bpy.data.materials)
+
+    if callable(mapping):
+        if objects is None:
+            objects = [obj for obj in bpy.data.objects if obj.type == 'MESH']
+        pairs = ((obj, mapping(obj)) for obj in objects)
+    else:
+        pairs = mapping.items()
+
+    assigned = 0
+    for obj, value in pairs:
+        obj = _resolve(obj, object_table, "Objek")
+        if obj is None or value is None:
+            continue
+        if not hasattr(obj.data, "materials"):
+            print(f"Objek '{obj.name}' tidak bisa memiliki material!")
+            continue
+
+        if isinstance(value, (list, tuple)):
+            materials = [_resolve(mat, material_table, "Material") for mat in value]
+            if any(mat is None for mat in materials):
+                continue
+        else:
+            materials = _resolve(value, material_table, "Material")
+            if materials is None:
+                continue
+
+        set_slots(obj, materials)
+        assigned += 1
+
+    print(f"🎯 Material di-assign ke {assigned} objek")
+    return assigned
+
+def _mesh(target):
+    return target.data if isinstance(target, bpy.types.Object) else target
+
+def read_face_normals(target):
+    """Normal semua face sebagai array (F, 3)"""
+
+    mesh = _mesh(target)
+    normals = np.empty(len(mesh.polygons) * 3, dtype=np.float32)
+    mesh.polygons.foreach_get("normal", normals)
+    return normals.reshape(-1, 3)
+
+def set_face_materials(target, indices):
+    """
+    Menulis material index semua face dari array (satu foreach_set)
+
+    Parameters:
+    - target: objek mesh atau mesh datablock
+    - indices: array int dengan panjang = jumlah face
+    """
+
+    mesh = _mesh(target)
+    indices = np.asarray(indices, dtype=np.int32).ravel()
+    if len(indices) != len(mesh.polygons):
+        raise ValueError(f"Jumlah index ({len(indices)}) tidak sama dengan jumlah face ({len(mesh.polygons)})")
+    if len(indices) and (indices.min() < 0 or indices.max() >= max(len(mesh.materials), 1)):
+        raise ValueError(f"Material index harus di antara 0 dan {max(len(mesh.materials), 1) - 1}")
+
+    mesh.polygons.foreach_set("material_index", indices)
+    mesh.update()
+    return len(indices)
+
+def face_indices_by_group(target, groups, default=0):
+    """
+    Material index dari kelompok face
+
+    Parameters:
+    - groups: dict {slot: array index face atau mask bool per face}
+    - default: slot untuk face yang tidak masuk kelompok manapun
+    """
+
+    indices = np.full(len(_mesh(target).polygons), default, dtype=np.int32)
+    for slot, faces in groups.items():
+        indices[np.asarray(faces)] = slot
+    return indices
+
+def face_indices_by_normal(target, directions, threshold=None, default=0, space='LOCAL'):
+    """
+    Material index berdasarkan arah normal face
+
+    Parameters:
+    - directions: list arah per slot, misal [(0, 0, 1), (1, 0, 0)];
+                  None = slot tidak dipakai untuk pencocokan arah
+    - threshold: dot minimum (cos sudut); face di bawahnya memakai default
+    - default: slot untuk face yang tidak cocok
+    - space: 'LOCAL' atau 'WORLD' (butuh objek, bukan mesh)
+    """
+
+    normals = read_face_normals(target)
+    if space == 'WORLD':
+        matrix = np.array(target.matrix_world.to_3x3().inverted().transposed(), dtype=np.float32)
+        normals = normals @ matrix.T
+        normals /= np.maximum(np.linalg.norm(normals, axis=1, keepdims=True), 1e-12)
+
+    slots = [i for i, direction in enumerate(directions) if direction is not None]
+    axes = np.array([directions[i] for i in slots], dtype=np.float32)
+    axes /= np.linalg.norm(axes, axis=1, keepdims=True)
+
+    dots = normals @ axes.T
+    best = np.argmax(dots, axis=1)
+    indices = np.asarray(slots, dtype=np.int32)[best]
+    if threshold is not None:
+        indices[dots[np.arange(len(best)), best] < threshold] = default
+    return indices
+
+def face_indices_random(target, slot_count, seed=0, weights=None):
+    """Material index acak (deterministik per seed), opsional dengan bobot per slot"""
+
+    rng = np.random.default_rng(seed)
+    if weights is not None:
+        weights = np.asarray(weights, dtype=np.float64)
+        weights = weights / weights.sum()
+    return rng.choice(slot_count, size=len(_mesh(target).polygons), p=weights).astype(np.int32)
@@ -0,0 +1,139 @@
+"""
+Material Batch: update banyak default_value socket sekaligus
+Baris (material, socket, value) dikelompokkan per material; node dan socket
+di-resolve sekali per material, nilai yang tidak berubah dilewati, dan
+material di-tag untuk update shader satu kali di akhir. Material dari
+material_cache yang diubah dilepas dari registry (tidak dibagikan lagi).
+
+RNA tidak punya API publik untuk menunda update: setiap assignment
+default_value tetap memicu update node tree. Yang dihemat adalah assignment
+yang tidak perlu (nilai sama) dan tag berulang per material.
+
+Contoh:
+    batch_update([
+        (gold, 'Roughness', 0.2),
+        ("Plastic", 'Base Color', (0.1, 0.3, 0.8, 1.0)),
+        (glass, ('Mix Shader', 'Fac'), 0.5),
+    ])
+
+    # Sweep: 10 parameter x 500 material, satu tag per material
+    batch_update((mat, socket, value) for mat in materials for socket, value in params.items())
+"""
+
+import bpy
+
+import blender_compat
+import instrumentation
+import material_cache
+
+# Node yang dipakai jika socket hanya berupa nama input
+DEFAULT_NODE = "Principled BSDF"
+
+# Selisih float yang dianggap sama (nilai tidak ditulis ulang)
+TOLERANCE = 1e-6
+
+def _same(current, value):
+    """Bandingkan nilai socket sekarang dengan nilai baru (float/array/lainnya)"""
+
+    if isinstance(current, float):
+        return isinstance(value, (int, float)) and abs(current - value) <= TOLERANCE
+    if hasattr(current, '__len__') and not isinstance(current, str):
+        if not hasattr(value, '__len__') or len(current) != len(value):
+            return False
+        return all(abs(a - b) <= TOLERANCE for a, b in zip(current, value))
+    return current == value
+
+def group_rows(rows, node=DEFAULT_NODE):
+    """
+    Kelompokkan baris per material
+
+    Returns: dict {material: {(nama node, nama socket): value}} (baris terakhir menang)
+    """
+
+    material_table = None
+    grouped = {}
+    for mat, socket, value in rows:
+        if isinstance(mat, str):
+            if material_table is None:
+                material_table = {item.name: item for item in bpy.data.materials}
+            name = mat
+            mat = material_table.get(name)
+            if mat is None:
+                print(f"Material '{name}' tidak ditemukan!")
+                continue
+        key = tuple(socket) if isinstance(socket, (list, tuple)) else (node, socket)
+        grouped.setdefault(mat, {})[key] = value
+    return grouped
+
+def apply_material(mat, values):
+    """
+    Tulis nilai socket satu material, lalu tag sekali jika ada yang berubah
+
+    Parameters:
+    - values: dict {(nama node, nama socket): value}
+
+    Returns: (jumlah socket diubah, jumlah socket dilewati)
+    """
+
+    if mat.node_tree is None:
+        print(f"Material '{mat.name}' tidak memakai nodes!")
+        return 0, len(values)
+
+    nodes = {}
+    changed = skipped = 0
+    for (node_name, socket_name), value in values.items():
+        if node_name not in nodes:
+            nodes[node_name] = mat.node_tree.nodes.get(node_name)
+        node = nodes[node_name]
+        if node is None:
+            print(f"Node '{node_name}' tidak ditemukan di material '{mat.name}'!")
+            skipped += 1
+            continue
+
+        socket = blender_compat.input_socket(node, socket_name)
+        if _same(socket.default_value, value):
+            skipped += 1
+            continue
+        socket.default_value = value
+        changed += 1
+
+    if changed:
+        mat.update_tag()
+        # Isi material tidak lagi sama dengan hasil builder-nya
+        material_cache.REGISTRY.forget(mat)
+    return changed, skipped
+
+@instrumentation.traced
+def batch_update(rows, node=DEFAULT_NODE):
+    """
+    Update default_value socket untuk banyak material
+
+    Parameters:
+    - rows: iterable (material, socket, value)
+            material: datablock atau nama
+            socket: nama input di `node`, atau (nama node, nama input)
+    - node: nama node default (Principled BSDF)
+
+    Returns: dict {'materials', 'changed', 'skipped'}
+    """
+
+    grouped = group_rows(rows, node)
+    changed = skipped = 0
+    for mat, values in grouped.items():
+        mat_changed, mat_skipped = apply_material(mat, values)
+        changed += mat_changed
+        skipped += mat_skipped
+
+    print(f"🎚️ Batch update: {changed} socket diubah, {skipped} dilewati, {len(grouped)} material")
+    return {'materials': len(grouped), 'changed': changed, 'skipped': skipped}
+
+def set_properties(mat, values, node=DEFAULT_NODE):
+    """
+    Set beberapa input satu node sekaligus
+
+    Contoh: set_properties(mat, {'Metallic': 1.0, 'Roughness': 0.2})
+
+    Returns: jumlah socket yang diubah
+    """
+
+    return apply_material(mat, {(node, name): value for name, value in values.items()})[0]
@@ -0,0 +1,240 @@
+"""
+Material Cache: registry material berbasis hash parameter builder
+Builder yang dipanggil dengan parameter sama mengembalikan datablock yang sama
+
+Key juga memuat sidik source builder: source fungsinya, spec (dict/list/tuple)
+global yang dirujuk, dan source fungsi lain di modul yang sama yang dipanggil
+(misal variant_spec()). Mengubah builder atau spec-nya menghasilkan key baru.
+Material yang diubah setelah dibuat (misal material_batch) dilepas dari
+registry dengan forget(), supaya tidak dibagikan lagi sebagai hasil builder.
+
+Contoh:
+    @material_cache.cached_material
+    def create_metal_material(name, color, roughness):
+        ...
+
+    gold = create_metal_material("Gold", (1.0, 0.766, 0.336, 1.0), 0.1)
+    gold_lagi = create_metal_material("Gold", (1.0, 0.766, 0.336, 1.0), 0.1)  # hit, tanpa .001
+"""
+
+import functools
+import hashlib
+import inspect
+import json
+import types
+
+import bpy
+
+# Custom property untuk menyimpan key di material (ikut tersimpan di .blend)
+CACHE_KEY_PROP = "material_cache_key"
+
+# Parameter yang tidak ikut di-hash (nama hanya label datablock)
+IGNORED_PARAMS = ('name',)
+
+# Sidik source per fungsi builder; menjalankan ulang script membuat fungsi baru
+_FINGERPRINTS = {}
+
+def _canonical(value):
+    """Mengubah parameter menjadi bentuk JSON yang stabil"""
+
+    if isinstance(value, bool) or value is None or isinstance(value, (str, int)):
+        return value
+    if isinstance(value, float):
+        # Bulatkan agar 0.1 dan 0.1000000001 dianggap sama
+        return round(value, 6)
+    if isinstance(value, dict):
+        return {str(k): _canonical(v) for k, v in sorted(value.items(), key=lambda item: str(item[0]))}
+    if hasattr(value, '__iter__'):
+        # tuple, list, mathutils.Color/Vector, bpy_prop_array
+        return [_canonical(v) for v in value]
+    # Datablock atau objek lain: pakai nama/representasinya
+    return getattr(value, 'name', repr(value))
+
+def _source(func):
+    """Source fungsi; fallback ke bytecode jika source tidak tersedia (misal dari Text Editor)"""
+
+    try:
+        return inspect.getsource(func)
+    except (OSError, TypeError):
+        code = func.__code__
+        return code.co_code.hex() + repr(code.co_consts)
+
+def builder_fingerprint(builder):
+    """
+    Hash source builder + spec global dan fungsi satu modul yang dirujuknya
+
+    Satu level saja: cukup untuk pola builder(spec) dan builder -> *_spec().
+    """
+
+    func = inspect.unwrap(builder)
+    fingerprint = _FINGERPRINTS.get(func)
+    if fingerprint is not None:
+        return fingerprint
+
+    parts = [_source(func)]
+    module_globals = getattr(func, '__globals__', {})
+    for name in sorted(set(func.__code__.co_names)):
+        value = module_globals.get(name)
+        if isinstance(value, (dict, list, tuple)):
+            parts.append(f"{name}={json.dumps(_canonical(value), sort_keys=True)}")
+        elif isinstance(value, types.FunctionType) and value.__module__ == func.__module__:
+            parts.append(_source(inspect.unwrap(value)))
+    fingerprint = hashlib.sha1("\n".join(parts).encode('utf-8')).hexdigest()
+    _FINGERPRINTS[func] = fingerprint
+    return fingerprint
+
+def make_key(builder, args, kwargs):
+    """Hash kanonik dari builder (nama + sidik source) + parameternya (tanpa 'name')"""
+
+    bound = inspect.signature(builder).bind(*args, **kwargs)
+    bound.apply_defaults()
+    params = {k: v for k, v in bound.arguments.items() if k not in IGNORED_PARAMS}
+
+    payload = json.dumps(
+        {'builder': f"{builder.__module__}.{builder.__qualname__}",
+         'source': builder_fingerprint(builder), 'params': _canonical(params)},
+        sort_keys=True,
+        separators=(',', ':'),
+    )
+    return hashlib.sha1(payload.encode('utf-8')).hexdigest()
+
+def _is_alive(mat):
+    """Cek apakah datablock masih ada (belum dihapus dari bpy.data)"""
+
+    try:
+        mat.name
+    except ReferenceError:
+        return False
+    return True
+
+class MaterialRegistry:
+    """Registry material: key hash -> datablock, dengan statistik hit/miss"""
+
+    def __init__(self):
+        self._entries = {}
+        self._scanned = False
+        self.hits = 0
+        self.misses = 0
+
+    def _scan_existing(self):
+        """Daftarkan material yang sudah punya key (misal dari file .blend)"""
+
+        for mat in bpy.data.materials:
+            key = mat.get(CACHE_KEY_PROP)
+            if key and key not in self._entries:
+                self._entries[key] = mat
+        self._scanned = True
+
+    def rescan(self):
+        """Daftarkan material ber-key yang muncul setelah scan pertama (misal hasil append)"""
+
+        self._scan_existing()
+
+    def lookup(self, key):
+        """Mengembalikan material untuk key, atau None"""
+
+        if not self._scanned:
+            self._scan_existing()
+
+        mat = self._entries.get(key)
+        if mat is not None and not _is_alive(mat):
+            del self._entries[key]
+            mat = None
+        return mat
+
+    def get_or_create(self, builder, *args, **kwargs):
+        """Panggil builder hanya jika material dengan parameter sama belum ada"""
+
+        key = make_key(builder, args, kwargs)
+        mat = self.lookup(key)
+        if mat is not None:
+            self.hits += 1
+            return mat
+
+        self.misses += 1
+        mat = builder(*args, **kwargs)
+        mat[CACHE_KEY_PROP] = key
+        self._entries[key] = mat
+        return mat
+
+    def forget(self, mat):
+        """
+        Lepas material dari registry (dan hapus key-nya) karena isinya sudah diubah
+
+        Hit berikutnya untuk parameter yang sama akan membangun material baru.
+        Returns: True jika material sebelumnya terdaftar
+        """
+
+        key = mat.get(CACHE_KEY_PROP)
+        if key is None:
+            return False
+        del mat[CACHE_KEY_PROP]
+        if self._entries.get(key) is mat:
+            del self._entries[key]
+        return True
+
+    def evict_unused(self):
+        """
+        Hapus material cache yang tidak dipakai objek manapun (users == 0)
+        Returns: jumlah material yang dihapus
+        """
+
+        unused = {}
+        for key, mat in list(self._entries.items()):
+            if not _is_alive(mat):
+                del self._entries[key]
+            elif mat.users == 0:
+                unused[key] = mat
+
+        if unused:
+            bpy.data.batch_remove(ids=list(unused.values()))
+            for key in unused:
+                del self._entries[key]
+
+        return len(unused)
+
+    def clear(self):
+        """Lupakan semua entry (datablock tidak dihapus) dan reset statistik"""
+
+        self._entries.clear()
+        self._scanned = False
+        self.hits = 0
+        self.misses = 0
+
+    def stats(self):
+        """Statistik cache: hits, misses, entries, hit_rate"""
+
+        total = self.hits + self.misses
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'entries': len(self._entries),
+            'hit_rate': self.hits / total if total else 0.0,
+        }
+
+# Registry default yang dipakai bersama oleh semua script demo
+REGISTRY = MaterialRegistry()
+
+def cached_material(builder=None, registry=None):
+    """
+    Decorator untuk builder material agar memakai registry
+
+    Bisa dipakai sebagai @cached_material atau @cached_material(registry=...)
+    """
+
+    def decorate(func):
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            return (registry or REGISTRY).get_or_create(func, *args, **kwargs)
+        return wrapper
+
+    if builder is None:
+        return decorate
+    return decorate(builder)
+
+def print_cache_stats(registry=None):
+    """Cetak statistik cache material"""
+
+    stats = (registry or REGISTRY).stats()
+    print(f"🗃️ Material cache: {stats['hits']} hit, {stats['misses']} miss, "
+          f"{stats['entries']} entry (hit rate {stats['hit_rate']:.0%})")
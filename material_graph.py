@@ -0,0 +1,288 @@
+"""
+Material Graph: spesifikasi node tree berbasis data + compiler
+Dipakai oleh builder di slide-02, slide-04 dan slide-05
+
+Spec adalah dict biasa (bisa disimpan sebagai JSON):
+{
+    'nodes': {
+        'tex_coord': {'type': 'ShaderNodeTexCoord', 'location': (-800, 0)},
+        'noise': {
+            'type': 'ShaderNodeTexNoise',
+            'location': (-600, 0),
+            'inputs': {'Scale': 50.0, 'Detail': 15.0},
+        },
+        'colorramp': {
+            'type': 'ShaderNodeValToRGB',
+            'ramp': [(0.3,), (0.7,)],              # (position, color opsional)
+        },
+        'rgb': {'type': 'ShaderNodeRGB', 'outputs': {0: (0.8, 0.8, 0.8, 1.0)}},
+        'mix': {'type': 'ShaderNodeMixRGB', 'props': {'blend_type': 'MULTIPLY'}},
+        'tex': {'type': 'ShaderNodeTexImage', 'image': 'path/to/color.jpg',
+                'colorspace': 'sRGB'},
+    },
+    'links': [
+        ('tex_coord', 'Object', 'noise', 'Vector'),
+        ...
+    ],
+    'material_props': {'blend_method': 'BLEND'},  # opsional, hanya build_material
+}
+
+Socket bisa ditulis sebagai nama, index (int), atau beberapa alternatif
+nama dipisah '|'. Nama Blender 4.x (misal 'Transmission Weight') juga
+berlaku di 3.x lewat alias di blender_compat.
+Nama socket di-resolve ke index sekali per tipe node lalu di-cache.
+"""
+
+import json
+
+import bpy
+
+import blender_compat
+import image_registry
+
+# Key spec yang dikenali untuk setiap node
+NODE_KEYS = {'type', 'name', 'label', 'location', 'props', 'inputs', 'outputs',
+             'ramp', 'image', 'colorspace', 'node_tree'}
+
+# Key spec tingkat atas
+SPEC_KEYS = {'nodes', 'links', 'material_props'}
+
+# Cache index socket, dipakai bersama blender_compat
+_SOCKET_TABLES = blender_compat.SOCKET_TABLES
+
+class GraphSpecError(ValueError):
+    """Spec material graph tidak valid"""
+
+def load_spec(filepath):
+    """Membaca spec material graph dari file JSON"""
+
+    with open(filepath, 'r', encoding='utf-8') as f:
+        spec = json.load(f)
+
+    validate_spec(spec)
+    return spec
+
+def _table_key(node_spec):
+    """Key cache socket table (node group dibedakan per node_tree)"""
+    return (node_spec['type'], node_spec.get('node_tree'))
+
+def _socket_table(node):
+    """Tabel nama socket -> index (termasuk alias nama lintas versi Blender)"""
+    return blender_compat.socket_table(node)
+
+def _resolve_socket(table, direction, ref):
+    """Resolve referensi socket (index, nama, atau 'A|B') ke index; None jika tidak ada"""
+
+    if isinstance(ref, int) or str(ref).isdigit():
+        return table[direction].get(int(ref))
+
+    for name in ref.split('|'):
+        index = table[direction].get(name)
+        if index is not None:
+            return index
+    return None
+
+def validate_spec(spec):
+    """
+    Memeriksa spec sebelum menyentuh node tree
+
+    Struktur node, link dan 'material_props' selalu dicek. Nama socket dicek
+    di sini untuk tipe node yang socket table-nya sudah pernah di-cache;
+    build_node_tree selalu mengecek ulang semua socket terhadap node yang
+    sudah dibuat, sebelum nilai dan link ditulis.
+    Raise GraphSpecError jika ada yang salah.
+    """
+
+    unknown = set(spec) - SPEC_KEYS
+    if unknown:
+        raise GraphSpecError(f"Spec punya key tidak dikenal: {sorted(unknown)}")
+
+    material_props = spec.get('material_props', {})
+    if not isinstance(material_props, dict):
+        raise GraphSpecError("'material_props' harus berupa dict")
+    rna_props = bpy.types.Material.bl_rna.properties
+    for prop in material_props:
+        if prop not in rna_props or rna_props[prop].is_readonly:
+            raise GraphSpecError(f"Material tidak punya property '{prop}' yang bisa diubah")
+
+    nodes = spec.get('nodes')
+    if not isinstance(nodes, dict) or not nodes:
+        raise GraphSpecError("Spec harus punya 'nodes' berupa dict yang tidak kosong")
+
+    for key, node_spec in nodes.items():
+        if not isinstance(node_spec, dict) or not isinstance(node_spec.get('type'), str):
+            raise GraphSpecError(f"Node '{key}' harus punya 'type' berupa string")
+
+        unknown = set(node_spec) - NODE_KEYS
+        if unknown:
+            raise GraphSpecError(f"Node '{key}' punya key tidak dikenal: {sorted(unknown)}")
+
+        if 'ramp' in node_spec and node_spec['type'] != 'ShaderNodeValToRGB':
+            raise GraphSpecError(f"Node '{key}': 'ramp' hanya untuk ShaderNodeValToRGB")
+
+        table = _SOCKET_TABLES.get(_table_key(node_spec))
+        if table is None:
+            continue
+        for direction in ('inputs', 'outputs'):
+            for ref in node_spec.get(direction, {}):
+                if _resolve_socket(table, direction, ref) is None:
+                    raise GraphSpecError(f"Node '{key}' tidak punya {direction[:-1]} '{ref}'")
+
+    for link in spec.get('links', []):
+        if len(link) != 4:
+            raise GraphSpecError(f"Link harus (from_node, from_socket, to_node, to_socket): {link}")
+
+        from_key, from_socket, to_key, to_socket = link
+        for key, direction, ref in ((from_key, 'outputs', from_socket), (to_key, 'inputs', to_socket)):
+            if key not in nodes:
+                raise GraphSpecError(f"Link {tuple(link)} merujuk node '{key}' yang tidak ada")
+
+            table = _SOCKET_TABLES.get(_table_key(nodes[key]))
+            if table is not None and _resolve_socket(table, direction, ref) is None:
+                raise GraphSpecError(f"Link {tuple(link)}: node '{key}' tidak punya {direction[:-1]} '{ref}'")
+
+def _load_image(filepath, colorspace):
+    """Load image untuk node Image Texture (dedup lewat image_registry); None jika tidak ada"""
+
+    return image_registry.load_image(filepath, colorspace)
+
+def _apply_ramp(node, stops):
+    """Mengatur elemen ColorRamp dari list (position, color opsional)"""
+
+    elements = node.color_ramp.elements
+    for i, stop in enumerate(stops):
+        position = stop[0]
+        if i < len(elements):
+            element = elements[i]
+            element.position = position
+        else:
+            element = elements.new(position)
+        if len(stop) > 1 and stop[1] is not None:
+            element.color = stop[1]
+
+def _check_sockets(spec, tables):
+    """Cek semua referensi socket spec terhadap tabel node yang sudah dibuat; Returns: list error"""
+
+    errors = []
+    for key, table in tables.items():
+        for direction in ('inputs', 'outputs'):
+            for ref in spec['nodes'][key].get(direction, {}):
+                if _resolve_socket(table, direction, ref) is None:
+                    errors.append(f"Node '{key}' tidak punya {direction[:-1]} '{ref}'")
+
+    for from_key, from_socket, to_key, to_socket in spec.get('links', []):
+        if from_key not in tables or to_key not in tables:
+            continue
+        if (_resolve_socket(tables[from_key], 'outputs', from_socket) is None
+                or _resolve_socket(tables[to_key], 'inputs', to_socket) is None):
+            errors.append(f"Socket link tidak ditemukan: {from_key}.{from_socket} -> {to_key}.{to_socket}")
+    return errors
+
+def build_node_tree(node_tree, spec, clear=True):
+    """
+    Membangun node tree dari spec
+
+    Semua node dibuat dulu (beserta props), lalu semua socket (nilai dan
+    link) dicek terhadap node yang sudah ada. Jika ada yang salah, node yang
+    baru dibuat dihapus dan GraphSpecError berisi semua kesalahan di-raise
+    sebelum nilai atau link apapun ditulis; node lama tidak disentuh.
+    Dengan clear=True node lama baru dihapus setelah pengecekan lolos.
+
+    Parameters:
+    - node_tree: node tree tujuan (material.node_tree atau node group)
+    - spec: dict spec material graph
+    - clear: ganti node yang sudah ada
+
+    Returns: dict {key spec: node}
+    """
+
+    validate_spec(spec)
+
+    nodes = node_tree.nodes
+    links = node_tree.links
+    existing = list(nodes) if clear else []
+
+    built = {}
+    tables = {}
+    for key, node_spec in spec['nodes'].items():
+        node = nodes.new(node_spec['type'])
+        if 'name' in node_spec:
+            node.name = node_spec['name']
+        if 'label' in node_spec:
+            node.label = node_spec['label']
+        if 'location' in node_spec:
+            node.location = node_spec['location']
+        if 'node_tree' in node_spec:
+            node.node_tree = bpy.data.node_groups[node_spec['node_tree']]
+
+        for prop, value in node_spec.get('props', {}).items():
+            setattr(node, prop, value)
+
+        if 'image' in node_spec:
+            image = _load_image(node_spec['image'], node_spec.get('colorspace'))
+            if image is None:
+                # Texture tidak ditemukan: node dan link-nya dilewati
+                nodes.remove(node)
+                continue
+            node.image = image
+
+        built[key] = node
+        tables[key] = _socket_table(node)
+
+    errors = _check_sockets(spec, tables)
+    if errors:
+        for node in built.values():
+            nodes.remove(node)
+        raise GraphSpecError("\n".join(errors))
+
+    if existing:
+        for node in existing:
+            nodes.remove(node)
+        # Node baru sempat diberi suffix .001 karena bentrok dengan nama node lama
+        for key, node in built.items():
+            node.name = spec['nodes'][key].get('name', node.bl_label)
+
+    for key, node in built.items():
+        node_spec = spec['nodes'][key]
+        if 'ramp' in node_spec:
+            _apply_ramp(node, node_spec['ramp'])
+
+        for direction in ('inputs', 'outputs'):
+            sockets = getattr(node, direction)
+            for ref, value in node_spec.get(direction, {}).items():
+                sockets[_resolve_socket(tables[key], direction, ref)].default_value = value
+
+    for from_key, from_socket, to_key, to_socket in spec.get('links', []):
+        if from_key not in built or to_key not in built:
+            continue
+        from_index = _resolve_socket(tables[from_key], 'outputs', from_socket)
+        to_index = _resolve_socket(tables[to_key], 'inputs', to_socket)
+        links.new(built[from_key].outputs[from_index], built[to_key].inputs[to_index])
+
+    return built
+
+def build_material(spec, name):
+    """
+    Membuat material baru dan membangun node tree-nya dari spec
+
+    Parameters:
+    - spec: dict spec material graph
+    - name: nama material
+    """
+
+    # Validasi dulu sebelum membuat datablock apapun
+    validate_spec(spec)
+
+    mat = bpy.data.materials.new(name=name)
+    mat.use_nodes = True
+    try:
+        build_node_tree(mat.node_tree, spec)
+    except GraphSpecError:
+        # Socket salah baru ketahuan setelah node dibuat: jangan tinggalkan material setengah jadi
+        bpy.data.materials.remove(mat)
+        raise
+
+    for prop, value in spec.get('material_props', {}).items():
+        setattr(mat, prop, value)
+
+    return mat
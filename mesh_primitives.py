@@ -0,0 +1,276 @@
+"""
+Mesh Primitives: membuat primitive tanpa bpy.ops
+Vertex, polygon dan UV diisi langsung dengan foreach_set dari array NumPy
+
+Jumlah vertex/face dan parameter default sama dengan primitive bawaan
+Blender (cube, UV sphere, cylinder, grid, plane), termasuk UV map-nya.
+
+Contoh:
+    cube = create_primitive('cube', "Demo_Cube", size=2, location=(-4, 0, 0))
+    grid = create_primitive('grid', "Demo_Grid", x_subdivisions=60, y_subdivisions=60, size=4)
+"""
+
+import numpy as np
+
+import bpy
+
+def _grid_faces(nx, ny, offset=0):
+    """Index vertex quad untuk grid (nx+1) x (ny+1) vertex, baris per baris"""
+
+    i, j = np.meshgrid(np.arange(nx), np.arange(ny), indexing='xy')
+    v0 = (j * (nx + 1) + i).ravel() + offset
+    return np.stack([v0, v0 + 1, v0 + nx + 2, v0 + nx + 1], axis=1)
+
+def _grid_uvs(nx, ny, u0=0.0, v0=0.0, du=1.0, dv=1.0):
+    """UV per loop untuk quad grid, mengisi kotak (u0, v0) - (u0+du, v0+dv)"""
+
+    u = np.linspace(u0, u0 + du, nx + 1)
+    v = np.linspace(v0, v0 + dv, ny + 1)
+    uu, vv = np.meshgrid(u, v, indexing='xy')
+    corners = np.stack([uu.ravel(), vv.ravel()], axis=1)
+    return corners[_grid_faces(nx, ny)].reshape(-1, 2)
+
+def grid_geometry(x_subdivisions=10, y_subdivisions=10, size=2.0):
+    """
+    Geometri grid datar di bidang XY
+
+    Returns: (vertices (V, 3), loop_vertices (L,), face_sizes (F,), uvs (L, 2))
+    """
+
+    nx, ny = x_subdivisions, y_subdivisions
+    x = np.linspace(-size / 2, size / 2, nx + 1)
+    y = np.linspace(-size / 2, size / 2, ny + 1)
+    xx, yy = np.meshgrid(x, y, indexing='xy')
+    vertices = np.stack([xx.ravel(), yy.ravel(), np.zeros(xx.size)], axis=1)
+
+    faces = _grid_faces(nx, ny)
+    face_sizes = np.full(len(faces), 4)
+    return vertices, faces.ravel(), face_sizes, _grid_uvs(nx, ny)
+
+def plane_geometry(size=2.0):
+    """Geometri plane (grid 1x1)"""
+    return grid_geometry(1, 1, size)
+
+# Orientasi tiap sisi cube: (normal, arah u, arah v) dan sel UV (pojok kiri bawah)
+# u x v = normal keluar, jadi winding quad dan UV sama-sama berlawanan jarum jam.
+# Layout UV: pola salib yang tersambung seperti cube default Blender, sisi yang
+# bersebelahan di cube juga bersebelahan di UV:
+#         [+Y]
+#   [-X]  [+Z]  [+X]
+#         [-Y]
+#         [-Z]
+_CUBE_SIDES = (
+    ((0, 0, 1), (1, 0, 0), (0, 1, 0), (0.375, 0.50)),     # +Z
+    ((0, 1, 0), (1, 0, 0), (0, 0, -1), (0.375, 0.75)),    # +Y
+    ((0, -1, 0), (1, 0, 0), (0, 0, 1), (0.375, 0.25)),    # -Y
+    ((0, 0, -1), (1, 0, 0), (0, -1, 0), (0.375, 0.00)),   # -Z
+    ((-1, 0, 0), (0, 0, 1), (0, 1, 0), (0.125, 0.50)),    # -X
+    ((1, 0, 0), (0, 0, -1), (0, 1, 0), (0.625, 0.50)),    # +X
+)
+
+def cube_geometry(size=2.0, cuts=0):
+    """
+    Geometri cube dengan tiap sisi dibagi (cuts + 1) x (cuts + 1)
+    cuts sama dengan number_cuts pada bpy.ops.mesh.subdivide
+
+    Returns: (vertices (V, 3), loop_vertices (L,), face_sizes (F,), uvs (L, 2))
+    """
+
+    n = cuts + 1
+    t = np.linspace(-size / 2, size / 2, n + 1)
+    a, b = np.meshgrid(t, t, indexing='xy')
+    a, b = a.ravel(), b.ravel()
+
+    side_vertices = []
+    side_faces = []
+    side_uvs = []
+    for normal, axis_u, axis_v, (u0, v0) in _CUBE_SIDES:
+        co = np.asarray(normal) * size / 2 + np.outer(a, axis_u) + np.outer(b, axis_v)
+
+        faces = _grid_faces(n, n, offset=len(side_vertices) * a.size)
+        uvs = _grid_uvs(n, n, u0, v0, 0.25, 0.25)
+
+        side_vertices.append(co)
+        side_faces.append(faces)
+        side_uvs.append(uvs.reshape(-1, 2))
+
+    # Gabungkan vertex yang berimpit di rusuk antar sisi
+    vertices, inverse = np.unique(np.round(np.concatenate(side_vertices), 6), axis=0, return_inverse=True)
+    faces = inverse.ravel()[np.concatenate(side_faces)]
+    face_sizes = np.full(len(faces), 4)
+    return vertices, faces.ravel(), face_sizes, np.concatenate(side_uvs)
+
+def uv_sphere_geometry(radius=1.0, segments=32, ring_count=16):
+    """
+    Geometri UV sphere (kutub di sumbu Z, segitiga di kedua kutub)
+
+    Returns: (vertices (V, 3), loop_vertices (L,), face_sizes (F,), uvs (L, 2))
+    """
+
+    theta = np.arange(1, ring_count) * np.pi / ring_count       # sudut dari kutub atas
+    phi = np.arange(segments) * 2 * np.pi / segments
+    tt, pp = np.meshgrid(theta, phi, indexing='ij')
+    ring_vertices = np.stack([
+        radius * np.sin(tt) * np.cos(pp),
+        radius * np.sin(tt) * np.sin(pp),
+        radius * np.cos(tt),
+    ], axis=2).reshape(-1, 3)
+    top = len(ring_vertices)
+    bottom = top + 1
+    vertices = np.concatenate([ring_vertices, [[0, 0, radius], [0, 0, -radius]]])
+
+    seg = np.arange(segments)
+    nxt = (seg + 1) % segments
+    rings = ring_count - 1
+
+    # Segitiga kutub atas
+    top_faces = np.stack([np.full(segments, top), seg, nxt], axis=1)
+    top_uvs = np.stack([
+        np.stack([(seg + 0.5) / segments, np.ones(segments)], axis=1),
+        np.stack([seg / segments, np.full(segments, 1 - 1 / ring_count)], axis=1),
+        np.stack([(seg + 1) / segments, np.full(segments, 1 - 1 / ring_count)], axis=1),
+    ], axis=1)
+
+    # Quad di antara ring
+    r, s = np.meshgrid(np.arange(rings - 1), seg, indexing='ij')
+    r, s = r.ravel(), s.ravel()
+    n = (s + 1) % segments
+    quad_faces = np.stack([r * segments + s, (r + 1) * segments + s,
+                           (r + 1) * segments + n, r * segments + n], axis=1)
+    v_top = 1 - (r + 1) / ring_count
+    v_bottom = 1 - (r + 2) / ring_count
+    quad_uvs = np.stack([
+        np.stack([s / segments, v_top], axis=1),
+        np.stack([s / segments, v_bottom], axis=1),
+        np.stack([(s + 1) / segments, v_bottom], axis=1),
+        np.stack([(s + 1) / segments, v_top], axis=1),
+    ], axis=1)
+
+    # Segitiga kutub bawah
+    last = (rings - 1) * segments
+    bottom_faces = np.stack([np.full(segments, bottom), last + nxt, last + seg], axis=1)
+    bottom_uvs = np.stack([
+        np.stack([(seg + 0.5) / segments, np.zeros(segments)], axis=1),
+        np.stack([(seg + 1) / segments, np.full(segments, 1 / ring_count)], axis=1),
+        np.stack([seg / segments, np.full(segments, 1 / ring_count)], axis=1),
+    ], axis=1)
+
+    loop_vertices = np.concatenate([top_faces.ravel(), quad_faces.ravel(), bottom_faces.ravel()])
+    face_sizes = np.concatenate([np.full(segments, 3), np.full(len(quad_faces), 4), np.full(segments, 3)])
+    uvs = np.concatenate([top_uvs.reshape(-1, 2), quad_uvs.reshape(-1, 2), bottom_uvs.reshape(-1, 2)])
+    return vertices, loop_vertices, face_sizes, uvs
+
+def cylinder_geometry(radius=1.0, depth=2.0, vertices=32):
+    """
+    Geometri cylinder dengan tutup NGON di kedua ujung
+
+    Returns: (vertices (V, 3), loop_vertices (L,), face_sizes (F,), uvs (L, 2))
+    """
+
+    seg = np.arange(vertices)
+    nxt = (seg + 1) % vertices
+    phi = seg * 2 * np.pi / vertices
+    ring = np.stack([radius * np.cos(phi), radius * np.sin(phi)], axis=1)
+    co = np.concatenate([
+        np.column_stack([ring, np.full(vertices, -depth / 2)]),     # ring bawah
+        np.column_stack([ring, np.full(vertices, depth / 2)]),      # ring atas
+    ])
+
+    # Sisi: strip di setengah bawah texture
+    side_faces = np.stack([seg, nxt, vertices + nxt, vertices + seg], axis=1)
+    side_uvs = np.stack([
+        np.stack([seg / vertices, np.zeros(vertices)], axis=1),
+        np.stack([(seg + 1) / vertices, np.zeros(vertices)], axis=1),
+        np.stack([(seg + 1) / vertices, np.full(vertices, 0.5)], axis=1),
+        np.stack([seg / vertices, np.full(vertices, 0.5)], axis=1),
+    ], axis=1)
+
+    # Tutup: lingkaran di setengah atas texture
+    circle = 0.25 * np.stack([np.cos(phi), np.sin(phi)], axis=1)
+    top_cap = vertices + seg
+    top_uvs = circle + (0.25, 0.75)
+    bottom_cap = seg[::-1]
+    bottom_uvs = circle[::-1] * (-1, 1) + (0.75, 0.75)
+
+    loop_vertices = np.concatenate([side_faces.ravel(), top_cap, bottom_cap])
+    face_sizes = np.concatenate([np.full(vertices, 4), [vertices, vertices]])
+    uvs = np.concatenate([side_uvs.reshape(-1, 2), top_uvs, bottom_uvs])
+    return co, loop_vertices, face_sizes, uvs
+
+# Generator geometri per jenis primitive
+GEOMETRY = {
+    'cube': cube_geometry,
+    'uv_sphere': uv_sphere_geometry,
+    'cylinder': cylinder_geometry,
+    'grid': grid_geometry,
+    'plane': plane_geometry,
+}
+
+def mesh_from_arrays(name, vertices, loop_vertices, face_sizes, uvs=None):
+    """
+    Membuat mesh datablock langsung dari array NumPy (tanpa bpy.ops)
+
+    Parameters:
+    - vertices: array (V, 3) posisi vertex
+    - loop_vertices: array (L,) index vertex untuk setiap loop
+    - face_sizes: array (F,) jumlah loop per polygon
+    - uvs: array (L, 2) UV per loop (opsional)
+    """
+
+    face_sizes = np.asarray(face_sizes, dtype=np.int32)
+    loop_starts = np.zeros(len(face_sizes), dtype=np.int32)
+    np.cumsum(face_sizes[:-1], out=loop_starts[1:])
+
+    mesh = bpy.data.meshes.new(name)
+    mesh.vertices.add(len(vertices))
+    mesh.vertices.foreach_set("co", np.asarray(vertices, dtype=np.float32).ravel())
+
+    mesh.loops.add(len(loop_vertices))
+    mesh.loops.foreach_set("vertex_index", np.asarray(loop_vertices, dtype=np.int32))
+
+    mesh.polygons.add(len(face_sizes))
+    mesh.polygons.foreach_set("loop_start", loop_starts)
+    try:
+        # Blender 3.x masih butuh loop_total, di 4.x sudah read-only (dihitung otomatis)
+        mesh.polygons.foreach_set("loop_total", face_sizes)
+    except (AttributeError, TypeError, RuntimeError):
+        pass
+
+    if uvs is not None:
+        uv_layer = mesh.uv_layers.new(name="UVMap")
+        uv_layer.data.foreach_set("uv", np.asarray(uvs, dtype=np.float32).ravel())
+
+    mesh.update(calc_edges=True)
+    return mesh
+
+def new_mesh(kind, name=None, **params):
+    """Membuat mesh primitive ('cube', 'uv_sphere', 'cylinder', 'grid', 'plane')"""
+
+    if kind not in GEOMETRY:
+        raise ValueError(f"Primitive '{kind}' tidak dikenal, pilih dari {sorted(GEOMETRY)}")
+
+    return mesh_from_arrays(name or kind.title(), *GEOMETRY[kind](**params))
+
+def new_object(name, mesh, location=(0, 0, 0), collection=None):
+    """Membuat objek untuk mesh dan langsung link ke collection"""
+
+    obj = bpy.data.objects.new(name, mesh)
+    obj.location = location
+    if collection is None:
+        collection = bpy.context.collection or bpy.context.scene.collection
+    collection.objects.link(obj)
+    return obj
+
+def create_primitive(kind, name, location=(0, 0, 0), collection=None, **params):
+    """
+    Membuat objek primitive tanpa bpy.ops
+
+    Parameters:
+    - kind: 'cube', 'uv_sphere', 'cylinder', 'grid' atau 'plane'
+    - name: nama objek (mesh memakai nama yang sama)
+    - location: posisi objek
+    - collection: collection tujuan (default: collection aktif)
+    - params: parameter geometri, misal size, radius, depth, x_subdivisions
+    """
+
+    return new_object(name, new_mesh(kind, name, **params), location, collection)
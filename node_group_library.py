@@ -0,0 +1,184 @@
+"""
+Node Group Library: subgraph yang sering dipakai sebagai node group bersama
+Setiap group dibuat sekali (ensure_group) lalu dipakai ulang oleh semua
+material, jadi node per material dan ukuran file berkurang.
+
+Group yang tersedia:
+- NG_UV_Scale: Texture Coordinate (Object) -> Mapping dengan Scale
+- NG_Two_Tone: ColorRamp linear 2 warna (Map Range + Mix), posisi Low/High
+- NG_Noise_Ramp: Noise Texture -> NG_Two_Tone
+- NG_Noise_Bump: Noise Texture -> Bump
+
+Di spec material_graph, group dipakai seperti node biasa:
+    'uv': group_node('NG_UV_Scale', (-800, 0), {'Scale': (5.0, 5.0, 5.0)}),
+
+lalu panggil ensure_for_spec(spec) sebelum material_graph.build_material.
+"""
+
+import bpy
+
+import blender_compat
+import material_graph
+
+# Definisi group: socket interface (nama, tipe, default) + spec node di dalamnya
+GROUPS = {
+    'NG_UV_Scale': {
+        'inputs': [('Scale', 'NodeSocketVector', (1.0, 1.0, 1.0))],
+        'outputs': [('Vector', 'NodeSocketVector')],
+        'spec': {
+            'nodes': {
+                'group_input': {'type': 'NodeGroupInput', 'location': (-400, -150)},
+                'tex_coord': {'type': 'ShaderNodeTexCoord', 'location': (-400, 100)},
+                'mapping': {'type': 'ShaderNodeMapping', 'location': (-150, 0)},
+                'group_output': {'type': 'NodeGroupOutput', 'location': (100, 0)},
+            },
+            'links': [
+                ('tex_coord', 'Object', 'mapping', 'Vector'),
+                ('group_input', 'Scale', 'mapping', 'Scale'),
+                ('mapping', 'Vector', 'group_output', 'Vector'),
+            ],
+        },
+    },
+    # Sama dengan ColorRamp 2 stop (Linear): Map Range clamp lalu Mix
+    'NG_Two_Tone': {
+        'inputs': [
+            ('Fac', 'NodeSocketFloat', 0.5),
+            ('Low', 'NodeSocketFloat', 0.0),
+            ('High', 'NodeSocketFloat', 1.0),
+            ('Color A', 'NodeSocketColor', (0.0, 0.0, 0.0, 1.0)),
+            ('Color B', 'NodeSocketColor', (1.0, 1.0, 1.0, 1.0)),
+        ],
+        'outputs': [('Color', 'NodeSocketColor')],
+        'spec': {
+            'nodes': {
+                'group_input': {'type': 'NodeGroupInput', 'location': (-400, 0)},
+                'map_range': {'type': 'ShaderNodeMapRange', 'location': (-200, 100)},
+                'mix': {'type': 'ShaderNodeMixRGB', 'location': (0, 0)},
+                'group_output': {'type': 'NodeGroupOutput', 'location': (200, 0)},
+            },
+            'links': [
+                ('group_input', 'Fac', 'map_range', 'Value'),
+                ('group_input', 'Low', 'map_range', 'From Min'),
+                ('group_input', 'High', 'map_range', 'From Max'),
+                ('map_range', 'Result', 'mix', 'Fac'),
+                ('group_input', 'Color A', 'mix', 'Color1'),
+                ('group_input', 'Color B', 'mix', 'Color2'),
+                ('mix', 'Color', 'group_output', 'Color'),
+            ],
+        },
+    },
+    'NG_Noise_Ramp': {
+        'inputs': [
+            ('Vector', 'NodeSocketVector', (0.0, 0.0, 0.0)),
+            ('Scale', 'NodeSocketFloat', 5.0),
+            ('Detail', 'NodeSocketFloat', 2.0),
+            ('Roughness', 'NodeSocketFloat', 0.5),
+            ('Low', 'NodeSocketFloat', 0.0),
+            ('High', 'NodeSocketFloat', 1.0),
+            ('Color A', 'NodeSocketColor', (0.0, 0.0, 0.0, 1.0)),
+            ('Color B', 'NodeSocketColor', (1.0, 1.0, 1.0, 1.0)),
+        ],
+        'outputs': [('Color', 'NodeSocketColor'), ('Fac', 'NodeSocketFloat')],
+        'spec': {
+            'nodes': {
+                'group_input': {'type': 'NodeGroupInput', 'location': (-400, 0)},
+                'noise': {'type': 'ShaderNodeTexNoise', 'location': (-200, 100)},
+                'two_tone': {'type': 'ShaderNodeGroup', 'node_tree': 'NG_Two_Tone', 'location': (0, 0)},
+                'group_output': {'type': 'NodeGroupOutput', 'location': (200, 0)},
+            },
+            'links': [
+                ('group_input', 'Vector', 'noise', 'Vector'),
+                ('group_input', 'Scale', 'noise', 'Scale'),
+                ('group_input', 'Detail', 'noise', 'Detail'),
+                ('group_input', 'Roughness', 'noise', 'Roughness'),
+                ('noise', 'Fac', 'two_tone', 'Fac'),
+                ('group_input', 'Low', 'two_tone', 'Low'),
+                ('group_input', 'High', 'two_tone', 'High'),
+                ('group_input', 'Color A', 'two_tone', 'Color A'),
+                ('group_input', 'Color B', 'two_tone', 'Color B'),
+                ('two_tone', 'Color', 'group_output', 'Color'),
+                ('noise', 'Fac', 'group_output', 'Fac'),
+            ],
+        },
+    },
+    'NG_Noise_Bump': {
+        'inputs': [
+            ('Vector', 'NodeSocketVector', (0.0, 0.0, 0.0)),
+            ('Scale', 'NodeSocketFloat', 5.0),
+            ('Detail', 'NodeSocketFloat', 2.0),
+            ('Roughness', 'NodeSocketFloat', 0.5),
+            ('Strength', 'NodeSocketFloat', 1.0),
+        ],
+        'outputs': [('Normal', 'NodeSocketVector')],
+        'spec': {
+            'nodes': {
+                'group_input': {'type': 'NodeGroupInput', 'location': (-400, 0)},
+                'noise': {'type': 'ShaderNodeTexNoise', 'location': (-200, 0)},
+                'bump': {'type': 'ShaderNodeBump', 'location': (0, 0)},
+                'group_output': {'type': 'NodeGroupOutput', 'location': (200, 0)},
+            },
+            'links': [
+                ('group_input', 'Vector', 'noise', 'Vector'),
+                ('group_input', 'Scale', 'noise', 'Scale'),
+                ('group_input', 'Detail', 'noise', 'Detail'),
+                ('group_input', 'Roughness', 'noise', 'Roughness'),
+                ('noise', 'Fac', 'bump', 'Height'),
+                ('group_input', 'Strength', 'bump', 'Strength'),
+                ('bump', 'Normal', 'group_output', 'Normal'),
+            ],
+        },
+    },
+}
+
+def group_node(name, location=(0, 0), inputs=None):
+    """Spec node material_graph untuk node group dari library"""
+
+    node_spec = {'type': 'ShaderNodeGroup', 'node_tree': name, 'location': location}
+    if inputs:
+        node_spec['inputs'] = inputs
+    return node_spec
+
+def ensure_for_spec(spec):
+    """Pastikan semua group library yang dipakai spec sudah ada"""
+
+    for node_spec in spec['nodes'].values():
+        if node_spec.get('node_tree') in GROUPS:
+            ensure_group(node_spec['node_tree'])
+
+def ensure_group(name, rebuild=False):
+    """
+    Ambil node group library, buat jika belum ada
+
+    Parameters:
+    - name: nama group di GROUPS
+    - rebuild: bangun ulang isi group (misal setelah definisinya diubah)
+    """
+
+    definition = GROUPS[name]
+    group = bpy.data.node_groups.get(name)
+    if group is not None and not rebuild:
+        return group
+
+    # Group di dalam group harus ada lebih dulu
+    ensure_for_spec(definition['spec'])
+
+    if group is None:
+        group = bpy.data.node_groups.new(name=name, type='ShaderNodeTree')
+    else:
+        if blender_compat.HAS_INTERFACE:
+            group.interface.clear()
+        else:
+            group.inputs.clear()
+            group.outputs.clear()
+        blender_compat.forget_node_tree(name)
+
+    for socket_name, socket_type, default in definition['inputs']:
+        socket = blender_compat.new_group_socket(group, socket_name, 'INPUT', socket_type)
+        socket.default_value = default
+    for socket_name, socket_type in definition['outputs']:
+        blender_compat.new_group_socket(group, socket_name, 'OUTPUT', socket_type)
+
+    material_graph.build_node_tree(group, definition['spec'])
+
+    print(f"🔧 Node group library '{name}' dibuat")
+    return group
@@ -0,0 +1,358 @@
+"""
+Node Optimizer: linter + pass optimasi untuk node tree shader
+Node tree ditelusuri mundur dari output yang dipakai renderer (Cycles dan
+EEVEE, serta semua AOV Output), lalu:
+- Texture Coordinate duplikat digabung menjadi satu
+- Math / Mix dengan input konstan di-fold menjadi default value socket tujuan
+  (Mix dengan factor 0/1 diganti langsung dengan input A/B)
+- node yang tidak mencapai output dihapus (termasuk Frame kosong)
+
+Contoh:
+    report = node_optimizer.optimize_material(mat)
+    node_optimizer.print_report(report)
+"""
+
+import math
+
+import bpy
+
+# Node output shader dengan properti target; satu per target render yang dipakai
+SHADER_OUTPUT_TYPES = {'ShaderNodeOutputMaterial', 'ShaderNodeOutputWorld', 'ShaderNodeOutputLight'}
+RENDER_TARGETS = ('CYCLES', 'EEVEE')
+
+# Semua AOV Output selalu dievaluasi renderer (tidak ada yang 'aktif')
+AOV_OUTPUT_TYPES = {'ShaderNodeOutputAOV'}
+
+# Node output yang menjadi akar penelusuran
+OUTPUT_TYPES = SHADER_OUTPUT_TYPES | AOV_OUTPUT_TYPES | {'NodeGroupOutput'}
+
+def _safe_div(a, b):
+    return a / b if b != 0 else 0.0
+
+def _safe_pow(a, b):
+    if a < 0 and b != int(b):
+        return 0.0
+    try:
+        return a ** b
+    except (OverflowError, ZeroDivisionError):
+        return 0.0
+
+# Operasi Math yang bisa di-fold (mengikuti safe math Blender)
+MATH_OPERATIONS = {
+    'ADD': lambda a, b, c: a + b,
+    'SUBTRACT': lambda a, b, c: a - b,
+    'MULTIPLY': lambda a, b, c: a * b,
+    'DIVIDE': lambda a, b, c: _safe_div(a, b),
+    'MULTIPLY_ADD': lambda a, b, c: a * b + c,
+    'POWER': lambda a, b, c: _safe_pow(a, b),
+    'SQRT': lambda a, b, c: math.sqrt(a) if a > 0 else 0.0,
+    'ABSOLUTE': lambda a, b, c: abs(a),
+    'MINIMUM': lambda a, b, c: min(a, b),
+    'MAXIMUM': lambda a, b, c: max(a, b),
+    'LESS_THAN': lambda a, b, c: 1.0 if a < b else 0.0,
+    'GREATER_THAN': lambda a, b, c: 1.0 if a > b else 0.0,
+    'SIGN': lambda a, b, c: math.copysign(1.0, a) if a else 0.0,
+    'ROUND': lambda a, b, c: math.floor(a + 0.5),
+    'FLOOR': lambda a, b, c: math.floor(a),
+    'CEIL': lambda a, b, c: math.ceil(a),
+    'FRACT': lambda a, b, c: a - math.floor(a),
+    'MODULO': lambda a, b, c: math.fmod(a, b) if b != 0 else 0.0,
+    'SINE': lambda a, b, c: math.sin(a),
+    'COSINE': lambda a, b, c: math.cos(a),
+    'TANGENT': lambda a, b, c: math.tan(a),
+    'RADIANS': lambda a, b, c: math.radians(a),
+    'DEGREES': lambda a, b, c: math.degrees(a),
+}
+
+def _enabled(sockets):
+    return [socket for socket in sockets if socket.enabled]
+
+def _links_from(node_tree):
+    """Dict nama node -> list link masuk (link yang di-mute diabaikan)"""
+
+    incoming = {}
+    for link in node_tree.links:
+        if not link.is_muted:
+            incoming.setdefault(link.to_node.name, []).append(link)
+    return incoming
+
+def _target_output(candidates, target):
+    """
+    Output yang dipakai renderer `target`, dengan aturan yang sama seperti Blender:
+    target spesifik mengalahkan 'ALL', lalu yang aktif mengalahkan yang tidak aktif
+    """
+
+    chosen = None
+    for node in candidates:
+        if node.target not in (target, 'ALL'):
+            continue
+        if chosen is None:
+            chosen = node
+        elif chosen.target == 'ALL' and node.target == target:
+            chosen = node
+        elif chosen.target == node.target and node.is_active_output and not chosen.is_active_output:
+            chosen = node
+    return chosen
+
+def output_nodes(node_tree):
+    """Node output yang menjadi akar penelusuran (Cycles dan EEVEE, semua AOV, group output aktif)"""
+
+    roots = []
+    for bl_idname in sorted(SHADER_OUTPUT_TYPES):
+        candidates = [node for node in node_tree.nodes if node.bl_idname == bl_idname]
+        for target in RENDER_TARGETS:
+            node = _target_output(candidates, target)
+            if node is not None and node not in roots:
+                roots.append(node)
+    for node in node_tree.nodes:
+        if node.bl_idname in AOV_OUTPUT_TYPES:
+            roots.append(node)
+        elif node.bl_idname == 'NodeGroupOutput' and node.is_active_output:
+            roots.append(node)
+    return roots
+
+def reachable_nodes(node_tree):
+    """Nama semua node yang mengalir ke output (output_nodes)"""
+
+    incoming = _links_from(node_tree)
+    seen = set()
+    pending = [node.name for node in output_nodes(node_tree)]
+    while pending:
+        name = pending.pop()
+        if name in seen:
+            continue
+        seen.add(name)
+        pending.extend(link.from_node.name for link in incoming.get(name, ()))
+
+    # Frame tetap ada selama masih membungkus node yang dipakai
+    for node in node_tree.nodes:
+        parent = node.parent
+        while node.name in seen and parent is not None:
+            seen.add(parent.name)
+            parent = parent.parent
+    return seen
+
+def lint(node_tree):
+    """
+    Daftar peringatan untuk node tree
+
+    Returns: list string (kosong jika tidak ada masalah)
+    """
+
+    warnings = []
+    if not output_nodes(node_tree):
+        warnings.append("tidak ada node output aktif")
+        return warnings
+
+    reachable = reachable_nodes(node_tree)
+    for node in node_tree.nodes:
+        if node.name not in reachable and node.bl_idname != 'NodeFrame':
+            warnings.append(f"node '{node.name}' tidak terhubung ke output")
+        if node.bl_idname == 'ShaderNodeTexImage' and node.image is None and node.name in reachable:
+            warnings.append(f"node '{node.name}' tidak punya image")
+        if node.bl_idname == 'ShaderNodeGroup' and node.node_tree is None:
+            warnings.append(f"node group '{node.name}' tidak punya node tree")
+    for link in node_tree.links:
+        if not link.is_valid:
+            warnings.append(f"link {link.from_node.name}.{link.from_socket.name} -> "
+                            f"{link.to_node.name}.{link.to_socket.name} tidak valid")
+    return warnings
+
+def _as_socket_value(value, socket):
+    """Konversi nilai konstan ke tipe socket tujuan; None jika tidak aman"""
+
+    scalar = isinstance(value, (int, float))
+    if socket.type in {'VALUE', 'INT'}:
+        return value if scalar else None
+    if socket.type == 'RGBA':
+        return (value, value, value, 1.0) if scalar else tuple(value[:3]) + (1.0,)
+    if socket.type == 'VECTOR':
+        return (value, value, value) if scalar else tuple(value[:3])
+    return None
+
+def _replace_output(node_tree, socket, value=None, source=None):
+    """
+    Ganti semua pemakai output socket dengan nilai konstan atau socket lain
+
+    Returns: True jika berhasil (tidak ada yang diubah jika gagal)
+    """
+
+    links = [link for link in node_tree.links if link.from_socket == socket]
+    if source is None:
+        values = [_as_socket_value(value, link.to_socket) if hasattr(link.to_socket, 'default_value') else None
+                  for link in links]
+        if any(v is None for v in values):
+            return False
+
+    for i, link in enumerate(links):
+        to_socket = link.to_socket
+        if source is not None:
+            node_tree.links.new(source, to_socket)
+        else:
+            node_tree.links.remove(link)
+            to_socket.default_value = values[i]
+    return bool(links)
+
+def _constant(socket, incoming):
+    """Default value socket jika tidak terhubung, None jika terhubung"""
+
+    if any(link.to_socket == socket for link in incoming):
+        return None
+    value = socket.default_value
+    return value if isinstance(value, (int, float)) else tuple(value)
+
+def _fold_math(node_tree, node, incoming):
+    operation = MATH_OPERATIONS.get(node.operation)
+    if operation is None:
+        return False
+
+    values = [_constant(socket, incoming) for socket in node.inputs]
+    # Input yang tidak dipakai operasi (disabled) dianggap 0
+    values = [0.0 if not socket.enabled else value for socket, value in zip(node.inputs, values)]
+    if any(value is None for value in values):
+        return False
+
+    result = operation(*values[:3])
+    if node.use_clamp:
+        result = min(max(result, 0.0), 1.0)
+    return _replace_output(node_tree, node.outputs[0], value=float(result))
+
+def _fold_mix(node_tree, node, incoming):
+    factor, a, b = _enabled(node.inputs)[:3]
+    output = _enabled(node.outputs)[0]
+    blend_type = getattr(node, 'blend_type', 'MIX')
+    fac = _constant(factor, incoming)
+    if fac is None or not isinstance(fac, (int, float)):
+        return False
+    if getattr(node, 'clamp_factor', True) or node.bl_idname == 'ShaderNodeMixRGB':
+        fac = min(max(fac, 0.0), 1.0)
+    clamp = getattr(node, 'use_clamp', False) or getattr(node, 'clamp_result', False)
+
+    # Factor 0 selalu menghasilkan A; factor 1 hanya untuk blend MIX
+    if fac == 0.0 or (fac == 1.0 and blend_type == 'MIX'):
+        chosen = a if fac == 0.0 else b
+        link = next((link for link in incoming if link.to_socket == chosen), None)
+        if link is not None:
+            if clamp:
+                return False
+            return _replace_output(node_tree, output, source=link.from_socket)
+        value = _constant(chosen, incoming)
+    elif blend_type == 'MIX':
+        va, vb = _constant(a, incoming), _constant(b, incoming)
+        if va is None or vb is None:
+            return False
+        if isinstance(va, tuple):
+            value = tuple(x + (y - x) * fac for x, y in zip(va, vb))
+        else:
+            value = va + (vb - va) * fac
+    else:
+        return False
+
+    if clamp:
+        value = tuple(min(max(v, 0.0), 1.0) for v in value) if isinstance(value, tuple) else min(max(value, 0.0), 1.0)
+    return _replace_output(node_tree, output, value=value)
+
+def fold_constants(node_tree):
+    """Fold Math/Mix konstan sampai tidak ada yang bisa di-fold lagi; Returns: jumlah node"""
+
+    folded = 0
+    while True:
+        incoming = _links_from(node_tree)
+        changed = False
+        for node in list(node_tree.nodes):
+            if node.mute:
+                continue
+            links = incoming.get(node.name, [])
+            if node.bl_idname == 'ShaderNodeMath':
+                done = _fold_math(node_tree, node, links)
+            elif node.bl_idname in {'ShaderNodeMix', 'ShaderNodeMixRGB'}:
+                if node.bl_idname == 'ShaderNodeMix' and node.data_type == 'VECTOR' and node.factor_mode != 'UNIFORM':
+                    continue
+                done = _fold_mix(node_tree, node, links)
+            else:
+                continue
+            if done:
+                folded += 1
+                changed = True
+                # Node sudah tidak punya pemakai; incoming harus dihitung ulang
+                break
+        if not changed:
+            return folded
+
+def merge_tex_coords(node_tree):
+    """Gabungkan node Texture Coordinate dengan setting sama; Returns: jumlah yang digabung"""
+
+    keepers = {}
+    merged = 0
+    for node in list(node_tree.nodes):
+        if node.bl_idname != 'ShaderNodeTexCoord':
+            continue
+        key = (node.object.name if node.object else None, node.from_instancer)
+        keeper = keepers.setdefault(key, node)
+        if keeper is node:
+            continue
+        for output in node.outputs:
+            if output.is_linked:
+                _replace_output(node_tree, output, source=keeper.outputs[output.identifier])
+        node_tree.nodes.remove(node)
+        merged += 1
+    return merged
+
+def remove_unreachable(node_tree):
+    """Hapus node yang tidak mengalir ke output (output_nodes); Returns: jumlah node"""
+
+    if not output_nodes(node_tree):
+        return 0
+    reachable = reachable_nodes(node_tree)
+    dead = [node for node in node_tree.nodes if node.name not in reachable]
+    for node in dead:
+        node_tree.nodes.remove(node)
+    return len(dead)
+
+def optimize_node_tree(node_tree, name=None):
+    """
+    Jalankan semua pass optimasi pada satu node tree
+
+    Returns: dict report (before, after, merged, folded, removed, warnings)
+    """
+
+    before = len(node_tree.nodes)
+    warnings = lint(node_tree)
+    merged = merge_tex_coords(node_tree)
+    # Node mati dibuang dulu supaya tidak ikut di-fold; node hasil fold dibuang sesudahnya
+    removed = remove_unreachable(node_tree)
+    folded = fold_constants(node_tree)
+    removed += remove_unreachable(node_tree)
+    return {
+        'name': name or node_tree.name,
+        'before': before,
+        'after': len(node_tree.nodes),
+        'merged': merged,
+        'folded': folded,
+        'removed': removed,
+        'warnings': warnings,
+    }
+
+def optimize_material(mat):
+    """Optimasi node tree material (material tanpa node dilewati)"""
+
+    if not mat.use_nodes or mat.node_tree is None:
+        return None
+    return optimize_node_tree(mat.node_tree, mat.name)
+
+def optimize_materials(materials=None):
+    """Optimasi banyak material (default: semua material); Returns: list report"""
+
+    materials = bpy.data.materials if materials is None else materials
+    return [report for report in map(optimize_material, materials) if report is not None]
+
+def print_report(reports):
+    """Cetak report dari optimize_material / optimize_materials"""
+
+    if isinstance(reports, dict):
+        reports = [reports]
+    for report in reports:
+        print(f"🧹 {report['name']}: {report['before']} → {report['after']} node "
+              f"({report['merged']} digabung, {report['folded']} di-fold, {report['removed']} dihapus)")
+        for warning in report['warnings']:
+            print(f"   ⚠️ {warning}")
@@ -0,0 +1,407 @@
+"""
+Procedural Bake: bake material procedural ke image texture (Cycles CPU)
+Channel base color, roughness, normal dan displacement di-bake sekali,
+lalu objek diberi salinan material yang memakai image hasil bake (lewat
+material_graph). Material procedural aslinya tidak diubah, karena material
+dipakai bersama (material_cache) oleh objek lain dengan UV berbeda.
+
+Hasil bake disimpan di cache disk:
+    <cache_dir>/<hash node tree>/<hash mesh>_<channel>_<resolusi>_s<samples>_m<margin>.<ext>
+Material yang node tree, mesh dan pengaturan bake-nya tidak berubah tidak
+akan di-bake ulang.
+Hash mesh ikut dipakai karena koordinat Object/Generated bergantung pada geometri.
+
+Contoh:
+    procedural_bake.bake_objects([sphere, grid], resolution=1024)
+"""
+
+import hashlib
+import json
+import os
+
+import numpy as np
+
+import bpy
+
+import material_assign
+import material_cache
+import material_graph
+
+DEFAULT_CACHE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "bake_cache")
+
+# Custom property salinan material hasil bake:
+# "<hash node tree sumber>:<hash mesh>:<pengaturan bake>"
+BAKED_PROP = "bake_source_hash"
+
+# Properti node yang hanya kosmetik (tidak mempengaruhi hasil shader)
+COSMETIC_PROPS = {'name', 'label', 'location', 'width', 'height', 'select', 'hide',
+                  'show_options', 'show_preview', 'show_texture', 'use_custom_color', 'color'}
+
+# Pengaturan bake per channel
+CHANNELS = {
+    'base_color': {'type': 'DIFFUSE', 'pass_filter': {'COLOR'}, 'colorspace': 'sRGB',
+                   'float': False, 'format': 'PNG', 'ext': 'png'},
+    'roughness': {'type': 'ROUGHNESS', 'colorspace': 'Non-Color',
+                  'float': False, 'format': 'PNG', 'ext': 'png'},
+    'normal': {'type': 'NORMAL', 'colorspace': 'Non-Color',
+               'float': False, 'format': 'PNG', 'ext': 'png'},
+    # Height tidak punya bake type sendiri: di-bake lewat Emission (EMIT)
+    'displacement': {'type': 'EMIT', 'colorspace': 'Non-Color',
+                     'float': True, 'format': 'OPEN_EXR', 'ext': 'exr'},
+}
+
+def _rna_values(struct):
+    """Nilai properti RNA sederhana (bool/int/float/string/enum) yang bisa diubah"""
+
+    values = []
+    for prop in struct.bl_rna.properties:
+        if prop.is_readonly or prop.identifier in COSMETIC_PROPS:
+            continue
+        if prop.type not in {'BOOLEAN', 'INT', 'FLOAT', 'STRING', 'ENUM'}:
+            continue
+        value = getattr(struct, prop.identifier)
+        if isinstance(value, set):
+            value = sorted(value)
+        elif not isinstance(value, (bool, int, float, str)):
+            value = list(value)
+        values.append((prop.identifier, value))
+    return values
+
+def _node_signature(node):
+    """Semua data node yang mempengaruhi hasil shader"""
+
+    signature = {'type': node.bl_idname, 'props': _rna_values(node), 'inputs': []}
+    for socket in node.inputs:
+        if socket.is_linked or not hasattr(socket, "default_value"):
+            signature['inputs'].append((socket.identifier, socket.is_linked))
+            continue
+        value = socket.default_value
+        signature['inputs'].append((socket.identifier, value if isinstance(value, (int, float)) else list(value)))
+
+    if getattr(node, "color_ramp", None) is not None:
+        ramp = node.color_ramp
+        signature['ramp'] = [ramp.interpolation, ramp.color_mode,
+                             [(e.position, list(e.color)) for e in ramp.elements]]
+    if getattr(node, "image", None) is not None:
+        signature['image'] = [bpy.path.abspath(node.image.filepath), node.image.colorspace_settings.name]
+    if getattr(node, "node_tree", None) is not None:
+        signature['node_tree'] = node_tree_hash(node.node_tree)
+    return signature
+
+def node_tree_hash(node_tree):
+    """
+    Hash SHA-1 dari isi node tree
+
+    Posisi, seleksi dan warna node diabaikan; tipe node, properti,
+    nilai socket, ColorRamp, image, node group dan link dihitung.
+    """
+
+    nodes = sorted(node_tree.nodes, key=lambda node: node.name)
+    data = {
+        'nodes': [(node.name, _node_signature(node)) for node in nodes],
+        'links': sorted((link.from_node.name, link.from_socket.identifier,
+                         link.to_node.name, link.to_socket.identifier)
+                        for link in node_tree.links if not link.is_muted),
+    }
+    return hashlib.sha1(json.dumps(data, sort_keys=True, default=str).encode('utf-8')).hexdigest()
+
+def mesh_hash(mesh):
+    """Hash posisi vertex, topologi dan UV aktif mesh (dibaca dengan foreach_get)"""
+
+    digest = hashlib.sha1()
+    for collection, attr, dtype, width in ((mesh.vertices, "co", np.float32, 3),
+                                           (mesh.loops, "vertex_index", np.int32, 1),
+                                           (mesh.polygons, "loop_total", np.int32, 1)):
+        values = np.empty(len(collection) * width, dtype=dtype)
+        collection.foreach_get(attr, values)
+        digest.update(values.tobytes())
+
+    if mesh.uv_layers.active is not None:
+        uvs = np.empty(len(mesh.loops) * 2, dtype=np.float32)
+        mesh.uv_layers.active.data.foreach_get("uv", uvs)
+        digest.update(uvs.tobytes())
+    return digest.hexdigest()
+
+def _active_output(node_tree):
+    """Node Material Output yang aktif"""
+
+    outputs = [node for node in node_tree.nodes if node.bl_idname == 'ShaderNodeOutputMaterial']
+    for node in outputs:
+        if node.is_active_output:
+            return node
+    return outputs[0] if outputs else None
+
+def _linked_from(socket):
+    return socket.links[0].from_node if socket.is_linked else None
+
+def _height_source(output):
+    """Socket sumber height dan node Displacement-nya, atau (None, None)"""
+
+    displacement = _linked_from(output.inputs['Displacement'])
+    if displacement is None or displacement.bl_idname != 'ShaderNodeDisplacement':
+        return None, None
+    height = displacement.inputs['Height']
+    if not height.is_linked:
+        return None, None
+    return height.links[0].from_socket, displacement
+
+def detect_channels(mat):
+    """Channel yang benar-benar procedural (socket-nya terhubung ke node lain)"""
+
+    output = _active_output(mat.node_tree)
+    if output is None:
+        return []
+
+    channels = []
+    bsdf = _linked_from(output.inputs['Surface'])
+    if bsdf is not None and bsdf.bl_idname == 'ShaderNodeBsdfPrincipled':
+        if bsdf.inputs['Base Color'].is_linked:
+            channels.append('base_color')
+        if bsdf.inputs['Roughness'].is_linked:
+            channels.append('roughness')
+        if bsdf.inputs['Normal'].is_linked:
+            channels.append('normal')
+    elif bsdf is not None:
+        channels.append('base_color')
+
+    if _height_source(output)[0] is not None:
+        channels.append('displacement')
+    return channels
+
+def _bake_channel(obj, mat, channel, resolution, margin):
+    """Bake satu channel ke image baru di memori"""
+
+    settings = CHANNELS[channel]
+    image = bpy.data.images.new(f"{mat.name}_{channel}", resolution, resolution,
+                                alpha=False, float_buffer=settings['float'])
+    image.colorspace_settings.name = settings['colorspace']
+
+    node_tree = mat.node_tree
+    target = node_tree.nodes.new('ShaderNodeTexImage')
+    target.image = image
+    node_tree.nodes.active = target
+
+    # Displacement: sambungkan height ke Emission sementara
+    output = _active_output(node_tree)
+    surface = output.inputs['Surface']
+    previous = surface.links[0].from_socket if surface.is_linked else None
+    emission = None
+    if channel == 'displacement':
+        emission = node_tree.nodes.new('ShaderNodeEmission')
+        emission.inputs['Strength'].default_value = 1.0
+        node_tree.links.new(_height_source(output)[0], emission.inputs['Color'])
+        node_tree.links.new(emission.outputs['Emission'], surface)
+
+    try:
+        kwargs = {'type': settings['type'], 'margin': margin, 'use_clear': True}
+        if 'pass_filter' in settings:
+            kwargs['pass_filter'] = settings['pass_filter']
+        if channel == 'normal':
+            kwargs['normal_space'] = 'TANGENT'
+        bpy.ops.object.bake(**kwargs)
+    finally:
+        node_tree.nodes.remove(target)
+        if emission is not None:
+            node_tree.nodes.remove(emission)
+            if previous is not None:
+                node_tree.links.new(previous, surface)
+    return image
+
+def _save_image(image, filepath, file_format):
+    """Simpan image bake ke disk lalu hapus datablock-nya"""
+
+    os.makedirs(os.path.dirname(filepath), exist_ok=True)
+    image.filepath_raw = filepath
+    image.file_format = file_format
+    image.save()
+    bpy.data.images.remove(image)
+
+def baked_spec(mat, images):
+    """
+    Spec material_graph yang memakai image hasil bake
+
+    Input Principled BSDF yang tidak di-bake (metallic, IOR, dll) dan
+    Scale/Midlevel node Displacement disalin dari material asli.
+    """
+
+    output = _active_output(mat.node_tree)
+    bsdf = _linked_from(output.inputs['Surface'])
+    bsdf_inputs = {}
+    if bsdf is not None and bsdf.bl_idname == 'ShaderNodeBsdfPrincipled':
+        for socket in bsdf.inputs:
+            if socket.is_linked or not hasattr(socket, "default_value"):
+                continue
+            value = socket.default_value
+            bsdf_inputs[socket.identifier] = value if isinstance(value, (int, float)) else tuple(value)
+
+    spec = {
+        'nodes': {
+            'tex_coord': {'type': 'ShaderNodeTexCoord', 'location': (-900, 0)},
+            'bsdf': {'type': 'ShaderNodeBsdfPrincipled', 'location': (0, 0), 'inputs': bsdf_inputs},
+            'output': {'type': 'ShaderNodeOutputMaterial', 'location': (300, 0)},
+        },
+        'links': [('bsdf', 'BSDF', 'output', 'Surface')],
+    }
+
+    sockets = {'base_color': 'Base Color', 'roughness': 'Roughness'}
+    for i, (channel, filepath) in enumerate(sorted(images.items())):
+        key = f"{channel}_tex"
+        spec['nodes'][key] = {
+            'type': 'ShaderNodeTexImage',
+            'label': f"Baked {channel}",
+            'location': (-600, 300 - i * 300),
+            'image': filepath,
+            'colorspace': CHANNELS[channel]['colorspace'],
+        }
+        spec['links'].append(('tex_coord', 'UV', key, 'Vector'))
+
+        if channel in sockets:
+            spec['links'].append((key, 'Color', 'bsdf', sockets[channel]))
+        elif channel == 'normal':
+            spec['nodes']['normal_map'] = {'type': 'ShaderNodeNormalMap', 'location': (-300, -300)}
+            spec['links'] += [(key, 'Color', 'normal_map', 'Color'), ('normal_map', 'Normal', 'bsdf', 'Normal')]
+        elif channel == 'displacement':
+            displacement = _height_source(output)[1]
+            spec['nodes']['displacement'] = {
+                'type': 'ShaderNodeDisplacement',
+                'location': (0, -400),
+                'inputs': {name: displacement.inputs[name].default_value for name in ('Midlevel', 'Scale')},
+            }
+            spec['links'] += [(key, 'Color', 'displacement', 'Height'),
+                              ('displacement', 'Displacement', 'output', 'Displacement')]
+    return spec
+
+def _baked_copy(key):
+    """Salinan hasil bake yang sudah ada untuk (node tree, mesh, pengaturan) yang sama, atau None"""
+
+    return next((mat for mat in bpy.data.materials if mat.get(BAKED_PROP) == key), None)
+
+def bake_material(mat, obj, resolution=1024, cache_dir=None, channels=None, margin=16):
+    """
+    Bake material procedural di objek lalu ganti material objek dengan salinan hasil bake
+
+    Material asli tidak diubah; objek lain (dan hit material_cache berikutnya)
+    tetap mendapat versi procedural. Objek dengan node tree dan mesh yang sama
+    memakai salinan hasil bake yang sama.
+
+    Parameters:
+    - mat: material procedural (harus satu-satunya material di obj)
+    - obj: objek mesh dengan UV map, dipakai sebagai permukaan bake
+    - resolution: ukuran image bake (pixel, persegi)
+    - cache_dir: folder cache (default: DEFAULT_CACHE_DIR)
+    - channels: list channel, default: detect_channels(mat)
+    - margin: margin bake dalam pixel
+
+    Jumlah sample diambil dari scene.cycles.samples (diatur oleh bake_objects).
+
+    Returns: dict {channel: path image}
+    """
+
+    if mat.get(BAKED_PROP):
+        print(f"⏭️ Material '{mat.name}' sudah hasil bake, dilewati")
+        return {}
+    if obj.type != 'MESH' or not obj.data.uv_layers:
+        raise ValueError(f"Objek '{obj.name}' harus mesh dengan UV map untuk bake")
+    if any(slot.material is not mat for slot in obj.material_slots):
+        raise ValueError(f"Objek '{obj.name}' memakai material lain selain '{mat.name}'")
+
+    channels = detect_channels(mat) if channels is None else list(channels)
+    unknown = set(channels) - set(CHANNELS)
+    if unknown:
+        raise ValueError(f"Channel bake tidak dikenal: {sorted(unknown)}, pilih dari {sorted(CHANNELS)}")
+    if not channels:
+        print(f"⏭️ Material '{mat.name}' tidak punya channel procedural, dilewati")
+        return {}
+
+    graph_hash = node_tree_hash(mat.node_tree)
+    folder = os.path.join(cache_dir or DEFAULT_CACHE_DIR, graph_hash)
+    geometry = mesh_hash(obj.data)[:12]
+    # Sample dan margin mengubah isi image, jadi ikut menentukan file cache
+    settings = f"{resolution}_s{bpy.context.scene.cycles.samples}_m{margin}"
+
+    images = {}
+    hits = 0
+    for channel in channels:
+        filepath = os.path.join(folder, f"{geometry}_{channel}_{settings}.{CHANNELS[channel]['ext']}")
+        if os.path.exists(filepath):
+            hits += 1
+        else:
+            image = _bake_channel(obj, mat, channel, resolution, margin)
+            _save_image(image, filepath, CHANNELS[channel]['format'])
+        images[channel] = filepath
+
+    key = f"{graph_hash}:{mesh_hash(obj.data)}:{settings}"
+    baked = _baked_copy(key)
+    if baked is None:
+        baked = mat.copy()
+        baked.name = f"{mat.name}_Baked"
+        # Salinan tidak boleh dibagikan material_cache sebagai material procedural
+        if material_cache.CACHE_KEY_PROP in baked:
+            del baked[material_cache.CACHE_KEY_PROP]
+        try:
+            material_graph.build_node_tree(baked.node_tree, baked_spec(mat, images))
+        except material_graph.GraphSpecError:
+            bpy.data.materials.remove(baked)
+            raise
+        baked[BAKED_PROP] = key
+    material_assign.set_slots(obj, [baked] * len(obj.material_slots))
+
+    print(f"🔥 Material '{mat.name}' -> '{baked.name}': {len(channels) - hits} channel di-bake, "
+          f"{hits} dari cache")
+    return images
+
+def bake_objects(objects, resolution=1024, cache_dir=None, samples=16, margin=16):
+    """
+    Bake semua material procedural pada objek-objek (Cycles CPU)
+
+    Render engine, device dan sample scene dikembalikan setelah selesai,
+    begitu juga seleksi objek.
+
+    Returns: jumlah objek yang diberi salinan material hasil bake
+    """
+
+    scene = bpy.context.scene
+    view_layer = bpy.context.view_layer
+    if bpy.context.object and bpy.context.object.mode != 'OBJECT':
+        bpy.ops.object.mode_set(mode='OBJECT')
+
+    previous_engine = scene.render.engine
+    previous_active = view_layer.objects.active
+    previous_selected = [obj for obj in view_layer.objects if obj.select_get()]
+
+    scene.render.engine = 'CYCLES'
+    previous_cycles = (scene.cycles.device, scene.cycles.samples)
+    scene.cycles.device = 'CPU'
+    scene.cycles.samples = samples
+
+    baked = 0
+    try:
+        for obj in objects:
+            if obj.type != 'MESH' or not obj.material_slots:
+                continue
+            mat = obj.material_slots[0].material
+            if mat is None or not mat.use_nodes:
+                continue
+
+            # bpy.ops.object.bake bekerja pada objek aktif yang terseleksi
+            for other in view_layer.objects:
+                other.select_set(False)
+            obj.select_set(True)
+            view_layer.objects.active = obj
+
+            try:
+                result = bake_material(mat, obj, resolution, cache_dir, margin=margin)
+            except ValueError as e:
+                # Misal objek dengan lebih dari satu material: lewati, lanjut ke objek lain
+                print(f"⚠️ Objek '{obj.name}' dilewati: {e}")
+                continue
+            if result:
+                baked += 1
+    finally:
+        scene.cycles.device, scene.cycles.samples = previous_cycles
+        scene.render.engine = previous_engine
+        for obj in view_layer.objects:
+            obj.select_set(obj in previous_selected)
+        view_layer.objects.active = previous_active
+
+    return baked
@@ -0,0 +1,282 @@
+"""
+Render Farm: render scene demo secara headless dan paralel
+Job (frame x material x tile) dibagi ke beberapa proses `blender -b` lokal,
+hasil dan waktu per job dikumpulkan ke manifest JSON
+
+Contoh (dijalankan dengan Python biasa, di luar Blender):
+    python render_farm.py slide-05-procedural-demo.py --engine CYCLES --samples 16 \\
+        --resolution 1280x720 --tiles 2x2 --materials Procedural_Stone,Procedural_Wood
+
+Script ini juga menjadi worker-nya sendiri: dispatcher memanggil
+    blender -b --factory-startup --python render_farm.py -- --worker '<job json>'
+"""
+
+import argparse
+import json
+import os
+import runpy
+import subprocess
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+try:
+    import bpy
+except ImportError:
+    bpy = None
+
+SCRIPT_PATH = os.path.abspath(__file__)
+
+# Penanda baris output worker yang berisi hasil JSON
+RESULT_MARKER = "@@RENDER_FARM@@ "
+
+# Bagian worker (berjalan di dalam Blender)
+
+def _engine_id(engine):
+    """Terjemahkan 'CYCLES' / 'EEVEE' ke identifier engine versi Blender ini"""
+
+    available = bpy.types.RenderSettings.bl_rna.properties['engine'].enum_items.keys()
+    if engine.upper() == 'EEVEE':
+        for candidate in ('BLENDER_EEVEE_NEXT', 'BLENDER_EEVEE'):
+            if candidate in available:
+                return candidate
+    if engine not in available:
+        raise ValueError(f"Render engine '{engine}' tidak tersedia, pilih dari {list(available)}")
+    return engine
+
+def _ensure_camera_and_light(scene):
+    """Tambahkan camera/light (tanpa bpy.ops) jika scene demo belum punya"""
+
+    import mathutils
+
+    meshes = [obj for obj in scene.objects if obj.type == 'MESH']
+    center = mathutils.Vector((0, 0, 0))
+    radius = 5.0
+    if meshes:
+        points = [obj.matrix_world @ mathutils.Vector(corner) for obj in meshes for corner in obj.bound_box]
+        center = sum(points, mathutils.Vector((0, 0, 0))) / len(points)
+        radius = max((p - center).length for p in points)
+
+    if scene.camera is None:
+        camera = bpy.data.objects.new("Farm_Camera", bpy.data.cameras.new("Farm_Camera"))
+        scene.collection.objects.link(camera)
+        camera.location = center + mathutils.Vector((0, -2.2, 1.2)) * radius
+        direction = center - camera.location
+        camera.rotation_euler = direction.to_track_quat('-Z', 'Y').to_euler()
+        scene.camera = camera
+
+    if not any(obj.type == 'LIGHT' for obj in scene.objects):
+        light_data = bpy.data.lights.new("Farm_Sun", type='SUN')
+        light_data.energy = 3.0
+        light = bpy.data.objects.new("Farm_Sun", light_data)
+        light.location = center + mathutils.Vector((5, 5, 10))
+        scene.collection.objects.link(light)
+
+def _override_material(scene, material_name):
+    """Ganti semua slot material objek mesh dengan satu material"""
+
+    mat = bpy.data.materials[material_name]
+    for obj in scene.objects:
+        if obj.type != 'MESH':
+            continue
+        if not obj.material_slots:
+            obj.data.materials.append(mat)
+            continue
+        # Lewat slot objek: berlaku untuk slot link 'DATA' maupun 'OBJECT' (mesh bersama)
+        for slot in obj.material_slots:
+            slot.material = mat
+
+def run_worker(job):
+    """Bangun scene demo lalu render satu job; hasil dicetak dengan RESULT_MARKER"""
+
+    started = time.perf_counter()
+    runpy.run_path(job['scene'], run_name='__main__')
+    build_time = time.perf_counter() - started
+
+    scene = bpy.context.scene
+    if job.get('list_materials'):
+        names = sorted(mat.name for mat in bpy.data.materials if mat.users)
+        print(RESULT_MARKER + json.dumps({'materials': names}))
+        return
+
+    _ensure_camera_and_light(scene)
+
+    render = scene.render
+    render.engine = _engine_id(job['engine'])
+    if render.engine == 'CYCLES':
+        scene.cycles.device = 'CPU'
+        scene.cycles.samples = job['samples']
+    render.resolution_x, render.resolution_y = job['resolution']
+    render.resolution_percentage = 100
+    render.threads_mode = 'FIXED'
+    render.threads = job['threads']
+
+    # Tile = render border, di-crop agar tiap tile jadi file sendiri
+    if job.get('tile'):
+        (tx, ty), (nx, ny) = job['tile'], job['tiles']
+        render.use_border = True
+        render.use_crop_to_border = True
+        render.border_min_x, render.border_max_x = tx / nx, (tx + 1) / nx
+        render.border_min_y, render.border_max_y = ty / ny, (ty + 1) / ny
+
+    if job.get('material'):
+        _override_material(scene, job['material'])
+
+    scene.frame_set(job['frame'])
+    render.filepath = job['output']
+    render.image_settings.file_format = 'PNG'
+
+    render_started = time.perf_counter()
+    bpy.ops.render.render(write_still=True)
+
+    print(RESULT_MARKER + json.dumps({
+        'build_seconds': build_time,
+        'render_seconds': time.perf_counter() - render_started,
+    }))
+
+# Bagian dispatcher (berjalan dengan Python biasa)
+
+def _parse_frames(text):
+    """'1-4,8' -> [1, 2, 3, 4, 8]"""
+
+    frames = []
+    for part in text.split(','):
+        if '-' in part:
+            start, end = part.split('-')
+            frames.extend(range(int(start), int(end) + 1))
+        else:
+            frames.append(int(part))
+    return frames
+
+def _parse_pair(text):
+    """'1280x720' -> (1280, 720)"""
+
+    x, y = text.lower().split('x')
+    return int(x), int(y)
+
+def _blender_command(blender, job):
+    return [blender, '-b', '--factory-startup', '-noaudio', '--python-exit-code', '1', '--python', SCRIPT_PATH,
+            '--', '--worker', json.dumps(job)]
+
+def _run_job(blender, job):
+    """Jalankan satu proses Blender untuk satu job, kembalikan entry manifest"""
+
+    started = time.perf_counter()
+    proc = subprocess.run(_blender_command(blender, job), capture_output=True, text=True)
+    entry = dict(job, returncode=proc.returncode, seconds=time.perf_counter() - started)
+
+    for line in proc.stdout.splitlines():
+        if line.startswith(RESULT_MARKER):
+            entry.update(json.loads(line[len(RESULT_MARKER):]))
+    if proc.returncode != 0:
+        entry['log_tail'] = (proc.stdout + proc.stderr)[-2000:]
+    return entry
+
+def list_materials(blender, scene):
+    """Bangun scene sekali di Blender untuk mengetahui material yang dipakai"""
+
+    entry = _run_job(blender, {'scene': scene, 'list_materials': True})
+    if 'materials' not in entry:
+        raise RuntimeError(f"Gagal membaca material dari '{scene}':\n{entry.get('log_tail', '')}")
+    return entry['materials']
+
+def plan_jobs(scene, out_dir, frames, materials, tiles, resolution, engine, samples, threads):
+    """Daftar job = frame x material x tile"""
+
+    stem = os.path.splitext(os.path.basename(scene))[0]
+    nx, ny = tiles
+    tile_list = [(x, y) for y in range(ny) for x in range(nx)] if nx * ny > 1 else [None]
+
+    jobs = []
+    for frame in frames:
+        for material in materials or [None]:
+            for tile in tile_list:
+                name = f"{stem}_f{frame:04d}"
+                if material:
+                    name += f"_{material}"
+                if tile:
+                    name += f"_t{tile[0]}x{tile[1]}"
+                jobs.append({
+                    'id': len(jobs),
+                    'scene': os.path.abspath(scene),
+                    'frame': frame,
+                    'material': material,
+                    'tile': tile,
+                    'tiles': tiles,
+                    'resolution': resolution,
+                    'engine': engine,
+                    'samples': samples,
+                    'threads': threads,
+                    'output': os.path.abspath(os.path.join(out_dir, name + '.png')),
+                })
+    return jobs
+
+def run_farm(blender, jobs, workers):
+    """Jalankan semua job di pool proses Blender, urutkan hasil sesuai id"""
+
+    results = []
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        futures = [pool.submit(_run_job, blender, job) for job in jobs]
+        for future in as_completed(futures):
+            entry = future.result()
+            status = "✓" if entry['returncode'] == 0 else "✗"
+            print(f"{status} Job {entry['id']}: {os.path.basename(entry['output'])} ({entry['seconds']:.1f}s)")
+            results.append(entry)
+    return sorted(results, key=lambda entry: entry['id'])
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Render scene demo slide-0X secara paralel di background")
+    parser.add_argument('scene', help="Script scene, misal slide-05-procedural-demo.py")
+    parser.add_argument('--blender', default=os.environ.get('BLENDER', 'blender'), help="Path executable Blender")
+    parser.add_argument('--out', default='renders', help="Folder output")
+    parser.add_argument('--engine', default='CYCLES', help="CYCLES atau EEVEE")
+    parser.add_argument('--samples', type=int, default=16, help="Sample Cycles per pixel")
+    parser.add_argument('--frames', default='1', help="Frame, misal '1-10,20'")
+    parser.add_argument('--materials', default='', help="Nama material dipisah koma, atau 'all'")
+    parser.add_argument('--tiles', default='1x1', help="Jumlah tile, misal '2x2'")
+    parser.add_argument('--resolution', default='960x540', help="Resolusi, misal '1920x1080'")
+    parser.add_argument('--jobs', type=int, default=0, help="Jumlah proses Blender paralel (default: sesuai core)")
+    parser.add_argument('--threads', type=int, default=0, help="Thread render per proses (default: core / jobs)")
+    args = parser.parse_args(argv)
+
+    cores = os.cpu_count() or 1
+    workers = args.jobs or (cores // args.threads if args.threads else cores)
+    workers = max(1, min(workers, cores))
+    threads = args.threads or max(1, cores // workers)
+
+    if args.materials.lower() == 'all':
+        materials = list_materials(args.blender, os.path.abspath(args.scene))
+    else:
+        materials = [name for name in args.materials.split(',') if name]
+
+    os.makedirs(args.out, exist_ok=True)
+    jobs = plan_jobs(args.scene, args.out, _parse_frames(args.frames), materials,
+                     _parse_pair(args.tiles), _parse_pair(args.resolution),
+                     args.engine, args.samples, threads)
+
+    print(f"🖥️ {len(jobs)} job, {workers} proses Blender x {threads} thread")
+    started = time.perf_counter()
+    results = run_farm(args.blender, jobs, min(workers, len(jobs)))
+
+    manifest = {
+        'scene': os.path.abspath(args.scene),
+        'blender': args.blender,
+        'workers': workers,
+        'threads_per_worker': threads,
+        'wall_seconds': time.perf_counter() - started,
+        'failed': sum(1 for entry in results if entry['returncode'] != 0),
+        'jobs': results,
+    }
+    manifest_path = os.path.join(args.out, 'manifest.json')
+    with open(manifest_path, 'w', encoding='utf-8') as f:
+        json.dump(manifest, f, indent=2)
+
+    print(f"✅ Selesai dalam {manifest['wall_seconds']:.1f}s, {manifest['failed']} gagal")
+    print(f"📄 Manifest: {manifest_path}")
+    return 1 if manifest['failed'] else 0
+
+if __name__ == "__main__":
+    if bpy is not None and '--worker' in sys.argv:
+        run_worker(json.loads(sys.argv[sys.argv.index('--worker') + 1]))
+    else:
+        sys.exit(main())
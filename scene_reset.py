@@ -0,0 +1,109 @@
+"""
+Scene Reset: membersihkan scene tanpa bpy.ops
+Hanya objek di scene aktif (atau scene yang diberikan) yang disentuh.
+Objek dan datablock yang jadi yatim (mesh, material, image, node group, ...)
+dihapus sekaligus dengan satu panggilan bpy.data.batch_remove
+
+Contoh:
+    freed = reset_scene(keep={"Demo_Camera"})
+    print(f"{freed} datablock dihapus")
+"""
+
+import bpy
+
+# Koleksi bpy.data yang ikut dibersihkan jika datablock-nya tidak dipakai lagi
+ORPHAN_COLLECTIONS = ('meshes', 'materials', 'images', 'node_groups', 'textures',
+                      'lights', 'cameras', 'curves')
+
+# Image internal Blender yang tidak boleh dihapus
+PROTECTED_IMAGE_TYPES = {'RENDER_RESULT', 'COMPOSITING'}
+
+def _orphan_candidates():
+    """Semua datablock di ORPHAN_COLLECTIONS yang boleh dihapus"""
+
+    candidates = []
+    for attr in ORPHAN_COLLECTIONS:
+        for block in getattr(bpy.data, attr):
+            if block.use_fake_user or block.library is not None:
+                continue
+            if attr == 'images' and block.type in PROTECTED_IMAGE_TYPES:
+                continue
+            candidates.append(block)
+    return candidates
+
+def collect_orphans(removed=()):
+    """
+    Mencari datablock yang hanya dipakai oleh `removed` (atau tidak dipakai sama sekali)
+
+    Dihitung dari bpy.data.user_map tanpa mengubah apapun, termasuk rantai
+    objek -> mesh -> material -> image / node group.
+    """
+
+    removed = set(removed)
+    candidates = _orphan_candidates()
+    if not candidates:
+        return []
+
+    user_map = bpy.data.user_map(subset=candidates)
+
+    orphans = set()
+    dead = set(removed)
+    changed = True
+    while changed:
+        changed = False
+        for block, users in user_map.items():
+            if block in dead:
+                continue
+            if users <= dead:
+                dead.add(block)
+                orphans.add(block)
+                changed = True
+
+    return list(orphans)
+
+def remove_objects(objects, purge_orphans=True):
+    """
+    Menghapus objek beserta datablock yang jadi yatim dalam satu batch_remove
+
+    Returns: jumlah datablock yang dihapus
+    """
+
+    objects = list(objects)
+    ids = objects + collect_orphans(objects) if purge_orphans else objects
+    if ids:
+        bpy.data.batch_remove(ids=ids)
+    return len(ids)
+
+def _unlink_from_scene(obj, scene):
+    """Lepas objek dari semua collection milik scene (objek tetap ada di scene lain)"""
+
+    for coll in [scene.collection, *scene.collection.children_recursive]:
+        if obj.name in coll.objects:
+            coll.objects.unlink(obj)
+
+def reset_scene(keep=(), purge_orphans=True, scene=None):
+    """
+    Menghapus semua objek scene kecuali yang namanya ada di `keep`
+
+    Hanya objek di scene ini yang disentuh (seperti select_all + delete).
+    Objek yang juga dipakai scene lain cukup dilepas dari scene ini.
+
+    Parameters:
+    - keep: nama objek yang dipertahankan
+    - purge_orphans: ikut hapus mesh/material/image/node group yang tidak terpakai
+    - scene: scene yang dibersihkan (default: scene aktif)
+
+    Returns: jumlah datablock yang dihapus
+    """
+
+    scene = scene or bpy.context.scene
+    keep = set(keep)
+    objects = [obj for obj in scene.objects if obj.name not in keep]
+
+    removed = []
+    for obj in objects:
+        if any(other != scene for other in obj.users_scene):
+            _unlink_from_scene(obj, scene)
+        else:
+            removed.append(obj)
+    return remove_objects(removed, purge_orphans)
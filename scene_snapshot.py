@@ -0,0 +1,268 @@
+"""
+Scene Snapshot: simpan scene hasil builder ke .blend dan muat ulang tanpa build
+Key snapshot = hash dari source builder (beserta modul pendukung di folder
+ini yang sudah di-import), parameter builder dan versi Blender. Jika file
+snapshot untuk key tersebut sudah ada, scene di-reset lalu objek, material,
+node group, mesh (termasuk UV) dan image di-append lewat
+bpy.data.libraries.load, sama seperti task2/task3/task4.blend dibagikan.
+
+Yang disimpan: objek di scene (beserta semua datablock yang dipakainya),
+semua material/node group, nama collection tiap objek, dan scene.camera.
+Objek dimuat ke collection dengan nama yang sama (dibuat jika belum ada).
+Pengaturan scene lain (render engine, world, frame) tidak ikut disimpan.
+
+Contoh:
+    scene_snapshot.run_cached(main)
+
+    @scene_snapshot.cached_scene
+    def build_gallery(count):
+        ...
+
+Hapus folder snapshot_cache/ untuk memaksa build ulang.
+"""
+
+import functools
+import hashlib
+import inspect
+import json
+import os
+import sys
+
+import bpy
+
+import material_cache
+import scene_reset
+
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+DEFAULT_CACHE_DIR = os.path.join(SCRIPT_DIR, "snapshot_cache")
+
+# Versi format manifest (naikkan jika isi snapshot berubah)
+FORMAT_VERSION = 1
+
+# id_type datablock -> nama koleksi bpy.data (untuk menyimpan return value builder)
+ID_COLLECTIONS = {
+    'OBJECT': 'objects',
+    'MESH': 'meshes',
+    'MATERIAL': 'materials',
+    'NODETREE': 'node_groups',
+    'IMAGE': 'images',
+    'TEXTURE': 'textures',
+    'COLLECTION': 'collections',
+    'LIGHT': 'lights',
+    'CAMERA': 'cameras',
+    'CURVE': 'curves',
+}
+
+# Koleksi bpy.data yang di-append saat snapshot dimuat
+LOADED_COLLECTIONS = ('objects', 'materials', 'node_groups')
+
+def source_hash(builder):
+    """
+    Hash isi file source builder dan semua modul di folder ini yang sudah di-import
+
+    Perubahan di modul pendukung (material_graph, mesh_primitives, ...) ikut
+    membatalkan snapshot, bukan hanya perubahan di fungsi builder.
+    """
+
+    paths = set()
+    builder_file = getattr(sys.modules.get(builder.__module__), '__file__', None)
+    if builder_file:
+        paths.add(os.path.abspath(builder_file))
+    for module in list(sys.modules.values()):
+        path = getattr(module, '__file__', None)
+        if path and os.path.dirname(os.path.abspath(path)) == SCRIPT_DIR and path.endswith('.py'):
+            paths.add(os.path.abspath(path))
+
+    digest = hashlib.sha1()
+    # Script yang dijalankan dari Text Editor bisa punya __file__ yang tidak ada di disk
+    for path in sorted(path for path in paths if os.path.isfile(path)):
+        digest.update(os.path.basename(path).encode('utf-8'))
+        with open(path, 'rb') as f:
+            digest.update(hashlib.sha1(f.read()).digest())
+    return digest.hexdigest()
+
+def snapshot_key(builder, args, kwargs):
+    """Key snapshot: source + parameter (material_cache.make_key) + versi Blender"""
+
+    # make_key mengabaikan 'name', tapi untuk scene nama ikut menentukan isi snapshot
+    bound = inspect.signature(builder).bind(*args, **kwargs)
+    bound.apply_defaults()
+    payload = "|".join([
+        str(FORMAT_VERSION),
+        source_hash(builder),
+        material_cache.make_key(builder, args, kwargs),
+        repr({k: bound.arguments[k] for k in material_cache.IGNORED_PARAMS if k in bound.arguments}),
+        bpy.app.version_string,
+    ])
+    return hashlib.sha1(payload.encode('utf-8')).hexdigest()
+
+def snapshot_paths(builder, key, cache_dir=None):
+    """Path (.blend, manifest .json) untuk snapshot builder dengan key tertentu"""
+
+    base = os.path.join(cache_dir or DEFAULT_CACHE_DIR, f"{builder.__name__}_{key[:16]}")
+    return base + ".blend", base + ".json"
+
+def _encode(value):
+    """Return value builder -> JSON (datablock disimpan sebagai [koleksi, nama])"""
+
+    if isinstance(value, bpy.types.ID):
+        return {'id': [ID_COLLECTIONS.get(value.id_type, 'objects'), value.name]}
+    if isinstance(value, (list, tuple)):
+        return [_encode(item) for item in value]
+    if isinstance(value, dict):
+        return {'dict': {str(k): _encode(v) for k, v in value.items()}}
+    if value is None or isinstance(value, (bool, int, float, str)):
+        return value
+    return None
+
+def _decode(value, loaded):
+    if isinstance(value, list):
+        # Builder demo mengembalikan tuple objek
+        return tuple(_decode(item, loaded) for item in value)
+    if isinstance(value, dict) and 'id' in value:
+        attr, name = value['id']
+        return loaded.get((attr, name)) or getattr(bpy.data, attr).get(name)
+    if isinstance(value, dict) and 'dict' in value:
+        return {k: _decode(v, loaded) for k, v in value['dict'].items()}
+    return value
+
+def _scene_contents(scene):
+    """Datablock scene yang ditulis ke snapshot + manifest untuk memuatnya kembali"""
+
+    objects = list(scene.objects)
+    datablocks = set(objects)
+    datablocks |= {mat for mat in bpy.data.materials if mat.library is None}
+    datablocks |= {group for group in bpy.data.node_groups if group.library is None}
+
+    manifest = {
+        'objects': sorted(obj.name for obj in objects),
+        'materials': sorted(mat.name for mat in datablocks if isinstance(mat, bpy.types.Material)),
+        'node_groups': sorted(group.name for group in datablocks if isinstance(group, bpy.types.NodeTree)),
+        # Nama collection tiap objek ('' = scene collection)
+        'object_collections': {
+            obj.name: sorted('' if coll == scene.collection else coll.name for coll in obj.users_collection)
+            for obj in objects
+        },
+        'camera': scene.camera.name if scene.camera else None,
+    }
+    return datablocks, manifest
+
+def write_snapshot(blend_path, manifest_path, scene, result, key):
+    """Tulis scene ke .blend (libraries.write) dan manifest JSON di sebelahnya"""
+
+    os.makedirs(os.path.dirname(blend_path), exist_ok=True)
+    datablocks, manifest = _scene_contents(scene)
+    manifest.update({'format': FORMAT_VERSION, 'key': key, 'blender': bpy.app.version_string,
+                     'result': _encode(result)})
+
+    # Tulis ke file sementara dulu supaya snapshot setengah jadi tidak pernah terbaca
+    tmp_blend = blend_path + ".tmp"
+    bpy.data.libraries.write(tmp_blend, datablocks, path_remap='ABSOLUTE', fake_user=False, compress=False)
+    os.replace(tmp_blend, blend_path)
+    with open(manifest_path + ".tmp", 'w', encoding='utf-8') as f:
+        json.dump(manifest, f, indent=2, sort_keys=True)
+    os.replace(manifest_path + ".tmp", manifest_path)
+    return manifest
+
+def _target_collection(scene, name):
+    """Collection bernama `name` (dibuat dan di-link ke scene jika belum ada)"""
+
+    if not name:
+        return scene.collection
+    coll = bpy.data.collections.get(name)
+    if coll is None:
+        coll = bpy.data.collections.new(name)
+        scene.collection.children.link(coll)
+    return coll
+
+def load_snapshot(blend_path, manifest, scene):
+    """
+    Append isi snapshot ke bpy.data lalu link objek ke collection-nya di scene
+
+    Returns: dict {(koleksi, nama asli): datablock} (nama bisa dapat suffix .001)
+    """
+
+    requested = {}
+    with bpy.data.libraries.load(blend_path, link=False) as (data_from, data_to):
+        for attr in LOADED_COLLECTIONS:
+            available = set(getattr(data_from, attr))
+            requested[attr] = [name for name in manifest[attr] if name in available]
+            setattr(data_to, attr, list(requested[attr]))
+
+    # Setelah blok with, list data_to berisi datablock dengan urutan yang sama
+    loaded = {}
+    for attr in LOADED_COLLECTIONS:
+        for name, block in zip(requested[attr], getattr(data_to, attr)):
+            if block is not None:
+                loaded[(attr, name)] = block
+
+    for name, coll_names in manifest['object_collections'].items():
+        obj = loaded.get(('objects', name))
+        if obj is None:
+            continue
+        for coll_name in coll_names or ['']:
+            _target_collection(scene, coll_name).objects.link(obj)
+
+    if manifest.get('camera'):
+        scene.camera = loaded.get(('objects', manifest['camera']))
+
+    # Material hasil append membawa material_cache_key: daftarkan ke registry
+    material_cache.REGISTRY.rescan()
+    return loaded
+
+def _read_manifest(path, key):
+    try:
+        with open(path, encoding='utf-8') as f:
+            manifest = json.load(f)
+    except (OSError, ValueError):
+        return None
+    if manifest.get('key') != key or manifest.get('format') != FORMAT_VERSION:
+        return None
+    return manifest
+
+def run_cached(builder, *args, cache_dir=None, scene=None, **kwargs):
+    """
+    Jalankan builder sekali, lalu muat scene hasilnya dari snapshot di run berikutnya
+
+    Parameters:
+    - builder: fungsi yang membangun scene (misal main() dari slide)
+    - cache_dir: folder snapshot (default: snapshot_cache/ di folder ini)
+    - scene: scene tujuan (default: scene aktif)
+
+    Returns: return value builder (datablock diganti dengan hasil append saat hit)
+    """
+
+    scene = scene or bpy.context.scene
+    key = snapshot_key(builder, args, kwargs)
+    blend_path, manifest_path = snapshot_paths(builder, key, cache_dir)
+
+    manifest = _read_manifest(manifest_path, key) if os.path.exists(blend_path) else None
+    if manifest is not None:
+        scene_reset.reset_scene(scene=scene)
+        loaded = load_snapshot(blend_path, manifest, scene)
+        print(f"📸 Snapshot dimuat: {os.path.basename(blend_path)} "
+              f"({len(manifest['objects'])} objek, {len(manifest['materials'])} material)")
+        return _decode(manifest['result'], loaded)
+
+    result = builder(*args, **kwargs)
+    manifest = write_snapshot(blend_path, manifest_path, scene, result, key)
+    print(f"📸 Snapshot disimpan: {os.path.basename(blend_path)} "
+          f"({len(manifest['objects'])} objek, {len(manifest['materials'])} material)")
+    return result
+
+def cached_scene(builder=None, cache_dir=None):
+    """
+    Decorator agar builder scene memakai snapshot
+
+    Bisa dipakai sebagai @cached_scene atau @cached_scene(cache_dir=...)
+    """
+
+    def decorate(func):
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            return run_cached(func, *args, cache_dir=cache_dir, **kwargs)
+        return wrapper
+
+    if builder is None:
+        return decorate
+    return decorate(builder)
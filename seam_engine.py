@@ -0,0 +1,164 @@
+"""
+Seam Engine: menandai UV seam tanpa Edit Mode dan tanpa bpy.ops
+Sudut dihedral semua edge dihitung sekaligus dari normal polygon (NumPy),
+lalu flag seam ditulis dengan foreach_set
+
+Kriteria seam yang didukung:
+- angle: sudut antar face lebih besar dari batas (derajat)
+- material_boundary: dua face memakai material index berbeda
+- uv_border: edge berada di batas UV island (UV kedua sisi tidak sama)
+- curvature: sudut per panjang edge (radian per unit) lebih besar dari batas
+- boundary: edge terbuka (hanya punya satu face)
+
+Perhitungan inti (compute_seams) hanya butuh array NumPy, sehingga bisa
+dijalankan di worker background atau subprocess tanpa konteks operator.
+"""
+
+import math
+
+import numpy as np
+
+import bpy
+
+def read_mesh_arrays(mesh, uv_layer=None):
+    """
+    Membaca data mesh yang dibutuhkan compute_seams menjadi dict array
+
+    Buffer memakai tipe raw RNA (float32/int32) supaya foreach_get menyalin
+    sekaligus; array float lalu dinaikkan ke float64 untuk compute_seams.
+    """
+
+    def get(collection, attr, dtype, width=1):
+        out = np.empty(len(collection) * width, dtype=dtype)
+        collection.foreach_get(attr, out)
+        if dtype == np.float32:
+            out = out.astype(np.float64)
+        return out.reshape(-1, width) if width > 1 else out
+
+    arrays = {
+        'co': get(mesh.vertices, "co", np.float32, 3),
+        'edge_vertices': get(mesh.edges, "vertices", np.int32, 2),
+        'loop_vertices': get(mesh.loops, "vertex_index", np.int32),
+        'loop_edges': get(mesh.loops, "edge_index", np.int32),
+        'loop_starts': get(mesh.polygons, "loop_start", np.int32),
+        'loop_totals': get(mesh.polygons, "loop_total", np.int32),
+        'normals': get(mesh.polygons, "normal", np.float32, 3),
+        'material_indices': get(mesh.polygons, "material_index", np.int32),
+        'uvs': None,
+    }
+
+    layer = mesh.uv_layers.get(uv_layer) if uv_layer else mesh.uv_layers.active
+    if layer is not None:
+        arrays['uvs'] = get(layer.data, "uv", np.float32, 2)
+    return arrays
+
+def edge_face_pairs(loop_edges, edge_count):
+    """
+    Pasangan loop untuk setiap edge
+
+    Returns: (jumlah face per edge (E,), index edge manifold (M,),
+              loop sisi A (M,), loop sisi B (M,))
+    """
+
+    order = np.argsort(loop_edges, kind='stable')
+    counts = np.bincount(loop_edges, minlength=edge_count)
+    starts = np.concatenate([[0], np.cumsum(counts)[:-1]])
+
+    manifold = np.nonzero(counts == 2)[0]
+    return counts, manifold, order[starts[manifold]], order[starts[manifold] + 1]
+
+def compute_seams(arrays, angle=30, material_boundary=False, uv_border=False,
+                  curvature=None, boundary=False, uv_epsilon=1e-5):
+    """
+    Menghitung mask seam (bool per edge) dari array mesh
+
+    Parameters:
+    - arrays: dict dari read_mesh_arrays
+    - angle: batas sudut dihedral dalam derajat (None = tidak dipakai)
+    - material_boundary: seam di batas material
+    - uv_border: seam di batas UV island (butuh arrays['uvs'])
+    - curvature: batas sudut per panjang edge, radian/unit (None = tidak dipakai)
+    - boundary: seam di edge terbuka
+    """
+
+    edge_count = len(arrays['edge_vertices'])
+    seams = np.zeros(edge_count, dtype=bool)
+    if edge_count == 0:
+        return seams
+
+    loop_starts, loop_totals = arrays['loop_starts'], arrays['loop_totals']
+    loop_polygons = np.repeat(np.arange(len(loop_starts)), loop_totals)
+    counts, edges, loop_a, loop_b = edge_face_pairs(arrays['loop_edges'], edge_count)
+    face_a, face_b = loop_polygons[loop_a], loop_polygons[loop_b]
+
+    # Sudut dihedral dari normal kedua face
+    normals = arrays['normals']
+    cos_angle = np.einsum('ij,ij->i', normals[face_a], normals[face_b])
+    dihedral = np.arccos(np.clip(cos_angle, -1.0, 1.0))
+
+    if angle is not None:
+        seams[edges[dihedral > math.radians(angle)]] = True
+
+    if curvature is not None:
+        co = arrays['co']
+        ends = arrays['edge_vertices'][edges]
+        length = np.linalg.norm(co[ends[:, 0]] - co[ends[:, 1]], axis=1)
+        bend = np.divide(dihedral, length, out=np.zeros_like(dihedral), where=length > 0)
+        seams[edges[bend > curvature]] = True
+
+    if material_boundary:
+        material = arrays['material_indices']
+        seams[edges[material[face_a] != material[face_b]]] = True
+
+    if uv_border and arrays.get('uvs') is not None:
+        uvs = arrays['uvs']
+        loop_vertices = arrays['loop_vertices']
+        nxt = np.arange(len(loop_vertices)) + 1
+        nxt[loop_starts + loop_totals - 1] = loop_starts
+
+        # Cocokkan ujung edge: winding normal membuat arah B berlawanan dengan A
+        same_direction = loop_vertices[loop_a] == loop_vertices[loop_b]
+        b_start = np.where(same_direction, loop_b, nxt[loop_b])
+        b_end = np.where(same_direction, nxt[loop_b], loop_b)
+        differs = (np.abs(uvs[loop_a] - uvs[b_start]).max(axis=1) > uv_epsilon) | \
+                  (np.abs(uvs[nxt[loop_a]] - uvs[b_end]).max(axis=1) > uv_epsilon)
+        seams[edges[differs]] = True
+
+    if boundary:
+        seams[counts == 1] = True
+
+    return seams
+
+def mark_seams(target, angle=30, material_boundary=False, uv_border=False,
+               curvature=None, boundary=False, clear=True):
+    """
+    Menandai seam pada mesh tanpa operator (harus di Object Mode)
+
+    Parameters:
+    - target: Blender object (mesh) atau mesh datablock
+    - clear: True = ganti seam lama, False = tambahkan ke seam yang sudah ada
+    - parameter lain: lihat compute_seams
+
+    Returns: jumlah edge yang menjadi seam
+    """
+
+    if isinstance(target, bpy.types.Object):
+        if target.type != 'MESH':
+            raise TypeError(f"Objek '{target.name}' bukan mesh")
+        if target.mode == 'EDIT':
+            raise RuntimeError(f"Objek '{target.name}' sedang di Edit Mode, kembali ke Object Mode dulu")
+        mesh = target.data
+    else:
+        mesh = target
+
+    seams = compute_seams(read_mesh_arrays(mesh), angle, material_boundary, uv_border,
+                          curvature, boundary)
+
+    if not clear:
+        existing = np.empty(len(mesh.edges), dtype=bool)
+        mesh.edges.foreach_get("use_seam", existing)
+        seams |= existing
+
+    mesh.edges.foreach_set("use_seam", seams)
+    mesh.update()
+    return int(np.count_nonzero(seams))
@@ -12,8 +12,29 @@ Demo ini mencakup:
 Tested dan bekerja dengan Blender 3.x/4.x
 """
 
+import os
+import sys
+
 import bpy
 
+# Pastikan modul pendukung (material_cache, dll) di folder ini bisa di-import
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+if SCRIPT_DIR not in sys.path:
+    sys.path.append(SCRIPT_DIR)
+
+import instrumentation
+import material_assign
+import material_batch
+import material_cache
+import mesh_primitives
+import scene_reset
+import scene_snapshot
+
+# Simpan scene hasil main() ke snapshot_cache/ dan muat ulang dari sana di run
+# berikutnya selama source dan versi Blender tidak berubah (scene_snapshot)
+SNAPSHOT = False
+
+@instrumentation.traced
 def create_basic_material():
     """Membuat material dasar dengan Principled BSDF"""
     
@@ -44,99 +65,83 @@ def create_basic_material():
     print("Material berhasil dibuat!")
     return material
 
+@instrumentation.traced
 def set_material_properties():
     """Mengatur properti material"""
     
     # Ambil material yang sudah ada
     mat = bpy.data.materials["Material_Saya"]
     
-    # Dapatkan Principled BSDF node
-    bsdf = mat.node_tree.nodes["Principled BSDF"]
-    
-    # Set Base Color (RGB + Alpha)
-    bsdf.inputs['Base Color'].default_value = (0.8, 0.2, 0.2, 1.0)
-    
-    # Set Metallic (0.0 - 1.0)
-    bsdf.inputs['Metallic'].default_value = 0.0
-    
-    # Set Roughness (0.0 - 1.0)
-    bsdf.inputs['Roughness'].default_value = 0.3
-    
-    # Note: 'Specular' parameter mungkin berbeda di versi Blender yang berbeda
-    # Untuk Blender 4.x, gunakan 'Specular IOR Level' atau skip jika tidak ada
+    # Set semua input Principled BSDF sekaligus (nilai yang sama dilewati,
+    # material di-tag untuk update shader sekali saja)
+    material_batch.set_properties(mat, {
+        # Base Color (RGB + Alpha)
+        'Base Color': (0.8, 0.2, 0.2, 1.0),
+        # Metallic (0.0 - 1.0)
+        'Metallic': 0.0,
+        # Roughness (0.0 - 1.0)
+        'Roughness': 0.3,
+        # Specular (nama 4.x; di Blender 3.x otomatis jadi 'Specular')
+        'Specular IOR Level': 0.5,
+    })
     
     print("Properti material berhasil diatur!")
 
+@material_cache.cached_material
+@instrumentation.traced
 def create_metal_material(name, color, roughness):
     """Membuat material metal dengan warna dan roughness tertentu"""
     mat = bpy.data.materials.new(name=name)
     mat.use_nodes = True
     
-    bsdf = mat.node_tree.nodes["Principled BSDF"]
-    bsdf.inputs['Base Color'].default_value = color
-    bsdf.inputs['Metallic'].default_value = 1.0  # Metal penuh
-    bsdf.inputs['Roughness'].default_value = roughness
+    material_batch.set_properties(mat, {
+        'Base Color': color,
+        'Metallic': 1.0,  # Metal penuh
+        'Roughness': roughness,
+    })
     
     return mat
 
+@material_cache.cached_material
+@instrumentation.traced
 def create_plastic_material(name, color, roughness):
     """Membuat material plastic/non-metal"""
     mat = bpy.data.materials.new(name=name)
     mat.use_nodes = True
     
-    bsdf = mat.node_tree.nodes["Principled BSDF"]
-    bsdf.inputs['Base Color'].default_value = color
-    bsdf.inputs['Metallic'].default_value = 0.0  # Non-metal
-    bsdf.inputs['Roughness'].default_value = roughness
+    material_batch.set_properties(mat, {
+        'Base Color': color,
+        'Metallic': 0.0,  # Non-metal
+        'Roughness': roughness,
+    })
     
     return mat
 
 def assign_material_to_object(obj_name, material_name):
-    """Assign material ke objek"""
+    """
+    Assign material ke objek
+    Untuk banyak objek sekaligus gunakan material_assign.assign_materials
+    """
     
-    # Pilih objek berdasarkan nama
-    obj = bpy.data.objects.get(obj_name)
-    if not obj:
-        print(f"Objek '{obj_name}' tidak ditemukan!")
-        return
-    
-    # Dapatkan atau buat material
-    mat = bpy.data.materials.get(material_name)
-    if mat is None:
-        print(f"Material '{material_name}' tidak ditemukan!")
-        return
-    
-    # Assign material ke objek
-    if obj.data.materials:
-        # Jika objek sudah punya material, replace yang pertama
-        obj.data.materials[0] = mat
-    else:
-        # Jika objek belum punya material, tambahkan
-        obj.data.materials.append(mat)
-    
-    print(f"Material '{mat.name}' berhasil di-assign ke '{obj.name}'")
+    # Replace slot pertama, atau tambahkan jika objek belum punya material
+    material_assign.assign_materials({obj_name: material_name})
 
+@instrumentation.traced
 def create_demo_objects():
     """Membuat objek-objek demo untuk testing material"""
     
     # Hapus semua objek yang sudah ada (opsional, hati-hati!)
-    bpy.ops.object.select_all(action='SELECT')
-    bpy.ops.object.delete()
+    # Mesh, material dan image yang jadi yatim ikut dibersihkan
+    scene_reset.reset_scene()
     
     # Buat Cube
-    bpy.ops.mesh.primitive_cube_add(size=2, location=(-4, 0, 0))
-    cube = bpy.context.active_object
-    cube.name = "Demo_Cube"
+    cube = mesh_primitives.create_primitive('cube', "Demo_Cube", size=2, location=(-4, 0, 0))
     
     # Buat Sphere
-    bpy.ops.mesh.primitive_uv_sphere_add(radius=1, location=(0, 0, 0))
-    sphere = bpy.context.active_object
-    sphere.name = "Demo_Sphere"
+    sphere = mesh_primitives.create_primitive('uv_sphere', "Demo_Sphere", radius=1, location=(0, 0, 0))
     
     # Buat Cylinder
-    bpy.ops.mesh.primitive_cylinder_add(radius=1, depth=2, location=(4, 0, 0))
-    cylinder = bpy.context.active_object
-    cylinder.name = "Demo_Cylinder"
+    cylinder = mesh_primitives.create_primitive('cylinder', "Demo_Cylinder", radius=1, depth=2, location=(4, 0, 0))
     
     print("✓ Objek demo berhasil dibuat!")
     print(f"  - Cube: {cube.name} at {cube.location}")
@@ -145,13 +150,12 @@ def create_demo_objects():
     
     return cube, sphere, cylinder
 
+@instrumentation.traced
 def setup_lighting():
     """Setup lighting untuk melihat material lebih baik"""
     
-    # Hapus light yang ada
-    for obj in bpy.data.objects:
-        if obj.type == 'LIGHT':
-            bpy.data.objects.remove(obj, do_unlink=True)
+    # Hapus light yang ada (beserta light data-nya)
+    scene_reset.remove_objects([obj for obj in bpy.data.objects if obj.type == 'LIGHT'])
     
     # Tambahkan Sun light
     bpy.ops.object.light_add(type='SUN', location=(5, 5, 10))
@@ -161,13 +165,12 @@ def setup_lighting():
     
     print("✓ Sun light ditambahkan")
 
+@instrumentation.traced
 def setup_camera():
     """Setup camera untuk view yang lebih baik"""
     
-    # Hapus camera yang ada
-    for obj in bpy.data.objects:
-        if obj.type == 'CAMERA':
-            bpy.data.objects.remove(obj, do_unlink=True)
+    # Hapus camera yang ada (beserta camera data-nya)
+    scene_reset.remove_objects([obj for obj in bpy.data.objects if obj.type == 'CAMERA'])
     
     # Tambahkan camera baru
     bpy.ops.object.camera_add(location=(8, -8, 5))
@@ -180,9 +183,15 @@ def setup_camera():
     
     print("✓ Camera diatur")
 
+@instrumentation.traced
 def setup_viewport_shading():
     """Set viewport shading ke Material Preview"""
     
+    # Mode background (blender -b) tidak punya screen/viewport
+    if bpy.context.screen is None:
+        print("✓ Mode background, viewport shading dilewati")
+        return
+    
     for area in bpy.context.screen.areas:
         if area.type == 'VIEW_3D':
             for space in area.spaces:
@@ -225,6 +234,7 @@ def print_material_info():
                 print(f"     - Roughness: {rough:.1f}")
                 print(f"     - Description: {desc}\n")
 
+@instrumentation.traced
 def main():
     """Fungsi utama untuk menjalankan demo"""
     
@@ -248,9 +258,11 @@ def main():
     print("✓ Material 'Plastic_Red' berhasil dibuat!")
     
     print("\n6. Assign material ke objek...")
-    assign_material_to_object("Demo_Cube", "Material_Saya")
-    assign_material_to_object("Demo_Sphere", "Gold")
-    assign_material_to_object("Demo_Cylinder", "Plastic_Red")
+    material_assign.assign_materials({
+        cube: basic_mat,
+        sphere: gold,
+        cylinder: plastic_red,
+    })
     
     print("\n7. Setup lighting dan camera...")
     setup_lighting()
@@ -261,6 +273,7 @@ def main():
     
     # Cetak ringkasan
     print_material_info()
+    material_cache.print_cache_stats()
     
     print("\n✅ DEMO BERHASIL!")
     print("💡 Tips:")
@@ -271,4 +284,8 @@ def main():
 
 # Jalankan fungsi utama
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    if SNAPSHOT:
+        scene_snapshot.run_cached(main)
+    else:
+        main()
+    instrumentation.print_report()
\ No newline at end of file
@@ -5,105 +5,145 @@ Dapat langsung dijalankan di Blender (Scripting > Run Script)
 
 import bpy
 import os
+import sys
 
-def create_pbr_material(name, textures_dict):
+# Pastikan modul pendukung (material_graph, dll) di folder ini bisa di-import
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+if SCRIPT_DIR not in sys.path:
+    sys.path.append(SCRIPT_DIR)
+
+import image_registry
+import instrumentation
+import material_assign
+import material_graph
+import mesh_primitives
+import scene_reset
+import scene_snapshot
+import texture_library
+
+# Folder texture library PBR (kosong = tidak dipakai) dan file index-nya
+TEXTURE_LIBRARY = ""
+TEXTURE_INDEX = os.path.join(SCRIPT_DIR, "texture_index.sqlite")
+
+# Simpan scene hasil main() ke snapshot_cache/ dan muat ulang dari sana di run
+# berikutnya selama source dan versi Blender tidak berubah (scene_snapshot)
+SNAPSHOT = False
+
+def pbr_spec(textures_dict):
     """
-    Membuat PBR material lengkap dengan multiple texture maps
-    
-    textures_dict format:
-    {
-        'base_color': 'path/to/color.jpg',
-        'normal': 'path/to/normal.png',
-        'roughness': 'path/to/roughness.jpg',
-        'metallic': 'path/to/metallic.jpg'
-    }
+    Menyusun node graph PBR dari textures_dict
+    Hanya map yang ada di textures_dict yang dibuatkan node-nya
     """
     
-    # Buat material baru
-    mat = bpy.data.materials.new(name=name)
-    mat.use_nodes = True
-    
-    nodes = mat.node_tree.nodes
-    links = mat.node_tree.links
-    
-    # Clear default nodes
-    nodes.clear()
-    
     # Buat Principled BSDF dan Material Output
-    bsdf = nodes.new('ShaderNodeBsdfPrincipled')
-    bsdf.location = (0, 0)
-    
-    output = nodes.new('ShaderNodeOutputMaterial')
-    output.location = (400, 0)
-    
-    links.new(bsdf.outputs['BSDF'], output.inputs['Surface'])
+    nodes = {
+        'bsdf': {'type': 'ShaderNodeBsdfPrincipled', 'location': (0, 0)},
+        'output': {'type': 'ShaderNodeOutputMaterial', 'location': (400, 0)},
+    }
+    links = [('bsdf', 'BSDF', 'output', 'Surface')]
     
     y_offset = 400
     
     # Base Color
     if 'base_color' in textures_dict:
-        tex = nodes.new('ShaderNodeTexImage')
-        tex.location = (-400, y_offset)
-        tex.image = bpy.data.images.load(textures_dict['base_color'])
-        tex.image.colorspace_settings.name = 'sRGB'
-        links.new(tex.outputs['Color'], bsdf.inputs['Base Color'])
+        nodes['base_color'] = {
+            'type': 'ShaderNodeTexImage',
+            'location': (-400, y_offset),
+            'image': textures_dict['base_color'],
+            'colorspace': 'sRGB',
+        }
+        links.append(('base_color', 'Color', 'bsdf', 'Base Color'))
         y_offset -= 300
     
     # Normal Map
     if 'normal' in textures_dict:
-        tex = nodes.new('ShaderNodeTexImage')
-        tex.location = (-700, y_offset)
-        tex.image = bpy.data.images.load(textures_dict['normal'])
-        tex.image.colorspace_settings.name = 'Non-Color'
-        
-        normal_map = nodes.new('ShaderNodeNormalMap')
-        normal_map.location = (-400, y_offset)
-        
-        links.new(tex.outputs['Color'], normal_map.inputs['Color'])
-        links.new(normal_map.outputs['Normal'], bsdf.inputs['Normal'])
+        nodes['normal'] = {
+            'type': 'ShaderNodeTexImage',
+            'location': (-700, y_offset),
+            'image': textures_dict['normal'],
+            'colorspace': 'Non-Color',
+        }
+        nodes['normal_map'] = {'type': 'ShaderNodeNormalMap', 'location': (-400, y_offset)}
+        links.append(('normal', 'Color', 'normal_map', 'Color'))
+        links.append(('normal_map', 'Normal', 'bsdf', 'Normal'))
         y_offset -= 300
     
     # Roughness
     if 'roughness' in textures_dict:
-        tex = nodes.new('ShaderNodeTexImage')
-        tex.location = (-400, y_offset)
-        tex.image = bpy.data.images.load(textures_dict['roughness'])
-        tex.image.colorspace_settings.name = 'Non-Color'
-        links.new(tex.outputs['Color'], bsdf.inputs['Roughness'])
+        nodes['roughness'] = {
+            'type': 'ShaderNodeTexImage',
+            'location': (-400, y_offset),
+            'image': textures_dict['roughness'],
+            'colorspace': 'Non-Color',
+        }
+        links.append(('roughness', 'Color', 'bsdf', 'Roughness'))
         y_offset -= 300
     
     # Metallic
     if 'metallic' in textures_dict:
-        tex = nodes.new('ShaderNodeTexImage')
-        tex.location = (-400, y_offset)
-        tex.image = bpy.data.images.load(textures_dict['metallic'])
-        tex.image.colorspace_settings.name = 'Non-Color'
-        links.new(tex.outputs['Color'], bsdf.inputs['Metallic'])
+        nodes['metallic'] = {
+            'type': 'ShaderNodeTexImage',
+            'location': (-400, y_offset),
+            'image': textures_dict['metallic'],
+            'colorspace': 'Non-Color',
+        }
+        links.append(('metallic', 'Color', 'bsdf', 'Metallic'))
+        y_offset -= 300
+    
+    # Displacement (height map)
+    if 'displacement' in textures_dict:
+        nodes['displacement_tex'] = {
+            'type': 'ShaderNodeTexImage',
+            'location': (-400, y_offset),
+            'image': textures_dict['displacement'],
+            'colorspace': 'Non-Color',
+        }
+        nodes['displacement'] = {'type': 'ShaderNodeDisplacement', 'location': (100, -400)}
+        links.append(('displacement_tex', 'Color', 'displacement', 'Height'))
+        links.append(('displacement', 'Displacement', 'output', 'Displacement'))
+    
+    return {'nodes': nodes, 'links': links}
+
+@instrumentation.traced
+def create_pbr_material(name, textures_dict):
+    """
+    Membuat PBR material lengkap dengan multiple texture maps
+    
+    textures_dict format:
+    {
+        'base_color': 'path/to/color.jpg',
+        'normal': 'path/to/normal.png',
+        'roughness': 'path/to/roughness.jpg',
+        'metallic': 'path/to/metallic.jpg',
+        'displacement': 'path/to/height.png'
+    }
+    """
+    
+    # Baca semua file texture paralel dulu, datablock image di-dedup registry
+    # Texture yang tidak ditemukan dilewati (node-nya tidak dibuat)
+    missing = set(image_registry.prefetch(textures_dict.values()))
+    textures_dict = {channel: path for channel, path in textures_dict.items()
+                     if path and image_registry.resolve_path(path) not in missing}
+    mat = material_graph.build_material(pbr_spec(textures_dict), name)
     
     print(f"🎨 PBR Material '{name}' berhasil dibuat!")
     return mat
 
+@instrumentation.traced
 def create_demo_objects():
     """Membuat objek-objek demo untuk testing texture"""
     
     # Hapus objek yang sudah ada (opsional)
-    bpy.ops.object.select_all(action='SELECT')
-    bpy.ops.object.delete()
-    
-    # Buat Plane untuk texture demo
-    bpy.ops.mesh.primitive_plane_add(size=4, location=(0, 0, 0))
-    plane = bpy.context.active_object
-    plane.name = "Demo_Plane"
+    # Mesh, material dan image yang jadi yatim ikut dibersihkan
+    scene_reset.reset_scene()
     
-    # Tambahkan UV untuk plane
-    bpy.ops.object.mode_set(mode='EDIT')
-    bpy.ops.mesh.select_all(action='SELECT')
-    bpy.ops.uv.unwrap()
-    bpy.ops.object.mode_set(mode='OBJECT')
+    # Buat Plane untuk texture demo (UV map langsung ikut dibuat)
+    plane = mesh_primitives.create_primitive('plane', "Demo_Plane", size=4, location=(0, 0, 0))
     
     print("📦 Objek demo berhasil dibuat!")
     return plane
 
+@instrumentation.traced
 def create_procedural_checker_material():
     """Membuat material checker procedural untuk demo"""
     
@@ -136,6 +176,7 @@ def create_procedural_checker_material():
     print("♟️ Procedural checker material berhasil dibuat!")
     return mat
 
+@instrumentation.traced
 def main():
     """Fungsi utama untuk menjalankan demo"""
     
@@ -160,11 +201,17 @@ def main():
     # }
     # wood_mat = create_pbr_material("Wood_PBR", textures)
     
+    # Atau biarkan texture_library mencari set PBR (wood_color, wood_normal, ...)
+    if TEXTURE_LIBRARY:
+        index = texture_library.TextureIndex(TEXTURE_INDEX)
+        result = index.scan(TEXTURE_LIBRARY)
+        print(f"📚 {result['files']} texture di-scan, {result['updated']} diperbarui")
+        for mat in texture_library.iter_materials(index, create_pbr_material, limit=10):
+            print(f"   - {mat.name}")
+        index.close()
+    
     print("\n4. 🎯 Assign checker material ke objek demo...")
-    if plane.data.materials:
-        plane.data.materials[0] = checker_mat
-    else:
-        plane.data.materials.append(checker_mat)
+    material_assign.assign_materials({plane: checker_mat})
     
     print("\n✅ === Demo selesai! ===")
     print(f"✅ Plane '{plane.name}' dibuat dengan UV unwrap")
@@ -179,4 +226,8 @@ def main():
 
 # Jalankan fungsi utama
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    if SNAPSHOT:
+        scene_snapshot.run_cached(main)
+    else:
+        main()
+    instrumentation.print_report()
\ No newline at end of file
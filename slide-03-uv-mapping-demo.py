@@ -3,29 +3,47 @@ Blender Python Script untuk Demo UV Mapping
 Dapat langsung dijalankan di Blender (Scripting > Run Script)
 """
 
+import math
+import os
+import sys
+
 import bpy
 import bmesh
 
+# Pastikan modul pendukung (mesh_primitives, dll) di folder ini bisa di-import
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+if SCRIPT_DIR not in sys.path:
+    sys.path.append(SCRIPT_DIR)
+
+import instrumentation
+import material_assign
+import mesh_primitives
+import scene_reset
+import scene_snapshot
+import seam_engine
+import uv_analytics
+import uv_batch
+
+# Simpan scene hasil main() ke snapshot_cache/ dan muat ulang dari sana di run
+# berikutnya selama source dan versi Blender tidak berubah (scene_snapshot)
+SNAPSHOT = False
+
+@instrumentation.traced
 def create_demo_object():
     """Membuat objek demo untuk UV mapping"""
     
     # Hapus objek yang sudah ada (opsional)
-    bpy.ops.object.select_all(action='SELECT')
-    bpy.ops.object.delete()
+    # Mesh, material dan image yang jadi yatim ikut dibersihkan
+    scene_reset.reset_scene()
     
     # Buat objek yang lebih kompleks untuk demo UV mapping
-    bpy.ops.mesh.primitive_cube_add(size=2, location=(0, 0, 0))
-    obj = bpy.context.active_object
-    obj.name = "UV_Demo_Object"
-    
-    # Subdivide untuk membuat lebih banyak faces
-    bpy.ops.object.mode_set(mode='EDIT')
-    bpy.ops.mesh.subdivide(number_cuts=2)
-    bpy.ops.object.mode_set(mode='OBJECT')
+    # cuts=2 sama dengan subdivide(number_cuts=2) untuk membuat lebih banyak faces
+    obj = mesh_primitives.create_primitive('cube', "UV_Demo_Object", size=2, cuts=2, location=(0, 0, 0))
     
     print("📦 Objek demo berhasil dibuat!")
     return obj
 
+@instrumentation.traced
 def smart_uv_project(obj, angle_limit=66, island_margin=0.02):
     """
     Melakukan Smart UV Project pada objek
@@ -53,7 +71,7 @@ def smart_uv_project(obj, angle_limit=66, island_margin=0.02):
     
     # Jalankan Smart UV Project
     bpy.ops.uv.smart_project(
-        angle_limit=angle_limit * (3.14159 / 180),  # Convert ke radians
+        angle_limit=math.radians(angle_limit),  # Convert ke radians
         island_margin=island_margin,
         area_weight=0.0,
         correct_aspect=True,
@@ -65,6 +83,7 @@ def smart_uv_project(obj, angle_limit=66, island_margin=0.02):
     
     print(f"🎯 Smart UV Project selesai untuk '{obj.name}'")
 
+@instrumentation.traced
 def cube_projection(obj, cube_size=1.0):
     """Melakukan Cube Projection UV mapping"""
     
@@ -89,6 +108,7 @@ def cube_projection(obj, cube_size=1.0):
     bpy.ops.object.mode_set(mode='OBJECT')
     print(f"🎲 Cube Projection selesai untuk '{obj.name}'")
 
+@instrumentation.traced
 def mark_seams_by_angle(obj, angle=30):
     """
     Menandai seams berdasarkan sudut antar faces
@@ -98,23 +118,13 @@ def mark_seams_by_angle(obj, angle=30):
     if obj.type != 'MESH':
         return
     
-    bpy.context.view_layer.objects.active = obj
-    obj.select_set(True)
-    
-    # Edit Mode
-    bpy.ops.object.mode_set(mode='EDIT')
-    bpy.ops.mesh.select_all(action='SELECT')
-    
-    # Mark seams berdasarkan sudut
-    bpy.ops.uv.seams_from_islands()
+    # Mark seams dari batas UV island dan sudut antar faces sekaligus
+    # (dihitung dari normal polygon, tanpa Edit Mode / operator)
+    seam_count = seam_engine.mark_seams(obj, angle=angle, uv_border=True, clear=False)
     
-    # Atau gunakan edge angle
-    bpy.ops.mesh.edges_select_sharp(sharpness=angle * (3.14159 / 180))
-    bpy.ops.uv.mark_seam(clear=False)
-    
-    bpy.ops.object.mode_set(mode='OBJECT')
-    print("🔪 Seams berhasil ditandai!")
+    print(f"🔪 Seams berhasil ditandai! ({seam_count} edges)")
 
+@instrumentation.traced
 def unwrap_with_seams(obj):
     """Unwrap berdasarkan seams yang sudah ditandai"""
     
@@ -136,6 +146,7 @@ def unwrap_with_seams(obj):
     bpy.ops.object.mode_set(mode='OBJECT')
     print("📐 Unwrap selesai!")
 
+@instrumentation.traced
 def pack_uv_islands(obj, margin=0.02, rotate=True):
     """
     Mengatur ulang UV islands agar efisien menggunakan texture space
@@ -176,16 +187,17 @@ def print_uv_coordinates(obj):
         print("Objek tidak memiliki UV map!")
         return
     
-    # Dapatkan active UV layer
-    uv_layer = mesh.uv_layers.active.data
+    # Baca seluruh active UV layer sekaligus (foreach_get ke array NumPy)
+    uvs = uv_analytics.read_uvs(mesh)
     
     print(f"UV Coordinates untuk '{obj.name}':")
-    print(f"Total UV points: {len(uv_layer)}")
+    print(f"Total UV points: {len(uvs)}")
     
     # Print beberapa koordinat pertama
-    for i, uv in enumerate(uv_layer[:10]):
-        print(f"  UV[{i}]: U={uv.uv.x:.4f}, V={uv.uv.y:.4f}")
+    for i, (u, v) in enumerate(uvs[:10]):
+        print(f"  UV[{i}]: U={u:.4f}, V={v:.4f}")
 
+@instrumentation.traced
 def create_uv_checker_material():
     """
     Membuat material dengan checker pattern untuk validasi UV
@@ -221,6 +233,7 @@ def create_uv_checker_material():
     print("♟️ UV Checker material berhasil dibuat!")
     return mat
 
+@instrumentation.traced
 def main():
     """Fungsi utama untuk menjalankan demo"""
     
@@ -232,40 +245,29 @@ def main():
     checker_mat = create_uv_checker_material()
     
     print("\n3. 🎨 Assign checker material ke objek...")
-    if obj.data.materials:
-        obj.data.materials[0] = checker_mat
-    else:
-        obj.data.materials.append(checker_mat)
+    material_assign.assign_materials({obj: checker_mat})
     
     print("\n4. 🎯 Melakukan Smart UV Project...")
     smart_uv_project(obj, angle_limit=66, island_margin=0.02)
     
     print("\n5. 📊 Print UV coordinates...")
     print_uv_coordinates(obj)
+    uv_analytics.print_uv_report(uv_analytics.uv_report(obj))
     
     print("\n6. 🔄 Mencoba metode UV mapping lain...")
     
-    # Reset UV
-    bpy.ops.object.mode_set(mode='EDIT')
-    bpy.ops.mesh.select_all(action='SELECT')
-    bpy.ops.uv.reset()
-    bpy.ops.object.mode_set(mode='OBJECT')
-    
+    # Reset + projection dijalankan dalam satu sesi Edit Mode
     print("\n   a. 🎲 Cube Projection...")
-    cube_projection(obj)
+    uv_batch.batch_unwrap([obj], ['reset', ('cube_project', {'cube_size': 1.0})])
     
-    # Reset UV lagi
-    bpy.ops.object.mode_set(mode='EDIT')
-    bpy.ops.mesh.select_all(action='SELECT')
-    bpy.ops.uv.reset()
-    bpy.ops.object.mode_set(mode='OBJECT')
-    
-    print("\n   b. 🔪 Mark seams dan unwrap...")
-    mark_seams_by_angle(obj, angle=30)
-    unwrap_with_seams(obj)
-    
-    print("\n   c. 📦 Pack UV islands...")
-    pack_uv_islands(obj, margin=0.02, rotate=True)
+    # Reset, seams, unwrap dan pack juga cukup satu kali masuk Edit Mode
+    print("\n   b. 🔪 Mark seams dan unwrap + c. 📦 Pack UV islands...")
+    uv_batch.batch_unwrap([obj], [
+        'reset',
+        ('seams_by_angle', {'angle': 30}),
+        ('unwrap', {'method': 'ANGLE_BASED', 'margin': 0.001}),
+        ('pack', {'margin': 0.02, 'rotate': True}),
+    ])
     
     print("\n✅ === Demo selesai! ===")
     print(f"✅ Objek '{obj.name}' memiliki {len(obj.data.polygons)} faces")
@@ -279,4 +281,8 @@ def main():
 
 # Jalankan fungsi utama
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    if SNAPSHOT:
+        scene_snapshot.run_cached(main)
+    else:
+        main()
+    instrumentation.print_report()
\ No newline at end of file
@@ -3,8 +3,36 @@ Blender Python Script untuk Demo Shader Editor & Node System
 Dapat langsung dijalankan di Blender (Scripting > Run Script)
 """
 
+import os
+import sys
+
 import bpy
 
+# Pastikan modul pendukung (material_graph, dll) di folder ini bisa di-import
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+if SCRIPT_DIR not in sys.path:
+    sys.path.append(SCRIPT_DIR)
+
+import blender_compat
+import instancing
+import instrumentation
+import material_assign
+import material_cache
+import material_graph
+import mesh_primitives
+import node_optimizer
+import scene_reset
+import scene_snapshot
+
+# True = objek demo dengan jenis dan parameter sama berbagi satu mesh (instancing);
+# bentuk demo di sini semuanya berbeda, jadi default-nya mesh sendiri per objek
+INSTANCING = False
+
+# Simpan scene hasil main() ke snapshot_cache/ dan muat ulang dari sana di run
+# berikutnya selama source dan versi Blender tidak berubah (scene_snapshot)
+SNAPSHOT = False
+
+@instrumentation.traced
 def create_basic_node_setup(mat_name):
     """Membuat material dengan node setup dasar"""
     
@@ -47,6 +75,7 @@ def create_basic_node_setup(mat_name):
     print(f"🎨 Material '{mat_name}' dengan node setup berhasil dibuat!")
     return mat
 
+@instrumentation.traced
 def add_colorramp_gradient(material):
     """
     Menambahkan ColorRamp untuk membuat gradient effect
@@ -91,6 +120,7 @@ def add_colorramp_gradient(material):
     print("🌈 ColorRamp gradient berhasil ditambahkan!")
     return True
 
+@instrumentation.traced
 def mix_two_textures(mat_name, mix_factor=0.5):
     """
     Membuat material yang me-mix dua texture
@@ -135,49 +165,51 @@ def mix_two_textures(mat_name, mix_factor=0.5):
     print(f"🎭 Mixed texture material '{mat_name}' berhasil dibuat!")
     return mat
 
+def glass_spec(color=(0.8, 0.9, 1.0, 1.0), ior=1.45):
+    """Node graph untuk glass material (Principled BSDF dengan transmission)"""
+    
+    return {
+        'nodes': {
+            # Principled BSDF dengan glass settings
+            'bsdf': {
+                'type': 'ShaderNodeBsdfPrincipled',
+                'location': (0, 0),
+                'inputs': {
+                    'Base Color': color,
+                    'Metallic': 0.0,
+                    'Roughness': 0.0,  # Smooth glass
+                    'IOR': ior,
+                    # Nama 4.x; di Blender 3.x otomatis jadi 'Transmission' (blender_compat)
+                    'Transmission Weight': 1.0,  # Fully transparent
+                },
+            },
+            'output': {'type': 'ShaderNodeOutputMaterial', 'location': (300, 0)},
+        },
+        'links': [
+            ('bsdf', 'BSDF', 'output', 'Surface'),
+        ],
+        # IMPORTANT: Enable blend mode untuk transparency
+        'material_props': {'blend_method': 'BLEND'},
+    }
+
+@material_cache.cached_material
+@instrumentation.traced
 def create_glass_material(name="Glass", color=(0.8, 0.9, 1.0, 1.0), ior=1.45):
     """
     Membuat realistic glass material
     IOR values: Air=1.0, Water=1.33, Glass=1.45, Diamond=2.42
     """
     
-    mat = bpy.data.materials.new(name=name)
-    mat.use_nodes = True
-    
-    nodes = mat.node_tree.nodes
-    links = mat.node_tree.links
-    nodes.clear()
-    
-    # Principled BSDF dengan glass settings
-    bsdf = nodes.new('ShaderNodeBsdfPrincipled')
-    bsdf.location = (0, 0)
+    mat = material_graph.build_material(glass_spec(color, ior), name)
     
-    # Set glass properties
-    bsdf.inputs['Base Color'].default_value = color
-    bsdf.inputs['Metallic'].default_value = 0.0
-    bsdf.inputs['Roughness'].default_value = 0.0  # Smooth glass
-    bsdf.inputs['IOR'].default_value = ior
-    # Note: Blender 4.x uses 'Transmission Weight' instead of 'Transmission'
-    transmission_input = 'Transmission Weight' if 'Transmission Weight' in bsdf.inputs else 'Transmission'
-    bsdf.inputs[transmission_input].default_value = 1.0  # Fully transparent
-    
-    # Material Output
-    output = nodes.new('ShaderNodeOutputMaterial')
-    output.location = (300, 0)
-    
-    links.new(bsdf.outputs['BSDF'], output.inputs['Surface'])
-    
-    # IMPORTANT: Enable blend mode untuk transparency
-    mat.blend_method = 'BLEND'
-    # Note: shadow_method removed in Blender 4.x, using transparent shadow instead
-    if hasattr(mat, 'shadow_method'):
-        mat.shadow_method = 'HASHED'
-    else:
-        mat.use_transparent_shadow = True
+    # shadow_method dihapus di Blender 4.2, diganti use_transparent_shadow
+    blender_compat.set_transparent_shadow(mat)
     
     print(f"🔮 Glass material '{name}' berhasil dibuat!")
     return mat
 
+@material_cache.cached_material
+@instrumentation.traced
 def create_emission_material(name="Emission", color=(1.0, 0.5, 0.0, 1.0), strength=10.0):
     """
     Membuat emission material (glowing/light-emitting)
@@ -206,6 +238,7 @@ def create_emission_material(name="Emission", color=(1.0, 0.5, 0.0, 1.0), streng
     print(f"💡 Emission material '{name}' berhasil dibuat!")
     return mat
 
+@instrumentation.traced
 def create_node_group_uv_scale(group_name="UV_Scale"):
     """
     Membuat node group untuk UV scaling yang dapat digunakan kembali
@@ -221,17 +254,10 @@ def create_node_group_uv_scale(group_name="UV_Scale"):
     group_outputs = group.nodes.new('NodeGroupOutput')
     group_outputs.location = (400, 0)
     
-    # Define inputs - use interface for Blender 4.x, inputs for 3.x
-    if hasattr(group, 'interface'):
-        # Blender 4.x
-        group.interface.new_socket('UV', in_out='INPUT', socket_type='NodeSocketVector')
-        group.interface.new_socket('Scale', in_out='INPUT', socket_type='NodeSocketFloat')
-        group.interface.new_socket('UV', in_out='OUTPUT', socket_type='NodeSocketVector')
-    else:
-        # Blender 3.x
-        group.inputs.new('NodeSocketVector', 'UV')
-        group.inputs.new('NodeSocketFloat', 'Scale')
-        group.outputs.new('NodeSocketVector', 'UV')
+    # Define inputs (interface di Blender 4.x, inputs/outputs di 3.x)
+    blender_compat.new_group_socket(group, 'UV', 'INPUT', 'NodeSocketVector')
+    blender_compat.new_group_socket(group, 'Scale', 'INPUT', 'NodeSocketFloat')
+    blender_compat.new_group_socket(group, 'UV', 'OUTPUT', 'NodeSocketVector')
     
     # Buat node di dalam group
     mapping = group.nodes.new('ShaderNodeMapping')
@@ -245,6 +271,7 @@ def create_node_group_uv_scale(group_name="UV_Scale"):
     print(f"🔧 Node Group '{group_name}' berhasil dibuat!")
     return group
 
+@instrumentation.traced
 def use_node_group(material, group_name):
     """Menggunakan node group dalam material"""
     
@@ -258,29 +285,25 @@ def use_node_group(material, group_name):
     print(f"📦 Node Group '{group_name}' ditambahkan ke material")
     return group_node
 
+@instrumentation.traced
 def create_demo_objects():
     """Membuat objek-objek demo untuk testing material"""
     
     # Hapus objek yang sudah ada (opsional)
-    bpy.ops.object.select_all(action='SELECT')
-    bpy.ops.object.delete()
+    # Mesh, material dan image yang jadi yatim ikut dibersihkan
+    scene_reset.reset_scene()
     
     # Buat beberapa objek untuk demo
-    bpy.ops.mesh.primitive_cube_add(size=2, location=(-4, 0, 0))
-    cube = bpy.context.active_object
-    cube.name = "Demo_Cube"
-    
-    bpy.ops.mesh.primitive_uv_sphere_add(radius=1, location=(0, 0, 0))
-    sphere = bpy.context.active_object
-    sphere.name = "Demo_Sphere"
-    
-    bpy.ops.mesh.primitive_cylinder_add(radius=1, depth=2, location=(4, 0, 0))
-    cylinder = bpy.context.active_object
-    cylinder.name = "Demo_Cylinder"
+    # Dengan INSTANCING, objek berulang (jenis dan parameter sama) berbagi satu mesh
+    create = instancing.create_instance if INSTANCING else mesh_primitives.create_primitive
+    cube = create('cube', "Demo_Cube", size=2, location=(-4, 0, 0))
+    sphere = create('uv_sphere', "Demo_Sphere", radius=1, location=(0, 0, 0))
+    cylinder = create('cylinder', "Demo_Cylinder", radius=1, depth=2, location=(4, 0, 0))
     
     print("📦 Objek demo berhasil dibuat!")
     return cube, sphere, cylinder
 
+@instrumentation.traced
 def main():
     """Fungsi utama untuk menjalankan demo"""
     
@@ -315,20 +338,15 @@ def main():
     
     print("\n9. 🎯 Assign materials ke objek...")
     # Assign materials ke objek
-    if cube.data.materials:
-        cube.data.materials[0] = basic_mat
-    else:
-        cube.data.materials.append(basic_mat)
+    material_assign.assign_materials({
+        cube: basic_mat,
+        sphere: glass,
+        cylinder: emission,
+    })
     
-    if sphere.data.materials:
-        sphere.data.materials[0] = glass
-    else:
-        sphere.data.materials.append(glass)
-    
-    if cylinder.data.materials:
-        cylinder.data.materials[0] = emission
-    else:
-        cylinder.data.materials.append(emission)
+    print("\n10. 🧹 Optimasi node tree...")
+    # Group_Material dilewati: node group-nya sengaja belum dihubungkan ke output
+    node_optimizer.print_report(node_optimizer.optimize_materials([basic_mat, gradient_mat, mixed, glass, emission]))
     
     print("\n✅ === Demo selesai! ===")
     print(f"✅ Cube: Material '{basic_mat.name}' dengan {len(basic_mat.node_tree.nodes)} nodes")
@@ -344,4 +362,8 @@ def main():
 
 # Jalankan fungsi utama
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    if SNAPSHOT:
+        scene_snapshot.run_cached(main)
+    else:
+        main()
+    instrumentation.print_report()
\ No newline at end of file
@@ -3,313 +3,279 @@ Blender Python Script untuk Demo Procedural Textures
 Dapat langsung dijalankan di Blender (Scripting > Run Script)
 """
 
+import os
+import sys
+
 import bpy
 
+# Pastikan modul pendukung (material_graph, dll) di folder ini bisa di-import
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+if SCRIPT_DIR not in sys.path:
+    sys.path.append(SCRIPT_DIR)
+
+import displacement_preview
+import instancing
+import instrumentation
+import material_assign
+import material_cache
+import material_graph
+import mesh_primitives
+import node_group_library
+import procedural_bake
+import scene_reset
+import scene_snapshot
+
+# Resolusi bake procedural texture (0 = tidak di-bake, material tetap procedural)
+BAKE_RESOLUTION = 0
+
+# True = objek demo dengan jenis dan parameter sama berbagi satu mesh (instancing);
+# bentuk demo di sini semuanya berbeda, jadi default-nya mesh sendiri per objek
+INSTANCING = False
+
+# Terapkan displacement rock ke vertex Demo_Grid (geometri nyata untuk collision/export)
+DISPLACE_PREVIEW = False
+
+# Simpan scene hasil main() ke snapshot_cache/ dan muat ulang dari sana di run
+# berikutnya selama source dan versi Blender tidak berubah (scene_snapshot)
+SNAPSHOT = False
+
+# Node group bersama (node_group_library) menggantikan chain yang berulang:
+# TexCoord -> Mapping, Noise -> ColorRamp, dan Noise -> Bump
+group_node = node_group_library.group_node
+
+# Node graph untuk procedural dirt/scratches
+DIRT_SPEC = {
+    'nodes': {
+        'uv': group_node('NG_UV_Scale', (-800, 0)),
+        # Noise -> ramp 0.3..0.7 langsung mencampur clean (A) dan dirt (B)
+        'dirt': group_node('NG_Noise_Ramp', (-500, 0), {
+            'Scale': 50.0, 'Detail': 15.0, 'Roughness': 0.7,
+            'Low': 0.3, 'High': 0.7,
+            'Color A': (0.8, 0.8, 0.8, 1.0),  # Clean white
+            'Color B': (0.2, 0.15, 0.1, 1.0),  # Brown dirt
+        }),
+        'bsdf': {
+            'type': 'ShaderNodeBsdfPrincipled',
+            'location': (100, 0),
+            'inputs': {'Roughness': 0.5},
+        },
+        'output': {'type': 'ShaderNodeOutputMaterial', 'location': (400, 0)},
+    },
+    'links': [
+        ('uv', 'Vector', 'dirt', 'Vector'),
+        ('dirt', 'Color', 'bsdf', 'Base Color'),
+        ('bsdf', 'BSDF', 'output', 'Surface'),
+    ],
+}
+
+# Node graph untuk batu (Voronoi + Noise + Bump)
+STONE_SPEC = {
+    'nodes': {
+        # Object coordinates dengan scale 5
+        'uv': group_node('NG_UV_Scale', (-800, 0), {'Scale': (5.0, 5.0, 5.0)}),
+        # Voronoi untuk pola stone
+        'voronoi': {
+            'type': 'ShaderNodeTexVoronoi',
+            'location': (-600, 0),
+            'props': {'feature': 'F1', 'distance': 'EUCLIDEAN'},  # Atau 'F2', 'DISTANCE_TO_EDGE'
+            'inputs': {'Scale': 3.0},
+        },
+        # Noise untuk variasi
+        'noise': {
+            'type': 'ShaderNodeTexNoise',
+            'location': (-600, -300),
+            'inputs': {'Scale': 10.0},
+        },
+        # Mix Voronoi dan Noise
+        'mix': {
+            'type': 'ShaderNodeMixRGB',
+            'location': (-400, 0),
+            'props': {'blend_type': 'MULTIPLY'},
+            'inputs': {'Fac': 1.0},
+        },
+        # Ramp untuk stone colors (gray variations)
+        'ramp': group_node('NG_Two_Tone', (-200, 0), {
+            'Color A': (0.3, 0.3, 0.35, 1.0),
+            'Color B': (0.6, 0.6, 0.65, 1.0),
+        }),
+        # Bump untuk surface detail
+        'bump': {
+            'type': 'ShaderNodeBump',
+            'location': (0, -200),
+            'inputs': {'Strength': 0.5},
+        },
+        'bsdf': {
+            'type': 'ShaderNodeBsdfPrincipled',
+            'location': (200, 0),
+            'inputs': {'Roughness': 0.8},
+        },
+        'output': {'type': 'ShaderNodeOutputMaterial', 'location': (500, 0)},
+    },
+    'links': [
+        ('uv', 'Vector', 'voronoi', 'Vector'),
+        ('uv', 'Vector', 'noise', 'Vector'),
+        ('voronoi', 'Distance', 'mix', 'Color1'),
+        ('noise', 'Fac', 'mix', 'Color2'),
+        ('mix', 'Color', 'ramp', 'Fac'),
+        ('ramp', 'Color', 'bsdf', 'Base Color'),
+        ('mix', 'Color', 'bump', 'Height'),
+        ('bump', 'Normal', 'bsdf', 'Normal'),
+        ('bsdf', 'BSDF', 'output', 'Surface'),
+    ],
+}
+
+# Node graph untuk kayu (Wave rings + Noise bump)
+WOOD_SPEC = {
+    'nodes': {
+        # Stretch di Z untuk rings
+        'uv': group_node('NG_UV_Scale', (-600, 0), {'Scale': (1.0, 1.0, 20.0)}),
+        # Wave Texture untuk wood rings
+        'wave': {
+            'type': 'ShaderNodeTexWave',
+            'location': (-400, 0),
+            'props': {'wave_type': 'RINGS', 'rings_direction': 'Z', 'wave_profile': 'SAW'},
+            'inputs': {'Scale': 15.0, 'Distortion': 2.0, 'Detail': 5.0},
+        },
+        # Ramp untuk wood colors (light to dark brown)
+        'ramp': group_node('NG_Two_Tone', (-200, 0), {
+            'Color A': (0.6, 0.4, 0.2, 1.0),
+            'Color B': (0.3, 0.2, 0.1, 1.0),
+        }),
+        # Noise bump untuk texture
+        'bump': group_node('NG_Noise_Bump', (0, -200), {
+            'Scale': 50.0, 'Detail': 10.0, 'Strength': 0.3,
+        }),
+        # Note: Specular removed in Blender 4.x, roughness controls appearance
+        'bsdf': {
+            'type': 'ShaderNodeBsdfPrincipled',
+            'location': (200, 0),
+            'inputs': {'Roughness': 0.4},
+        },
+        'output': {'type': 'ShaderNodeOutputMaterial', 'location': (500, 0)},
+    },
+    'links': [
+        ('uv', 'Vector', 'wave', 'Vector'),
+        ('wave', 'Color', 'ramp', 'Fac'),
+        ('ramp', 'Color', 'bsdf', 'Base Color'),
+        ('uv', 'Vector', 'bump', 'Vector'),
+        ('bump', 'Normal', 'bsdf', 'Normal'),
+        ('bsdf', 'BSDF', 'output', 'Surface'),
+    ],
+}
+
+# Node graph untuk rock (Noise fractal + Displacement)
+ROCK_SPEC = {
+    'nodes': {
+        'uv': group_node('NG_UV_Scale', (-800, 0)),
+        # Noise Texture dengan Detail/Roughness = fractal noise di semua versi
+        # (Musgrave dihapus di Blender 4.1, jadi tidak perlu cek versi)
+        # Ramp untuk rock colors (dark gray to light gray)
+        'noise': group_node('NG_Noise_Ramp', (-500, 0), {
+            'Scale': 5.0, 'Detail': 10.0, 'Roughness': 0.5,
+            'Color A': (0.15, 0.15, 0.15, 1.0),
+            'Color B': (0.5, 0.5, 0.5, 1.0),
+        }),
+        # Displacement untuk actual geometry displacement
+        'displacement': {
+            'type': 'ShaderNodeDisplacement',
+            'location': (200, -200),
+            'inputs': {'Scale': 0.1},
+        },
+        'bsdf': {
+            'type': 'ShaderNodeBsdfPrincipled',
+            'location': (200, 0),
+            'inputs': {'Roughness': 0.9},
+        },
+        'output': {'type': 'ShaderNodeOutputMaterial', 'location': (500, 0)},
+    },
+    'links': [
+        ('uv', 'Vector', 'noise', 'Vector'),
+        ('noise', 'Color', 'bsdf', 'Base Color'),
+        ('noise', 'Fac', 'displacement', 'Height'),
+        ('bsdf', 'BSDF', 'output', 'Surface'),
+        ('displacement', 'Displacement', 'output', 'Displacement'),
+    ],
+}
+
+@material_cache.cached_material
+@instrumentation.traced
 def create_dirt_material(name="Dirty_Surface"):
     """
     Membuat material dengan procedural dirt/scratches
     Menggunakan Noise texture untuk variasi
     """
     
-    mat = bpy.data.materials.new(name=name)
-    mat.use_nodes = True
-    
-    nodes = mat.node_tree.nodes
-    links = mat.node_tree.links
-    nodes.clear()
-    
-    # Texture Coordinate
-    tex_coord = nodes.new('ShaderNodeTexCoord')
-    tex_coord.location = (-800, 0)
-    
-    # Noise Texture untuk dirt
-    noise = nodes.new('ShaderNodeTexNoise')
-    noise.location = (-600, 0)
-    noise.inputs['Scale'].default_value = 50.0
-    noise.inputs['Detail'].default_value = 15.0
-    noise.inputs['Roughness'].default_value = 0.7
-    
-    # ColorRamp untuk control dirt intensity
-    colorramp = nodes.new('ShaderNodeValToRGB')
-    colorramp.location = (-400, 0)
-    colorramp.color_ramp.elements[0].position = 0.3
-    colorramp.color_ramp.elements[1].position = 0.7
-    
-    # Base color (clean surface)
-    rgb_clean = nodes.new('ShaderNodeRGB')
-    rgb_clean.location = (-400, 300)
-    rgb_clean.outputs[0].default_value = (0.8, 0.8, 0.8, 1.0)  # Clean white
-    
-    # Dirt color
-    rgb_dirt = nodes.new('ShaderNodeRGB')
-    rgb_dirt.location = (-400, 150)
-    rgb_dirt.outputs[0].default_value = (0.2, 0.15, 0.1, 1.0)  # Brown dirt
-    
-    # Mix clean and dirty colors
-    mix_rgb = nodes.new('ShaderNodeMixRGB')
-    mix_rgb.location = (-200, 200)
-    
-    # Principled BSDF
-    bsdf = nodes.new('ShaderNodeBsdfPrincipled')
-    bsdf.location = (100, 0)
-    bsdf.inputs['Roughness'].default_value = 0.5
-    
-    # Output
-    output = nodes.new('ShaderNodeOutputMaterial')
-    output.location = (400, 0)
-    
-    # Hubungkan semua
-    links.new(tex_coord.outputs['Object'], noise.inputs['Vector'])
-    links.new(noise.outputs['Fac'], colorramp.inputs['Fac'])
-    links.new(colorramp.outputs['Color'], mix_rgb.inputs['Fac'])
-    links.new(rgb_clean.outputs['Color'], mix_rgb.inputs['Color1'])
-    links.new(rgb_dirt.outputs['Color'], mix_rgb.inputs['Color2'])
-    links.new(mix_rgb.outputs['Color'], bsdf.inputs['Base Color'])
-    links.new(bsdf.outputs['BSDF'], output.inputs['Surface'])
+    node_group_library.ensure_for_spec(DIRT_SPEC)
+    mat = material_graph.build_material(DIRT_SPEC, name)
     
     print(f"🟤 Procedural dirt material '{name}' berhasil dibuat!")
     return mat
 
+@material_cache.cached_material
+@instrumentation.traced
 def create_stone_material(name="Procedural_Stone"):
     """
     Membuat material batu menggunakan Voronoi texture
     """
     
-    mat = bpy.data.materials.new(name=name)
-    mat.use_nodes = True
-    
-    nodes = mat.node_tree.nodes
-    links = mat.node_tree.links
-    nodes.clear()
-    
-    # Texture Coordinate
-    tex_coord = nodes.new('ShaderNodeTexCoord')
-    tex_coord.location = (-1000, 0)
-    
-    # Mapping untuk scale
-    mapping = nodes.new('ShaderNodeMapping')
-    mapping.location = (-800, 0)
-    mapping.inputs['Scale'].default_value = (5.0, 5.0, 5.0)
-    
-    # Voronoi untuk pola stone
-    voronoi = nodes.new('ShaderNodeTexVoronoi')
-    voronoi.location = (-600, 0)
-    voronoi.feature = 'F1'  # Atau 'F2', 'DISTANCE_TO_EDGE'
-    voronoi.distance = 'EUCLIDEAN'
-    voronoi.inputs['Scale'].default_value = 3.0
-    
-    # Noise untuk variasi
-    noise = nodes.new('ShaderNodeTexNoise')
-    noise.location = (-600, -300)
-    noise.inputs['Scale'].default_value = 10.0
-    
-    # Mix Voronoi dan Noise
-    mix = nodes.new('ShaderNodeMixRGB')
-    mix.location = (-400, 0)
-    mix.blend_type = 'MULTIPLY'
-    mix.inputs['Fac'].default_value = 1.0
-    
-    # ColorRamp untuk stone colors
-    colorramp = nodes.new('ShaderNodeValToRGB')
-    colorramp.location = (-200, 0)
-    
-    # Atur warna batu (gray variations)
-    colorramp.color_ramp.elements[0].color = (0.3, 0.3, 0.35, 1.0)
-    colorramp.color_ramp.elements[1].color = (0.6, 0.6, 0.65, 1.0)
-    
-    # Bump untuk surface detail
-    bump = nodes.new('ShaderNodeBump')
-    bump.location = (0, -200)
-    bump.inputs['Strength'].default_value = 0.5
-    
-    # Principled BSDF
-    bsdf = nodes.new('ShaderNodeBsdfPrincipled')
-    bsdf.location = (200, 0)
-    bsdf.inputs['Roughness'].default_value = 0.8
-    
-    # Output
-    output = nodes.new('ShaderNodeOutputMaterial')
-    output.location = (500, 0)
-    
-    # Hubungkan
-    links.new(tex_coord.outputs['Object'], mapping.inputs['Vector'])
-    links.new(mapping.outputs['Vector'], voronoi.inputs['Vector'])
-    links.new(mapping.outputs['Vector'], noise.inputs['Vector'])
-    links.new(voronoi.outputs['Distance'], mix.inputs['Color1'])
-    links.new(noise.outputs['Fac'], mix.inputs['Color2'])
-    links.new(mix.outputs['Color'], colorramp.inputs['Fac'])
-    links.new(colorramp.outputs['Color'], bsdf.inputs['Base Color'])
-    links.new(mix.outputs['Color'], bump.inputs['Height'])
-    links.new(bump.outputs['Normal'], bsdf.inputs['Normal'])
-    links.new(bsdf.outputs['BSDF'], output.inputs['Surface'])
+    node_group_library.ensure_for_spec(STONE_SPEC)
+    mat = material_graph.build_material(STONE_SPEC, name)
     
     print(f"🪨 Procedural stone material '{name}' berhasil dibuat!")
     return mat
 
+@material_cache.cached_material
+@instrumentation.traced
 def create_wood_material(name="Procedural_Wood"):
     """
     Membuat material kayu menggunakan Wave texture
     """
     
-    mat = bpy.data.materials.new(name=name)
-    mat.use_nodes = True
-    
-    nodes = mat.node_tree.nodes
-    links = mat.node_tree.links
-    nodes.clear()
-    
-    # Texture Coordinate
-    tex_coord = nodes.new('ShaderNodeTexCoord')
-    tex_coord.location = (-800, 0)
-    
-    # Mapping untuk orientasi wood grain
-    mapping = nodes.new('ShaderNodeMapping')
-    mapping.location = (-600, 0)
-    mapping.inputs['Scale'].default_value = (1.0, 1.0, 20.0)  # Stretch di Z untuk rings
-    
-    # Wave Texture untuk wood rings
-    wave = nodes.new('ShaderNodeTexWave')
-    wave.location = (-400, 0)
-    wave.wave_type = 'RINGS'
-    wave.rings_direction = 'Z'
-    wave.wave_profile = 'SAW'
-    wave.inputs['Scale'].default_value = 15.0
-    wave.inputs['Distortion'].default_value = 2.0
-    wave.inputs['Detail'].default_value = 5.0
-    
-    # ColorRamp untuk wood colors
-    colorramp = nodes.new('ShaderNodeValToRGB')
-    colorramp.location = (-200, 0)
-    
-    # Warna kayu (light to dark brown)
-    colorramp.color_ramp.elements[0].color = (0.6, 0.4, 0.2, 1.0)  # Light brown
-    colorramp.color_ramp.elements[1].color = (0.3, 0.2, 0.1, 1.0)  # Dark brown
-    
-    # Noise untuk variasi
-    noise = nodes.new('ShaderNodeTexNoise')
-    noise.location = (-400, -300)
-    noise.inputs['Scale'].default_value = 50.0
-    noise.inputs['Detail'].default_value = 10.0
-    
-    # Bump untuk texture
-    bump = nodes.new('ShaderNodeBump')
-    bump.location = (0, -200)
-    bump.inputs['Strength'].default_value = 0.3
-    
-    # Principled BSDF
-    bsdf = nodes.new('ShaderNodeBsdfPrincipled')
-    bsdf.location = (200, 0)
-    bsdf.inputs['Roughness'].default_value = 0.4
-    # Note: Specular removed in Blender 4.x, roughness controls appearance
-    
-    # Output
-    output = nodes.new('ShaderNodeOutputMaterial')
-    output.location = (500, 0)
-    
-    # Hubungkan
-    links.new(tex_coord.outputs['Object'], mapping.inputs['Vector'])
-    links.new(mapping.outputs['Vector'], wave.inputs['Vector'])
-    links.new(wave.outputs['Color'], colorramp.inputs['Fac'])
-    links.new(colorramp.outputs['Color'], bsdf.inputs['Base Color'])
-    links.new(mapping.outputs['Vector'], noise.inputs['Vector'])
-    links.new(noise.outputs['Fac'], bump.inputs['Height'])
-    links.new(bump.outputs['Normal'], bsdf.inputs['Normal'])
-    links.new(bsdf.outputs['BSDF'], output.inputs['Surface'])
+    node_group_library.ensure_for_spec(WOOD_SPEC)
+    mat = material_graph.build_material(WOOD_SPEC, name)
     
     print(f"🌳 Procedural wood material '{name}' berhasil dibuat!")
     return mat
 
+@material_cache.cached_material
+@instrumentation.traced
 def create_rock_material(name="Procedural_Rock"):
     """
     Membuat material rock menggunakan Noise fractal
-    Note: Musgrave removed in Blender 4.0, using Noise Texture instead
+    Note: Musgrave dihapus di Blender 4.1, Noise Texture dipakai di semua versi
     """
     
-    mat = bpy.data.materials.new(name=name)
-    mat.use_nodes = True
-    
-    nodes = mat.node_tree.nodes
-    links = mat.node_tree.links
-    nodes.clear()
-    
-    # Texture Coordinate
-    tex_coord = nodes.new('ShaderNodeTexCoord')
-    tex_coord.location = (-800, 0)
-    
-    # Noise Texture (replacement for Musgrave in Blender 4.x)
-    noise = nodes.new('ShaderNodeTexNoise')
-    noise.location = (-600, 0)
-    noise.inputs['Scale'].default_value = 5.0
-    noise.inputs['Detail'].default_value = 10.0
-    noise.inputs['Roughness'].default_value = 0.5
-    # Note: Blender 4.x Noise has different parameters than old Musgrave
-    
-    # ColorRamp untuk rock colors
-    colorramp = nodes.new('ShaderNodeValToRGB')
-    colorramp.location = (-400, 0)
-    
-    # Warna rock (dark gray to light gray)
-    colorramp.color_ramp.elements[0].color = (0.15, 0.15, 0.15, 1.0)
-    colorramp.color_ramp.elements[1].color = (0.5, 0.5, 0.5, 1.0)
-    
-    # Displacement untuk actual geometry displacement
-    displacement = nodes.new('ShaderNodeDisplacement')
-    displacement.location = (200, -200)
-    displacement.inputs['Scale'].default_value = 0.1
-    
-    # Principled BSDF
-    bsdf = nodes.new('ShaderNodeBsdfPrincipled')
-    bsdf.location = (200, 0)
-    bsdf.inputs['Roughness'].default_value = 0.9
-    
-    # Material Output
-    output = nodes.new('ShaderNodeOutputMaterial')
-    output.location = (500, 0)
-    
-    # Hubungkan
-    links.new(tex_coord.outputs['Object'], noise.inputs['Vector'])
-    links.new(noise.outputs['Fac'], colorramp.inputs['Fac'])
-    links.new(colorramp.outputs['Color'], bsdf.inputs['Base Color'])
-    links.new(noise.outputs['Fac'], displacement.inputs['Height'])
-    links.new(bsdf.outputs['BSDF'], output.inputs['Surface'])
-    links.new(displacement.outputs['Displacement'], output.inputs['Displacement'])
+    node_group_library.ensure_for_spec(ROCK_SPEC)
+    mat = material_graph.build_material(ROCK_SPEC, name)
     
     print(f"🏔️ Procedural rock material '{name}' dengan displacement berhasil dibuat!")
     return mat
 
+@instrumentation.traced
 def create_demo_objects():
     """Membuat objek-objek demo untuk testing material"""
     
     # Hapus objek yang sudah ada (opsional)
-    bpy.ops.object.select_all(action='SELECT')
-    bpy.ops.object.delete()
+    # Mesh, material dan image yang jadi yatim ikut dibersihkan
+    scene_reset.reset_scene()
     
     # Buat beberapa objek untuk demo
-    bpy.ops.mesh.primitive_cube_add(size=2, location=(-6, 0, 0))
-    cube = bpy.context.active_object
-    cube.name = "Demo_Cube"
-    
-    bpy.ops.mesh.primitive_uv_sphere_add(radius=1, location=(-2, 0, 0))
-    sphere = bpy.context.active_object
-    sphere.name = "Demo_Sphere"
-    
-    bpy.ops.mesh.primitive_cylinder_add(radius=1, depth=2, location=(2, 0, 0))
-    cylinder = bpy.context.active_object
-    cylinder.name = "Demo_Cylinder"
+    # Dengan INSTANCING, objek berulang (jenis dan parameter sama) berbagi satu mesh
+    create = instancing.create_instance if INSTANCING else mesh_primitives.create_primitive
+    cube = create('cube', "Demo_Cube", size=2, location=(-6, 0, 0))
+    sphere = create('uv_sphere', "Demo_Sphere", radius=1, location=(-2, 0, 0))
+    cylinder = create('cylinder', "Demo_Cylinder", radius=1, depth=2, location=(2, 0, 0))
     
     # Buat objek untuk displacement demo
-    bpy.ops.mesh.primitive_grid_add(x_subdivisions=20, y_subdivisions=20, size=4, location=(6, 0, 0))
-    grid = bpy.context.active_object
-    grid.name = "Demo_Grid"
-    
-    # Subdivide grid untuk lebih detail
-    bpy.ops.object.mode_set(mode='EDIT')
-    bpy.ops.mesh.subdivide(number_cuts=2)
-    bpy.ops.object.mode_set(mode='OBJECT')
+    # Grid 20x20 yang di-subdivide 2 cuts = grid 60x60 (lebih detail)
+    # Selalu mesh sendiri: vertex-nya diubah oleh displacement preview
+    grid = mesh_primitives.create_primitive('grid', "Demo_Grid", x_subdivisions=60, y_subdivisions=60,
+                                            size=4, location=(6, 0, 0))
     
     print("📦 Objek demo berhasil dibuat!")
     return cube, sphere, cylinder, grid
 
+@instrumentation.traced
 def main():
     """Fungsi utama untuk menjalankan demo"""
     
@@ -330,26 +296,21 @@ def main():
     rock_mat = create_rock_material("Procedural_Rock")
     
     print("\n6. 🎯 Assign materials ke objek...")
-    # Assign materials ke objek
-    if cube.data.materials:
-        cube.data.materials[0] = dirt_mat
-    else:
-        cube.data.materials.append(dirt_mat)
-    
-    if sphere.data.materials:
-        sphere.data.materials[0] = stone_mat
-    else:
-        sphere.data.materials.append(stone_mat)
-    
-    if cylinder.data.materials:
-        cylinder.data.materials[0] = wood_mat
-    else:
-        cylinder.data.materials.append(wood_mat)
-    
-    if grid.data.materials:
-        grid.data.materials[0] = rock_mat
-    else:
-        grid.data.materials.append(rock_mat)
+    # Assign materials ke objek (nama/objek di-resolve sekali)
+    material_assign.assign_materials({
+        cube: dirt_mat,
+        sphere: stone_mat,
+        cylinder: wood_mat,
+        grid: rock_mat,
+    })
+    
+    if DISPLACE_PREVIEW:
+        print("\n7. 🏔️ Displacement preview ke vertex grid...")
+        displacement_preview.displace_from_material(grid, rock_mat)
+    
+    if BAKE_RESOLUTION:
+        print(f"\n8. 🔥 Bake procedural textures ({BAKE_RESOLUTION}px)...")
+        procedural_bake.bake_objects([cube, sphere, cylinder, grid], resolution=BAKE_RESOLUTION)
     
     print("\n✅ === Demo selesai! ===")
     print(f"✅ Cube: Dirt material (Noise + Mix RGB)")
@@ -366,4 +327,8 @@ def main():
 
 # Jalankan fungsi utama
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    if SNAPSHOT:
+        scene_snapshot.run_cached(main)
+    else:
+        main()
+    instrumentation.print_report()
\ No newline at end of file
@@ -0,0 +1,218 @@
+"""
+Texture Library: scan folder texture PBR, index SQLite, dan loader lazy
+File dikelompokkan menjadi texture set berdasarkan suffix nama file:
+    wood_color.jpg, wood_normal.png, wood_rough.jpg -> set 'wood'
+
+Index menyimpan ukuran file, mtime, dimensi (dibaca dari header PNG/JPEG)
+dan SHA-1. Scan ulang hanya membaca file yang size/mtime-nya berubah.
+
+Contoh:
+    index = texture_library.TextureIndex('textures.sqlite')
+    index.scan('D:/textures')
+    for mat in texture_library.iter_materials(index, create_pbr_material):
+        ...   # satu material per iterasi, tidak ada yang di-load di depan
+
+Bagian scan dan index tidak butuh bpy, sehingga bisa dijalankan dengan
+Python biasa: python texture_library.py D:/textures textures.sqlite
+"""
+
+import hashlib
+import itertools
+import os
+import re
+import sqlite3
+import struct
+import sys
+
+# Suffix nama file -> channel PBR (sama dengan key textures_dict di slide-02)
+SUFFIXES = {
+    'base_color': ('color', 'col', 'albedo', 'diffuse', 'diff', 'basecolor', 'base_color'),
+    'normal': ('normal', 'nor', 'nrm', 'normal_gl', 'normal_dx'),
+    'roughness': ('rough', 'roughness', 'rgh'),
+    'metallic': ('metal', 'metallic', 'metalness'),
+    'displacement': ('disp', 'displacement', 'height'),
+}
+
+EXTENSIONS = {'.png', '.jpg', '.jpeg', '.tif', '.tiff', '.exr', '.tga', '.bmp', '.webp'}
+
+_ALIASES = {alias: channel for channel, aliases in SUFFIXES.items() for alias in aliases}
+
+# Alias terpanjang dicoba dulu agar 'wood_base_color' tidak jadi set 'wood_base'
+_NAME_PATTERN = re.compile(
+    r'^(?P<set>.+?)[_\-. ](?P<suffix>{})$'.format('|'.join(sorted(map(re.escape, _ALIASES), key=len, reverse=True))),
+    re.IGNORECASE,
+)
+
+# Ukuran blok baca saat hashing
+HASH_BLOCK = 1 << 20
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS textures (
+    path TEXT PRIMARY KEY,
+    directory TEXT NOT NULL,
+    set_name TEXT NOT NULL,
+    channel TEXT NOT NULL,
+    size INTEGER NOT NULL,
+    mtime_ns INTEGER NOT NULL,
+    width INTEGER,
+    height INTEGER,
+    sha1 TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS textures_set ON textures (directory, set_name);
+"""
+
+def parse_name(filename):
+    """'wood_rough.jpg' -> ('wood', 'roughness'); None jika bukan texture PBR"""
+
+    stem, ext = os.path.splitext(filename)
+    if ext.lower() not in EXTENSIONS:
+        return None
+    match = _NAME_PATTERN.match(stem)
+    if match is None:
+        return None
+    return match.group('set'), _ALIASES[match.group('suffix').lower()]
+
+def image_size(path):
+    """Dimensi (width, height) dari header PNG/JPEG tanpa decode; (None, None) jika tidak dikenal"""
+
+    with open(path, 'rb') as f:
+        head = f.read(26)
+        if head[:8] == b'\x89PNG\r\n\x1a\n' and head[12:16] == b'IHDR':
+            return struct.unpack('>II', head[16:24])
+
+        if head[:2] == b'\xff\xd8':
+            # Cari marker SOF (Start Of Frame) yang menyimpan dimensi
+            f.seek(2)
+            while True:
+                marker = f.read(2)
+                if len(marker) < 2 or marker[0] != 0xFF:
+                    break
+                if marker[1] in (0xD8, 0x01) or 0xD0 <= marker[1] <= 0xD7:
+                    continue
+                length = struct.unpack('>H', f.read(2))[0]
+                if 0xC0 <= marker[1] <= 0xCF and marker[1] not in (0xC4, 0xC8, 0xCC):
+                    height, width = struct.unpack('>xHH', f.read(5))
+                    return width, height
+                f.seek(length - 2, os.SEEK_CUR)
+    return None, None
+
+def file_sha1(path):
+    """SHA-1 isi file, dibaca per blok"""
+
+    digest = hashlib.sha1()
+    with open(path, 'rb') as f:
+        for block in iter(lambda: f.read(HASH_BLOCK), b''):
+            digest.update(block)
+    return digest.hexdigest()
+
+class TextureIndex:
+    """Index texture library di SQLite (path, set, channel, size, mtime, dimensi, sha1)"""
+
+    def __init__(self, db_path):
+        self.db_path = db_path
+        self.connection = sqlite3.connect(db_path)
+        self.connection.executescript(SCHEMA)
+
+    def close(self):
+        self.connection.close()
+
+    def scan(self, root):
+        """
+        Scan folder secara rekursif dan perbarui index
+
+        File dengan size dan mtime yang sama dengan index tidak dibaca lagi.
+        Entry untuk file yang sudah hilang dihapus.
+        Returns: dict statistik (files, updated, removed)
+        """
+
+        root = os.path.abspath(root)
+        # Prefix case-sensitive (LIKE di SQLite tidak membedakan huruf besar/kecil ASCII,
+        # jadi /tex/Wood ikut memilih entry /tex/wood yang tidak di-scan)
+        prefix = root + os.sep
+        known = {path: (size, mtime) for path, size, mtime in self.connection.execute(
+            "SELECT path, size, mtime_ns FROM textures WHERE substr(path, 1, ?) = ?",
+            (len(prefix), prefix))}
+
+        seen = set()
+        updated = []
+        for directory, _, filenames in os.walk(root):
+            for filename in filenames:
+                parsed = parse_name(filename)
+                if parsed is None:
+                    continue
+                path = os.path.join(directory, filename)
+                stat = os.stat(path)
+                seen.add(path)
+                if known.get(path) == (stat.st_size, stat.st_mtime_ns):
+                    continue
+
+                width, height = image_size(path)
+                updated.append((path, directory, parsed[0], parsed[1], stat.st_size, stat.st_mtime_ns,
+                                width, height, file_sha1(path)))
+
+        removed = [(path,) for path in known if path not in seen]
+        with self.connection:
+            self.connection.executemany("INSERT OR REPLACE INTO textures VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)", updated)
+            self.connection.executemany("DELETE FROM textures WHERE path = ?", removed)
+
+        return {'files': len(seen), 'updated': len(updated), 'removed': len(removed)}
+
+    def iter_sets(self, require=('base_color',)):
+        """
+        Generator texture set: (nama set, {channel: path})
+        Baris dibaca bertahap dari SQLite, tidak dimuat semuanya ke memori.
+        """
+
+        cursor = self.connection.execute(
+            "SELECT directory, set_name, channel, path FROM textures ORDER BY directory, set_name, channel")
+        for (directory, set_name), rows in itertools.groupby(cursor, key=lambda row: (row[0], row[1])):
+            textures = {channel: path for _, _, channel, path in rows}
+            if all(channel in textures for channel in require):
+                yield set_name, textures
+
+    def find_duplicates(self):
+        """File dengan isi sama (SHA-1 sama): list list path"""
+
+        rows = self.connection.execute(
+            "SELECT sha1, path FROM textures WHERE sha1 IN "
+            "(SELECT sha1 FROM textures GROUP BY sha1 HAVING COUNT(*) > 1) ORDER BY sha1")
+        return [[path for _, path in group] for _, group in itertools.groupby(rows, key=lambda row: row[0])]
+
+    def stats(self):
+        """Jumlah file, set dan total ukuran di index"""
+
+        files, sets, size = self.connection.execute(
+            "SELECT COUNT(*), COUNT(DISTINCT directory || '/' || set_name), COALESCE(SUM(size), 0) FROM textures"
+        ).fetchone()
+        return {'files': files, 'sets': sets, 'bytes': size}
+
+def iter_materials(index, builder, require=('base_color',), limit=None):
+    """
+    Generator material: builder(name, textures_dict) dipanggil per set saat diminta
+
+    Parameters:
+    - index: TextureIndex yang sudah di-scan
+    - builder: fungsi (name, textures_dict) -> material, misal create_pbr_material
+    - require: channel yang wajib ada di set
+    - limit: jumlah material maksimum (None = semua)
+    """
+
+    for set_name, textures in itertools.islice(index.iter_sets(require), limit):
+        yield builder(set_name, textures)
+
+def main(argv=None):
+    argv = sys.argv[1:] if argv is None else argv
+    if len(argv) != 2:
+        print("Pemakaian: python texture_library.py <folder texture> <index.sqlite>")
+        return 1
+
+    index = TextureIndex(argv[1])
+    result = index.scan(argv[0])
+    stats = index.stats()
+    print(f"📚 {result['files']} file di-scan, {result['updated']} diperbarui, {result['removed']} dihapus")
+    print(f"📚 Index: {stats['sets']} set, {stats['files']} file, {stats['bytes'] / 1024 ** 2:.1f} MB")
+    index.close()
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,322 @@
+"""
+UV Analytics: statistik UV yang di-vectorize dengan NumPy
+Seluruh UV layer dibaca sekaligus dengan foreach_get, tanpa loop per UV
+
+Laporan berisi:
+- bounds UV (min/max)
+- texel density per face (pixel per unit dunia)
+- jumlah UV island (polygon yang terhubung lewat edge yang bukan seam)
+- overlap ratio (perkiraan lewat rasterisasi)
+- jumlah UV di luar range [0, 1]
+"""
+
+import numpy as np
+
+# Jumlah sampel pixel maksimum per batch rasterisasi (membatasi pemakaian memori)
+RASTER_CHUNK = 1 << 22
+
+def read_uvs(mesh, uv_layer=None):
+    """Membaca UV layer (default: active) menjadi array (L, 2) float32"""
+
+    layer = mesh.uv_layers[uv_layer] if uv_layer else mesh.uv_layers.active
+    uvs = np.empty(len(layer.data) * 2, dtype=np.float32)
+    layer.data.foreach_get("uv", uvs)
+    return uvs.reshape(-1, 2)
+
+def read_topology(mesh):
+    """
+    Membaca posisi vertex, index vertex dan edge per loop, loop_start dan loop_total
+
+    Buffer memakai tipe raw RNA (float32/int32) supaya foreach_get menyalin
+    sekaligus, bukan per item.
+    """
+
+    co = np.empty(len(mesh.vertices) * 3, dtype=np.float32)
+    mesh.vertices.foreach_get("co", co)
+
+    loop_vertices = np.empty(len(mesh.loops), dtype=np.int32)
+    mesh.loops.foreach_get("vertex_index", loop_vertices)
+    loop_edges = np.empty(len(mesh.loops), dtype=np.int32)
+    mesh.loops.foreach_get("edge_index", loop_edges)
+
+    loop_starts = np.empty(len(mesh.polygons), dtype=np.int32)
+    mesh.polygons.foreach_get("loop_start", loop_starts)
+    loop_totals = np.empty(len(mesh.polygons), dtype=np.int32)
+    mesh.polygons.foreach_get("loop_total", loop_totals)
+
+    return co.reshape(-1, 3), loop_vertices, loop_edges, loop_starts, loop_totals
+
+def next_loops(loop_starts, loop_totals):
+    """Index loop berikutnya di polygon yang sama (loop terakhir kembali ke awal)"""
+
+    nxt = np.arange(1, int(loop_totals.sum()) + 1, dtype=np.int32)
+    nxt[loop_starts + loop_totals - 1] = loop_starts
+    return nxt
+
+def next_values(values, loop_starts, loop_totals):
+    """
+    values[next_loops(...)] tanpa gather: geser satu loop, lalu perbaiki loop
+    terakhir tiap polygon (loop satu polygon selalu berurutan)
+    """
+
+    shifted = np.empty_like(values)
+    shifted[:-1] = values[1:]
+    shifted[loop_starts + loop_totals - 1] = values[loop_starts]
+    return shifted
+
+def polygon_areas_3d(co, loop_vertices, loop_starts, loop_totals):
+    """
+    Luas tiap polygon di ruang 3D (rumus Newell)
+
+    Dihitung per komponen dalam float32 sebagai cross(p, q - p) (= cross(p, q)):
+    selisih antar vertex yang bertetangga kecil, sehingga pembatalan antar
+    suku tetap presisi meskipun koordinatnya jauh dari origin.
+    """
+
+    x, y, z = (co[:, axis].take(loop_vertices) for axis in range(3))
+    dx, dy, dz = (next_values(p, loop_starts, loop_totals) - p for p in (x, y, z))
+    nx = np.add.reduceat(y * dz - z * dy, loop_starts)
+    ny = np.add.reduceat(z * dx - x * dz, loop_starts)
+    nz = np.add.reduceat(x * dy - y * dx, loop_starts)
+    return 0.5 * np.sqrt(nx * nx + ny * ny + nz * nz)
+
+def polygon_areas_uv(uvs, loop_starts, loop_totals):
+    """Luas tiap polygon di ruang UV (rumus shoelace, bentuk selisih seperti polygon_areas_3d)"""
+
+    u, v = uvs[:, 0].copy(), uvs[:, 1].copy()
+    du = next_values(u, loop_starts, loop_totals) - u
+    dv = next_values(v, loop_starts, loop_totals) - v
+    return 0.5 * np.abs(np.add.reduceat(u * dv - v * du, loop_starts))
+
+def connected_components(count, a, b):
+    """
+    Label komponen terhubung untuk graph dengan edge (a[i], b[i])
+    Union-find vectorized: hooking ke label terkecil + pointer jumping
+    """
+
+    labels = np.arange(count, dtype=a.dtype)
+    while True:
+        la, lb = labels[a], labels[b]
+        differ = la != lb
+        if not differ.any():
+            return labels
+
+        lo = np.minimum(la[differ], lb[differ])
+        hi = np.maximum(la[differ], lb[differ])
+        np.minimum.at(labels, hi, lo)
+
+        # Pointer jumping sampai setiap node menunjuk langsung ke root
+        while True:
+            jumped = labels[labels]
+            if np.array_equal(jumped, labels):
+                break
+            labels = jumped
+
+def count_islands(uvs, loop_vertices, loop_edges, loop_starts, loop_totals, precision=1e-5):
+    """
+    Menghitung jumlah UV island
+
+    Dua polygon yang berbagi edge mesh ada di island yang sama jika kedua
+    ujung edge punya UV yang sama (dibulatkan ke precision) di kedua polygon,
+    yaitu edge tersebut bukan UV seam. Island = komponen terhubung polygon.
+    Polygon yang hanya bersentuhan di satu vertex UV dihitung terpisah.
+    """
+
+    if len(uvs) == 0:
+        return 0
+
+    # (u, v) dibulatkan ke dua int32 lalu dibaca sebagai satu int64 (tanpa copy)
+    scaled = np.rint(uvs * np.float32(1.0 / precision))
+    if max(-scaled.min(), scaled.max()) < 2 ** 31:
+        key = np.ascontiguousarray(scaled.astype(np.int32)).view(np.int64).ravel()
+    else:
+        quantized = scaled.astype(np.int64)
+        key = (quantized[:, 0] << 32) | (quantized[:, 1] & 0xFFFFFFFF)
+    key_next = next_values(key, loop_starts, loop_totals)
+
+    # Setiap loop dipasangkan dengan satu loop wakil di edge yang sama
+    loops = np.arange(len(loop_edges), dtype=np.int32)
+    first = np.empty(int(loop_edges.max()) + 1, dtype=np.int32)
+    first[loop_edges] = loops
+    rep = first[loop_edges]
+    paired = rep != loops
+    loops, rep = loops[paired], rep[paired]
+
+    # Polygon tetangga biasanya melewati edge dengan arah berlawanan
+    start, end = key[loops], key_next[loops]
+    rep_start, rep_end = key[rep], key_next[rep]
+    same = np.where(loop_vertices[loops] == loop_vertices[rep],
+                    (start == rep_start) & (end == rep_end),
+                    (start == rep_end) & (end == rep_start))
+
+    polygon = np.repeat(np.arange(len(loop_starts), dtype=np.int32), loop_totals)
+    labels = connected_components(len(loop_starts), polygon[loops[same]], polygon[rep[same]])
+    return int(np.count_nonzero(labels == np.arange(len(labels), dtype=labels.dtype)))
+
+def _fan_triangles(loop_starts, loop_totals):
+    """Triangulasi fan untuk polygon yang diberikan: (loop a, loop b, loop c, index polygon)"""
+
+    triangles = np.maximum(loop_totals.astype(np.int64) - 2, 0)
+    polygon = np.repeat(np.arange(len(loop_starts)), triangles)
+    corner = np.arange(len(polygon)) - np.repeat(np.cumsum(triangles) - triangles, triangles) + 1
+    a = loop_starts[polygon].astype(np.int64)
+    return a, a + corner, a + corner + 1, polygon
+
+def _pixel_range(lo, hi, resolution):
+    """Range pixel (pusat pixel di i + 0.5) di dalam bounding box: (x0, y0, x1, y1)"""
+
+    x0 = np.clip(np.ceil(lo[0] - 0.5), 0, resolution).astype(np.int64)
+    y0 = np.clip(np.ceil(lo[1] - 0.5), 0, resolution).astype(np.int64)
+    x1 = np.clip(np.floor(hi[0] - 0.5), -1, resolution - 1).astype(np.int64)
+    y1 = np.clip(np.floor(hi[1] - 0.5), -1, resolution - 1).astype(np.int64)
+    return x0, y0, x1, y1
+
+def overlap_ratio(uvs, loop_starts, loop_totals, resolution=256):
+    """
+    Perkiraan rasio overlap UV
+
+    Setiap segitiga UV dirasterisasi ke grid resolution x resolution di [0, 1].
+    Hasilnya = pixel yang ditutup >= 2 face / pixel yang ditutup >= 1 face.
+    Face yang lebih kecil dari satu pixel tidak ikut dihitung.
+    """
+
+    if len(loop_starts) == 0:
+        return 0.0
+
+    # Buang dulu face yang bounding box-nya tidak memuat pusat pixel apapun
+    # (di mesh padat hampir semua face), baru sisanya ditriangulasi
+    u = uvs[:, 0] * np.float32(resolution)
+    v = uvs[:, 1] * np.float32(resolution)
+    x0, y0, x1, y1 = _pixel_range((np.minimum.reduceat(u, loop_starts), np.minimum.reduceat(v, loop_starts)),
+                                  (np.maximum.reduceat(u, loop_starts), np.maximum.reduceat(v, loop_starts)),
+                                  resolution)
+    faces = np.nonzero((x1 >= x0) & (y1 >= y0))[0]
+
+    a, b, c, face = _fan_triangles(loop_starts[faces], loop_totals[faces])
+    if len(face) == 0:
+        return 0.0
+    face = faces[face]
+
+    pa, pb, pc = (uvs[i].astype(np.float64) * resolution for i in (a, b, c))
+    lo = np.minimum(np.minimum(pa, pb), pc)
+    hi = np.maximum(np.maximum(pa, pb), pc)
+
+    x0, y0, x1, y1 = _pixel_range(lo.T, hi.T, resolution)
+    width = np.maximum(x1 - x0 + 1, 0)
+    height = np.maximum(y1 - y0 + 1, 0)
+    samples = width * height
+
+    covered = []
+    tris = np.nonzero(samples)[0]
+    ends = np.cumsum(samples[tris])
+    start = 0
+    while start < len(tris):
+        # Ambil segitiga sebanyak mungkin tanpa melewati RASTER_CHUNK sampel
+        base = ends[start - 1] if start else 0
+        stop = max(start + 1, int(np.searchsorted(ends, base + RASTER_CHUNK, side='right')))
+        chunk = tris[start:stop]
+        counts = samples[chunk]
+
+        tri = np.repeat(chunk, counts)
+        offset = np.arange(counts.sum()) - np.repeat(np.cumsum(counts) - counts, counts)
+        px = x0[tri] + offset % width[tri]
+        py = y0[tri] + offset // width[tri]
+        point = np.column_stack([px + 0.5, py + 0.5])
+
+        def edge(p, q):
+            return ((q[tri, 0] - p[tri, 0]) * (point[:, 1] - p[tri, 1])
+                    - (q[tri, 1] - p[tri, 1]) * (point[:, 0] - p[tri, 0]))
+
+        e0, e1, e2 = edge(pa, pb), edge(pb, pc), edge(pc, pa)
+        inside = ((e0 >= 0) & (e1 >= 0) & (e2 >= 0)) | ((e0 <= 0) & (e1 <= 0) & (e2 <= 0))
+
+        pixel = py[inside] * resolution + px[inside]
+        covered.append(pixel * len(loop_starts) + face[tri[inside]])
+        start = stop
+
+    if not covered:
+        return 0.0
+
+    # Satu face dihitung sekali per pixel (segitiga fan dari face yang sama tidak overlap)
+    pixel_face = np.unique(np.concatenate(covered))
+    coverage = np.bincount(pixel_face // len(loop_starts), minlength=resolution * resolution)
+    used = np.count_nonzero(coverage)
+    return float(np.count_nonzero(coverage > 1) / used) if used else 0.0
+
+def uv_report(obj, uv_layer=None, texture_size=1024, overlap_resolution=256, islands=True):
+    """
+    Membuat laporan kualitas UV untuk objek mesh
+
+    Parameters:
+    - obj: Blender object (mesh)
+    - uv_layer: nama UV layer (default: active)
+    - texture_size: resolusi texture untuk menghitung texel density (px)
+    - overlap_resolution: resolusi grid untuk perkiraan overlap (None = dilewati)
+    - islands: hitung jumlah UV island (False = dilewati)
+
+    Island dan overlap adalah bagian termahal; lewati keduanya jika hanya
+    perlu bounds dan texel density pada mesh yang sangat besar.
+
+    Returns: dict laporan, atau None jika objek tidak punya UV
+    """
+
+    if obj.type != 'MESH' or not obj.data.uv_layers:
+        return None
+
+    mesh = obj.data
+    uvs = read_uvs(mesh, uv_layer)
+    co, loop_vertices, loop_edges, loop_starts, loop_totals = read_topology(mesh)
+
+    # Texel density dihitung di world space (translasi tidak mengubah luas)
+    matrix = np.array(obj.matrix_world, dtype=np.float32)
+    world_co = co @ matrix[:3, :3].T
+    area_3d = polygon_areas_3d(world_co, loop_vertices, loop_starts, loop_totals)
+    area_uv = polygon_areas_uv(uvs, loop_starts, loop_totals)
+    density = np.zeros(len(area_3d))
+    valid = area_3d > 0
+    density[valid] = texture_size * np.sqrt(area_uv[valid] / area_3d[valid])
+
+    # Reduksi 1D per komponen jauh lebih cepat daripada axis=0/1 pada array (L, 2)
+    u, v = uvs[:, 0].copy(), uvs[:, 1].copy()
+    outside = (u < 0.0) | (u > 1.0) | (v < 0.0) | (v > 1.0)
+
+    return {
+        'object': obj.name,
+        'uv_layer': uv_layer or mesh.uv_layers.active.name,
+        'loops': len(uvs),
+        'faces': len(loop_starts),
+        'bounds': ((float(u.min()), float(v.min())), (float(u.max()), float(v.max()))) if len(uvs) else None,
+        'texel_density': {
+            'texture_size': texture_size,
+            'min': float(density[valid].min()) if valid.any() else 0.0,
+            'max': float(density[valid].max()) if valid.any() else 0.0,
+            'mean': float(density[valid].mean()) if valid.any() else 0.0,
+            'std': float(density[valid].std()) if valid.any() else 0.0,
+        },
+        'texel_density_per_face': density,
+        'islands': count_islands(uvs, loop_vertices, loop_edges, loop_starts, loop_totals) if islands else None,
+        'overlap_ratio': (overlap_ratio(uvs, loop_starts, loop_totals, overlap_resolution)
+                          if overlap_resolution else None),
+        'out_of_bounds': int(np.count_nonzero(outside)),
+    }
+
+def print_uv_report(report):
+    """Cetak laporan UV dari uv_report()"""
+
+    if report is None:
+        print("Objek tidak memiliki UV map!")
+        return
+
+    density = report['texel_density']
+    print(f"📊 UV Report untuk '{report['object']}' (layer '{report['uv_layer']}'):")
+    print(f"  - Loops: {report['loops']}, Faces: {report['faces']}")
+    if report['bounds']:
+        (u0, v0), (u1, v1) = report['bounds']
+        print(f"  - Bounds: U [{u0:.4f}, {u1:.4f}], V [{v0:.4f}, {v1:.4f}]")
+    print(f"  - Texel density @ {density['texture_size']}px: "
+          f"mean {density['mean']:.1f}, min {density['min']:.1f}, max {density['max']:.1f} px/unit")
+    if report['islands'] is not None:
+        print(f"  - UV islands: {report['islands']}")
+    if report['overlap_ratio'] is not None:
+        print(f"  - Overlap ratio: {report['overlap_ratio']:.1%}")
+    print(f"  - UV di luar [0, 1]: {report['out_of_bounds']}")
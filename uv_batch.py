@@ -0,0 +1,150 @@
+"""
+UV Batch: pipeline unwrap untuk banyak objek dalam satu sesi Edit Mode
+Semua objek masuk multi-object Edit Mode sekali, menjalankan rangkaian
+langkah, lalu kembali ke Object Mode sekali
+
+Contoh:
+    batch_unwrap(objects, [
+        ('seams_by_angle', {'angle': 30}),
+        ('unwrap', {'method': 'ANGLE_BASED'}),
+        ('pack', {'margin': 0.02}),   # semua island masuk satu atlas bersama
+    ])
+"""
+
+import math
+
+import bpy
+
+import seam_engine
+
+def _step_reset():
+    bpy.ops.uv.reset()
+
+def _step_smart_project(angle_limit=66, island_margin=0.02):
+    bpy.ops.uv.smart_project(
+        angle_limit=math.radians(angle_limit),
+        island_margin=island_margin,
+        area_weight=0.0,
+        correct_aspect=True,
+        scale_to_bounds=False
+    )
+
+def _step_cube_project(cube_size=1.0):
+    bpy.ops.uv.cube_project(
+        cube_size=cube_size,
+        correct_aspect=True,
+        clip_to_bounds=False,
+        scale_to_bounds=False
+    )
+
+def _step_unwrap(method='ANGLE_BASED', margin=0.001):
+    bpy.ops.uv.unwrap(method=method, margin=margin)
+
+def _step_pack(margin=0.02, rotate=True):
+    # Di multi-object Edit Mode, island semua objek di-pack ke satu atlas
+    bpy.ops.uv.pack_islands(margin=margin, rotate=rotate)
+
+# Langkah yang dijalankan di Object Mode lewat seam_engine, sebelum sesi Edit Mode
+OBJECT_MODE_STEPS = {
+    'seams_by_angle': seam_engine.mark_seams,
+}
+
+# Langkah yang tersedia untuk batch_unwrap (di dalam sesi Edit Mode)
+STEPS = {
+    'reset': _step_reset,
+    'smart_project': _step_smart_project,
+    'cube_project': _step_cube_project,
+    'unwrap': _step_unwrap,
+    'pack': _step_pack,
+}
+
+def _normalize_steps(steps):
+    """Ubah 'nama' atau ('nama', {kwargs}) menjadi list (nama, kwargs) dan validasi"""
+
+    normalized = []
+    for step in steps:
+        name, kwargs = (step, {}) if isinstance(step, str) else (step[0], dict(step[1]) if len(step) > 1 else {})
+        if name not in STEPS and name not in OBJECT_MODE_STEPS:
+            raise ValueError(f"Langkah UV '{name}' tidak dikenal, pilih dari {sorted({**STEPS, **OBJECT_MODE_STEPS})}")
+        normalized.append((name, kwargs))
+    return normalized
+
+def _split_steps(steps):
+    """
+    Pisahkan langkah seam (Object Mode) dari langkah Edit Mode
+
+    Seam hanya mempengaruhi 'unwrap', jadi langkah seam boleh dijalankan
+    lebih dulu selama tidak ada 'unwrap' sebelumnya.
+    """
+
+    object_steps = []
+    edit_steps = []
+    for name, kwargs in steps:
+        if name in OBJECT_MODE_STEPS:
+            if any(step == 'unwrap' for step, _ in edit_steps):
+                raise ValueError(f"Langkah '{name}' harus sebelum 'unwrap'")
+            object_steps.append((name, kwargs))
+        else:
+            edit_steps.append((name, kwargs))
+    return object_steps, edit_steps
+
+def _run_edit_session(meshes, steps):
+    """Masuk multi-object Edit Mode sekali, jalankan langkah, lalu kembali"""
+
+    view_layer = bpy.context.view_layer
+
+    # Simpan seleksi lama, lalu pilih hanya objek target (tanpa operator)
+    previous_active = view_layer.objects.active
+    previous_selected = [obj for obj in view_layer.objects if obj.select_get()]
+    for obj in previous_selected:
+        obj.select_set(False)
+    for obj in meshes:
+        obj.select_set(True)
+    view_layer.objects.active = meshes[0]
+
+    bpy.ops.object.mode_set(mode='EDIT')
+    try:
+        bpy.ops.mesh.select_all(action='SELECT')
+        for name, kwargs in steps:
+            STEPS[name](**kwargs)
+    finally:
+        bpy.ops.object.mode_set(mode='OBJECT')
+
+        for obj in meshes:
+            obj.select_set(False)
+        for obj in previous_selected:
+            obj.select_set(True)
+        view_layer.objects.active = previous_active
+
+def batch_unwrap(objects, steps):
+    """
+    Menjalankan rangkaian langkah UV untuk banyak objek sekaligus
+
+    Parameters:
+    - objects: list objek (non-mesh diabaikan)
+    - steps: list 'nama' atau ('nama', {kwargs}), lihat STEPS dan OBJECT_MODE_STEPS
+
+    Returns: jumlah objek yang diproses
+    """
+
+    meshes = [obj for obj in objects if obj.type == 'MESH']
+    steps = _normalize_steps(steps)
+    if not meshes or not steps:
+        return 0
+
+    object_steps, edit_steps = _split_steps(steps)
+
+    if bpy.context.object and bpy.context.object.mode != 'OBJECT':
+        bpy.ops.object.mode_set(mode='OBJECT')
+
+    # Seam dihitung langsung dari data mesh, tanpa operator
+    for name, kwargs in object_steps:
+        for obj in meshes:
+            OBJECT_MODE_STEPS[name](obj, **kwargs)
+
+    # Satu kali masuk Edit Mode untuk semua objek
+    if edit_steps:
+        _run_edit_session(meshes, edit_steps)
+
+    print(f"🧩 Batch UV selesai untuk {len(meshes)} objek: {' → '.join(name for name, _ in steps)}")
+    return len(meshes)
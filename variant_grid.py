@@ -0,0 +1,157 @@
+"""
+Variant Grid: sweep Metallic/Roughness dengan satu material bersama
+Setiap objek menyimpan nilai variannya di custom property, lalu node
+Attribute (type INSTANCER) membaca nilai tersebut saat render. Hasilnya
+N x M swatch hanya butuh satu shader compile.
+
+Mode 'POINTS' untuk grid sangat besar: satu point cloud dengan Geometry
+Nodes instancing; nilai varian disimpan sebagai attribute per titik dan
+dibaca node Attribute yang sama (INSTANCER jatuh ke objek sendiri jika
+objek tidak di-instance).
+
+Dapat langsung dijalankan di Blender (Scripting > Run Script) untuk
+membuat sheet 10 x 10 swatch.
+"""
+
+import os
+import sys
+
+import numpy as np
+
+import bpy
+
+# Pastikan modul pendukung di folder ini bisa di-import
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+if SCRIPT_DIR not in sys.path:
+    sys.path.append(SCRIPT_DIR)
+
+import instancing
+import material_cache
+import material_graph
+import mesh_primitives
+import scene_reset
+
+# Custom property per objek yang dibaca oleh material
+METALLIC_PROP = "variant_metallic"
+ROUGHNESS_PROP = "variant_roughness"
+COLOR_PROP = "variant_color"
+
+def variant_spec():
+    """Node graph: Attribute (INSTANCER) -> Principled BSDF, satu untuk semua varian"""
+
+    return {
+        'nodes': {
+            'metallic': {
+                'type': 'ShaderNodeAttribute',
+                'location': (-300, 200),
+                'props': {'attribute_type': 'INSTANCER', 'attribute_name': METALLIC_PROP},
+            },
+            'roughness': {
+                'type': 'ShaderNodeAttribute',
+                'location': (-300, 0),
+                'props': {'attribute_type': 'INSTANCER', 'attribute_name': ROUGHNESS_PROP},
+            },
+            'color': {
+                'type': 'ShaderNodeAttribute',
+                'location': (-300, 400),
+                'props': {'attribute_type': 'INSTANCER', 'attribute_name': COLOR_PROP},
+            },
+            'bsdf': {'type': 'ShaderNodeBsdfPrincipled', 'location': (0, 0)},
+            'output': {'type': 'ShaderNodeOutputMaterial', 'location': (300, 0)},
+        },
+        'links': [
+            ('color', 'Color', 'bsdf', 'Base Color'),
+            ('metallic', 'Fac', 'bsdf', 'Metallic'),
+            ('roughness', 'Fac', 'bsdf', 'Roughness'),
+            ('bsdf', 'BSDF', 'output', 'Surface'),
+        ],
+    }
+
+@material_cache.cached_material
+def create_variant_material(name="Variant_Shared"):
+    """Membuat material bersama yang dikendalikan custom property objek"""
+
+    return material_graph.build_material(variant_spec(), name)
+
+def _set_point_attributes(mesh, metallic, roughness, color):
+    """Attribute varian per titik point cloud (diteruskan ke instance oleh Instance on Points)"""
+
+    for name, values in ((METALLIC_PROP, metallic), (ROUGHNESS_PROP, roughness)):
+        attribute = mesh.attributes.new(name, 'FLOAT', 'POINT')
+        attribute.data.foreach_set("value", np.asarray(values, dtype=np.float32))
+    attribute = mesh.attributes.new(COLOR_PROP, 'FLOAT_COLOR', 'POINT')
+    attribute.data.foreach_set("color", np.tile(np.asarray(color, dtype=np.float32), len(metallic)))
+
+def create_variant_grid(metallic_values, roughness_values, color=(0.8, 0.8, 0.8, 1.0),
+                        spacing=2.5, kind='uv_sphere', collection=None, material=None, mode='LINKED',
+                        **mesh_params):
+    """
+    Membuat grid swatch: baris = metallic, kolom = roughness
+
+    Semua swatch memakai satu mesh dan satu material; nilai varian disimpan
+    di custom property objek (mode 'LINKED') atau attribute per titik
+    (mode 'POINTS'): variant_metallic, variant_roughness, variant_color.
+
+    Parameters:
+    - metallic_values: list nilai Metallic (N baris)
+    - roughness_values: list nilai Roughness (M kolom)
+    - color: base color untuk semua swatch
+    - spacing: jarak antar swatch
+    - kind: jenis primitive swatch (lihat mesh_primitives.GEOMETRY)
+    - collection: collection tujuan (default: collection aktif)
+    - material: material bersama (default: create_variant_material())
+    - mode: 'LINKED' (satu objek per swatch, mesh bersama) atau
+            'POINTS' (satu objek point cloud, untuk ribuan swatch)
+
+    Returns: list objek swatch (mode 'POINTS': list berisi satu point cloud)
+    """
+
+    material = material or create_variant_material()
+    mesh = mesh_primitives.new_mesh(kind, f"Variant_{kind}", **mesh_params)
+    mesh.materials.append(material)
+
+    offset_x = (len(roughness_values) - 1) * spacing / 2
+    offset_y = (len(metallic_values) - 1) * spacing / 2
+
+    if mode == 'POINTS':
+        rows, cols = np.meshgrid(np.arange(len(metallic_values)), np.arange(len(roughness_values)), indexing='ij')
+        points = np.stack([cols.ravel() * spacing - offset_x, rows.ravel() * spacing - offset_y,
+                           np.zeros(rows.size)], axis=1)
+        # Objek sumber tidak di-link ke scene, hanya di-instance
+        source = bpy.data.objects.new(f"Variant_{kind}_Source", mesh)
+        cloud = instancing.create_point_instances(source, points, "Variant_Grid", collection)
+        _set_point_attributes(cloud.data,
+                              np.asarray(metallic_values, dtype=np.float32)[rows.ravel()],
+                              np.asarray(roughness_values, dtype=np.float32)[cols.ravel()], color)
+        swatches = [cloud]
+    elif mode == 'LINKED':
+        swatches = []
+        for row, metallic in enumerate(metallic_values):
+            for col, roughness in enumerate(roughness_values):
+                location = (col * spacing - offset_x, row * spacing - offset_y, 0)
+                obj = mesh_primitives.new_object(f"Swatch_M{row:02d}_R{col:02d}", mesh, location, collection)
+                obj[METALLIC_PROP] = float(metallic)
+                obj[ROUGHNESS_PROP] = float(roughness)
+                obj[COLOR_PROP] = list(color)
+                swatches.append(obj)
+    else:
+        raise ValueError(f"Mode '{mode}' tidak dikenal, pilih 'LINKED' atau 'POINTS'")
+
+    print(f"🎛️ Variant grid {len(metallic_values)}x{len(roughness_values)} dibuat ({mode}) "
+          f"dengan 1 material '{material.name}' dan 1 mesh '{mesh.name}'")
+    return swatches
+
+def main():
+    """Demo: sheet 10 x 10 swatch Metallic x Roughness"""
+
+    print("🎛️ === Variant Grid Demo ===")
+    scene_reset.reset_scene()
+
+    steps = [i / 9 for i in range(10)]
+    swatches = create_variant_grid(steps, steps, color=(1.0, 0.766, 0.336, 1.0))
+
+    print(f"✅ {len(swatches)} swatch, total materials: {len(bpy.data.materials)}")
+    print("💡 Tips: render (Cycles/EEVEE) untuk melihat variasi Metallic/Roughness")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,375 @@
+"""
+Worker Pool: proses Blender background yang tetap hidup untuk banyak job
+Startup Blender (1-3 detik) dibayar sekali per worker, bukan per job.
+Worker meng-import script demo sekali, lalu menerima job JSON per baris
+lewat stdin dan membalas lewat stdout (baris dengan REPLY_MARKER).
+
+Client asyncio (dijalankan dengan Python biasa):
+    async with WorkerPool(size=4) as pool:
+        reply = await pool.run({'type': 'build', 'script': 'slide-05-procedural-demo.py'})
+        reply = await pool.run({'type': 'call', 'script': 'slide-05-procedural-demo.py',
+                                'function': 'create_stone_material', 'args': ['Stone_A']}, timeout=30)
+
+Queue dibatasi (submit menunggu jika penuh = backpressure). Job yang
+di-cancel sebelum jalan dilewati; job yang sedang jalan dihentikan dengan
+me-restart worker-nya (Blender tidak bisa diinterupsi di tengah builder).
+
+Tipe job:
+- ping: cek worker hidup
+- build: jalankan main() script demo
+- call: panggil fungsi script demo dengan args/kwargs
+- render: build lalu render ke 'output' (opsional engine/samples/resolution)
+
+CLI:
+    python worker_pool.py --workers 2 --repeat 3 slide-04-shader-demo.py slide-05-procedural-demo.py
+"""
+
+import argparse
+import asyncio
+import importlib.util
+import itertools
+import json
+import os
+import sys
+import time
+import traceback
+
+try:
+    import bpy
+except ImportError:
+    bpy = None
+
+SCRIPT_PATH = os.path.abspath(__file__)
+SCRIPT_DIR = os.path.dirname(SCRIPT_PATH)
+
+# Penanda baris stdout worker yang berisi balasan JSON
+REPLY_MARKER = "@@WORKER_POOL@@ "
+
+# Script demo yang di-import saat worker start
+DEFAULT_SCRIPTS = ('slide-01-material-demo.py', 'slide-02-texture-demo.py', 'slide-03-uv-mapping-demo.py',
+                   'slide-04-shader-demo.py', 'slide-05-procedural-demo.py')
+
+# Batas panjang satu baris stdout worker (balasan besar tetap satu baris)
+LINE_LIMIT = 1 << 24
+
+# Bagian worker (berjalan di dalam Blender)
+
+def _send(reply):
+    sys.stdout.write(REPLY_MARKER + json.dumps(reply, default=str) + "\n")
+    sys.stdout.flush()
+
+def _load_script(filename, modules):
+    """Import script demo sebagai modul (sekali per worker, main tidak dijalankan)"""
+
+    module = modules.get(filename)
+    if module is None:
+        path = filename if os.path.isabs(filename) else os.path.join(SCRIPT_DIR, filename)
+        name = os.path.splitext(os.path.basename(path))[0].replace('-', '_')
+        spec = importlib.util.spec_from_file_location(name, path)
+        module = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(module)
+        modules[filename] = module
+    return module
+
+def _jsonable(value):
+    """Hasil fungsi builder -> JSON (datablock jadi namanya)"""
+
+    if value is None or isinstance(value, (bool, int, float, str)):
+        return value
+    if isinstance(value, dict):
+        return {str(k): _jsonable(v) for k, v in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_jsonable(v) for v in value]
+    return getattr(value, 'name', repr(value))
+
+def _scene_summary():
+    return {
+        'objects': len(bpy.data.objects),
+        'meshes': len(bpy.data.meshes),
+        'materials': sorted(mat.name for mat in bpy.data.materials if mat.users),
+        'node_groups': len(bpy.data.node_groups),
+    }
+
+def _render(job):
+    scene = bpy.context.scene
+    render = scene.render
+    if job.get('engine'):
+        render.engine = job['engine']
+    if render.engine == 'CYCLES' and job.get('samples'):
+        scene.cycles.samples = job['samples']
+    if job.get('resolution'):
+        render.resolution_x, render.resolution_y = job['resolution']
+        render.resolution_percentage = 100
+    render.filepath = os.path.abspath(job['output'])
+    bpy.ops.render.render(write_still=True)
+    return render.filepath
+
+def handle_job(job, modules):
+    """Jalankan satu job di worker; Returns: hasil JSON-able"""
+
+    kind = job.get('type', 'build')
+    if kind == 'ping':
+        return {'blender': bpy.app.version_string, 'scripts': sorted(modules)}
+
+    module = _load_script(job['script'], modules)
+    if kind == 'build':
+        module.main()
+        return _scene_summary()
+    if kind == 'call':
+        value = getattr(module, job['function'])(*job.get('args', []), **job.get('kwargs', {}))
+        return _jsonable(value)
+    if kind == 'render':
+        module.main()
+        return dict(_scene_summary(), output=_render(job))
+    raise ValueError(f"Tipe job '{kind}' tidak dikenal")
+
+def serve(scripts):
+    """Loop worker: baca job per baris dari stdin sampai EOF atau job 'shutdown'"""
+
+    modules = {}
+    for filename in scripts:
+        _load_script(filename, modules)
+    _send({'ready': True, 'blender': bpy.app.version_string, 'pid': os.getpid()})
+
+    for line in sys.stdin:
+        line = line.strip()
+        if not line:
+            continue
+        job = json.loads(line)
+        if job.get('type') == 'shutdown':
+            break
+
+        started = time.perf_counter()
+        try:
+            reply = {'id': job.get('id'), 'ok': True, 'result': handle_job(job, modules)}
+        except Exception as e:
+            reply = {'id': job.get('id'), 'ok': False, 'error': f"{type(e).__name__}: {e}",
+                     'traceback': traceback.format_exc()[-4000:]}
+        reply['seconds'] = time.perf_counter() - started
+        _send(reply)
+
+# Bagian client (berjalan dengan Python biasa)
+
+class WorkerError(RuntimeError):
+    """Proses worker mati atau tidak bisa dijalankan"""
+
+class JobError(RuntimeError):
+    """Job gagal di dalam worker; balasan lengkap ada di .reply"""
+
+    def __init__(self, reply):
+        super().__init__(reply.get('error', 'job gagal'))
+        self.reply = reply
+
+# Error dari worker.run() yang berarti proses worker tidak bisa dipakai lagi
+WORKER_FAILURES = (WorkerError, ConnectionError, ValueError, asyncio.IncompleteReadError)
+
+class Worker:
+    """Satu proses Blender background yang menjalankan serve()"""
+
+    def __init__(self, blender, scripts, index=0):
+        self.blender = blender
+        self.scripts = list(scripts)
+        self.index = index
+        self.proc = None
+        self.info = None
+
+    def command(self):
+        return [self.blender, '-b', '--factory-startup', '-noaudio', '--python', SCRIPT_PATH,
+                '--', '--serve', *self.scripts]
+
+    async def start(self):
+        self.proc = await asyncio.create_subprocess_exec(
+            *self.command(), stdin=asyncio.subprocess.PIPE, stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.DEVNULL, limit=LINE_LIMIT)
+        self.info = await self._read_reply()
+        return self.info
+
+    async def _read_reply(self):
+        """Baca stdout sampai baris balasan (output print builder dilewati)"""
+
+        while True:
+            line = await self.proc.stdout.readline()
+            if not line:
+                raise WorkerError(f"Worker {self.index} berhenti (exit code {await self.proc.wait()})")
+            text = line.decode('utf-8', 'replace')
+            if text.startswith(REPLY_MARKER):
+                return json.loads(text[len(REPLY_MARKER):])
+
+    async def run(self, job):
+        self.proc.stdin.write((json.dumps(job) + "\n").encode('utf-8'))
+        await self.proc.stdin.drain()
+        while True:
+            reply = await self._read_reply()
+            if reply.get('id') == job.get('id'):
+                return reply
+
+    def kill(self):
+        if self.proc is not None and self.proc.returncode is None:
+            self.proc.kill()
+
+    async def stop(self, timeout=10.0):
+        if self.proc is None or self.proc.returncode is not None:
+            return
+        try:
+            self.proc.stdin.write(b'{"type": "shutdown"}\n')
+            await self.proc.stdin.drain()
+            await asyncio.wait_for(self.proc.wait(), timeout)
+        except (asyncio.TimeoutError, ConnectionError):
+            self.kill()
+            await self.proc.wait()
+
+    async def restart(self):
+        self.kill()
+        if self.proc is not None:
+            await self.proc.wait()
+        await self.start()
+
+class WorkerPool:
+    """
+    Pool N worker Blender dengan queue terbatas
+
+    Parameters:
+    - size: jumlah proses Blender
+    - blender: path executable Blender
+    - scripts: script demo yang di-import saat worker start
+    - max_queue: job menunggu maksimum sebelum submit ikut menunggu (default size x 4)
+    """
+
+    def __init__(self, size=2, blender=None, scripts=DEFAULT_SCRIPTS, max_queue=None):
+        self.size = size
+        self.blender = blender or os.environ.get('BLENDER', 'blender')
+        self.scripts = scripts
+        self.max_queue = max_queue or size * 4
+        self.workers = []
+        self._queue = None
+        self._tasks = []
+        self._ids = itertools.count(1)
+
+    async def start(self):
+        self._queue = asyncio.Queue(maxsize=self.max_queue)
+        self.workers = [Worker(self.blender, self.scripts, i) for i in range(self.size)]
+        await asyncio.gather(*(worker.start() for worker in self.workers))
+        self._tasks = [asyncio.create_task(self._dispatch(worker)) for worker in self.workers]
+        return self
+
+    async def __aenter__(self):
+        return await self.start()
+
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.close()
+
+    async def submit(self, job):
+        """
+        Masukkan job ke queue (menunggu jika queue penuh)
+
+        Returns: future balasan; cancel future untuk membatalkan job
+        """
+
+        job = dict(job, id=next(self._ids))
+        future = asyncio.get_running_loop().create_future()
+        await self._queue.put((job, future))
+        return future
+
+    async def run(self, job, timeout=None):
+        """Submit lalu tunggu balasan (timeout membatalkan job); Returns: dict balasan"""
+
+        future = await self.submit(job)
+        return await asyncio.wait_for(future, timeout)
+
+    async def _dispatch(self, worker):
+        while True:
+            job, future = await self._queue.get()
+            try:
+                if future.done():
+                    continue
+                task = asyncio.create_task(worker.run(job))
+                await asyncio.wait({task, future}, return_when=asyncio.FIRST_COMPLETED)
+
+                if future.done():
+                    # Dibatalkan saat berjalan: hentikan proses, ganti dengan yang baru
+                    task.cancel()
+                    await self._restart(worker)
+                    continue
+
+                try:
+                    reply = task.result()
+                except WORKER_FAILURES as e:
+                    # Pipe putus, proses mati, atau baris balasan rusak/terlalu panjang
+                    error = e if isinstance(e, WorkerError) else WorkerError(
+                        f"Worker {worker.index} gagal: {e or type(e).__name__}")
+                    future.set_exception(error)
+                    await self._restart(worker)
+                    continue
+
+                if reply.get('ok'):
+                    future.set_result(reply)
+                else:
+                    future.set_exception(JobError(reply))
+            finally:
+                self._queue.task_done()
+
+    async def _restart(self, worker):
+        """Ganti proses worker; jika gagal, dispatcher tetap hidup dan job berikutnya mencoba lagi"""
+
+        try:
+            await worker.restart()
+        except (OSError, *WORKER_FAILURES) as e:
+            print(f"⚠️ Worker {worker.index} gagal di-restart: {e or type(e).__name__}")
+
+    async def close(self):
+        """Batalkan job yang masih antre lalu hentikan semua worker"""
+
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+
+        while self._queue is not None and not self._queue.empty():
+            _, future = self._queue.get_nowait()
+            future.cancel()
+
+        await asyncio.gather(*(worker.stop() for worker in self.workers), return_exceptions=True)
+        self.workers = []
+
+async def _run_batch(args):
+    jobs = [{'type': 'build', 'script': script} for _ in range(args.repeat) for script in args.scripts]
+
+    started = time.perf_counter()
+    async with WorkerPool(size=args.workers, blender=args.blender, scripts=args.scripts) as pool:
+        print(f"🔥 {args.workers} worker siap dalam {time.perf_counter() - started:.1f}s")
+
+        async def run_one(job):
+            try:
+                reply = await pool.run(job, timeout=args.timeout)
+            except (JobError, WorkerError, asyncio.TimeoutError) as e:
+                print(f"✗ {job['script']}: {e or type(e).__name__}")
+                return {'job': job, 'ok': False, 'error': str(e) or type(e).__name__}
+            print(f"✓ {job['script']} ({reply['seconds']:.2f}s)")
+            return {'job': job, **reply}
+
+        results = await asyncio.gather(*(run_one(job) for job in jobs))
+
+    print(f"✅ {len(jobs)} job selesai dalam {time.perf_counter() - started:.1f}s")
+    return results
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Jalankan build script demo di pool worker Blender")
+    parser.add_argument('scripts', nargs='+', help="Script demo, misal slide-05-procedural-demo.py")
+    parser.add_argument('--blender', default=os.environ.get('BLENDER', 'blender'), help="Path executable Blender")
+    parser.add_argument('--workers', type=int, default=2, help="Jumlah proses Blender")
+    parser.add_argument('--repeat', type=int, default=1, help="Jumlah build per script")
+    parser.add_argument('--timeout', type=float, default=None, help="Timeout per job (detik)")
+    parser.add_argument('--out', help="Simpan semua balasan ke JSON")
+    args = parser.parse_args(argv)
+
+    results = asyncio.run(_run_batch(args))
+    if args.out:
+        with open(args.out, 'w', encoding='utf-8') as f:
+            json.dump(results, f, indent=2)
+    return 1 if any(not entry['ok'] for entry in results) else 0
+
+if __name__ == "__main__":
+    if bpy is not None and '--serve' in sys.argv:
+        serve(sys.argv[sys.argv.index('--serve') + 1:])
+    else:
+        sys.exit(main())